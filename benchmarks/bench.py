@@ -0,0 +1,459 @@
+"""
+Micro-benchmarks for the CPU hot paths of cff-author-updater.
+
+Each benchmark builds synthetic inputs of a given size, e.g. the number of authors
+or contributions, and times one call of the code under test. Nothing touches the
+network: managers are created without their environment and fed fake data.
+
+    python benchmarks/bench.py run --output benchmarks/results/current.json
+    python benchmarks/bench.py compare benchmarks/results/baseline.json benchmarks/results/current.json
+
+`compare` exits with status 1 if any benchmark got slower than the threshold.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from cff_author_updater.cff_author_review import CffAuthorReview
+from cff_author_updater.cff_file import CffFile
+from cff_author_updater.contributions.github_pull_request_comment_contribution import (
+    GitHubPullRequestCommentContribution,
+)
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+from cff_author_updater.contributors.contributor_registry import ContributorRegistry
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.flags import Flags
+from cff_author_updater.managers.cff_manager import CffManager
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    GitHubPullRequestManager,
+)
+from cff_author_updater.ordered_yaml_loader import dump_yaml
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 5
+# a benchmark regresses when its median time grows by more than this factor
+DEFAULT_THRESHOLD = 1.25
+
+# a benchmark prepares its inputs for a size in a work directory and returns the call to time
+Benchmark = Callable[[int, Path], Callable[[], object]]
+
+
+class FakeOrcidManager:
+    def search_orcid(self, name, email=None, return_url=True) -> list[str]:
+        return []
+
+    def get_orcid_from_social_accounts(self, social_accounts) -> str | None:
+        return None
+
+
+class FakeGitHubManager:
+    def __init__(self):
+        self.orcid_manager = FakeOrcidManager()
+        self.identity_cache = None
+
+    def get_github_user_profile(self, github_username: str) -> dict:
+        return {"name": github_username, "type": "User", "social_accounts": []}
+
+
+def create_github_pull_request_manager() -> GitHubPullRequestManager:
+    # bypass __init__ so that no GitHub environment variables or event file are needed
+    github_pull_request_manager = GitHubPullRequestManager.__new__(GitHubPullRequestManager)
+    github_pull_request_manager.repo = "o/r"
+    github_pull_request_manager.repo_for_compare = "o/r"
+    github_pull_request_manager.pr_number = "1"
+    github_pull_request_manager.github_action_version = "0.0.0"
+    github_pull_request_manager.bot_blacklist = {"github-actions[bot]"}
+    github_pull_request_manager.known_contribution_ids = set()
+    github_pull_request_manager.contributor_registry = ContributorRegistry(
+        github_manager=FakeGitHubManager()  # type: ignore
+    )
+    return github_pull_request_manager
+
+
+def create_cff_authors_data(size: int, duplicate_ratio: float = 0.0) -> list[dict]:
+    rng = random.Random(size)
+    cff_authors_data: list[dict] = []
+    for i in range(size):
+        if cff_authors_data and rng.random() < duplicate_ratio:
+            cff_authors_data.append(dict(rng.choice(cff_authors_data)))
+            continue
+        cff_author_data: dict = {"given-names": f"Given{i}", "family-names": f"Family{i}"}
+        if i % 2:
+            cff_author_data["email"] = f"author{i}@example.com"
+        else:
+            cff_author_data["alias"] = f"https://github.com/author{i}"
+        if i % 5 == 0:
+            cff_author_data["orcid"] = f"https://orcid.org/0000-0000-{i // 10000:04d}-{i % 10000:04d}"
+        cff_authors_data.append(cff_author_data)
+    return cff_authors_data
+
+
+def create_cff(size: int) -> dict:
+    return {
+        "cff-version": "1.2.0",
+        "title": "Example",
+        "message": "Please cite this software.",
+        "type": "software",
+        "authors": create_cff_authors_data(size=size),
+    }
+
+
+def create_contributions(
+    size: int, offset: int = 0
+) -> list[tuple[GitHubPullRequestCommentContribution, GitCommitContributor]]:
+    """
+    Create contributions by about one tenth as many contributors, in random order.
+    Contributions with another offset have other ids, but the same contributors.
+    """
+    rng = random.Random(size + offset)
+    contributors = [
+        GitCommitContributor.from_dict(
+            {"git_name": f"Given{i} Family{i}", "git_email": f"author{i}@example.com", "orcid": None, "orcid_name": None, "id": str(i)}
+        )
+        for i in range(max(1, size // 10))
+    ]
+    start = datetime(2024, 1, 1)
+    return [
+        (
+            GitHubPullRequestCommentContribution(
+                id=f"https://github.com/o/r/pull/1#issuecomment-{offset + i}",
+                created_at=start + timedelta(seconds=rng.randrange(size * 10)),
+            ),
+            rng.choice(contributors),
+        )
+        for i in range(size)
+    ]
+
+
+def create_contribution_manager(size: int, offset: int = 0) -> ContributionManager:
+    contribution_manager = ContributionManager()
+    for contribution, contributor in create_contributions(size=size, offset=offset):
+        contribution_manager.add_contribution(contribution, contributor)
+    return contribution_manager
+
+
+def write_cff(size: int, work_dir: Path) -> Path:
+    cff_path = work_dir / "CITATION.cff"
+    cff_path.write_text(dump_yaml(create_cff(size=size)), encoding="utf-8")
+    return cff_path
+
+
+def bench_contribution_manager_add_contribution(size: int, work_dir: Path):
+    contributions = create_contributions(size=size)
+
+    def run():
+        contribution_manager = ContributionManager()
+        for contribution, contributor in contributions:
+            contribution_manager.add_contribution(contribution, contributor)
+        return contribution_manager.contributors_sorted_by_first_contribution
+
+    return run
+
+
+def bench_columnar_contribution_manager_add_contribution(size: int, work_dir: Path):
+    contributions = create_contributions(size=size)
+
+    def run():
+        contribution_manager = ColumnarContributionManager()
+        for contribution, contributor in contributions:
+            contribution_manager.add_contribution(contribution, contributor)
+        # the rows are sorted and grouped by contributor on the first query
+        return contribution_manager.contributors_sorted_by_first_contribution
+
+    return run
+
+
+def bench_contribution_manager_merge(size: int, work_dir: Path):
+    contribution_manager = create_contribution_manager(size=size)
+    # new contributions by the same contributors, as when merging another pull request
+    other_contribution_manager = create_contribution_manager(size=size, offset=size)
+
+    def run():
+        contribution_manager.merge(other_contribution_manager)
+
+    return run
+
+
+def bench_cff_author_contributor_is_same_author(size: int, work_dir: Path):
+    cff_authors = [
+        CffAuthorContributor(cff_author_data=cff_author_data)
+        for cff_author_data in create_cff_authors_data(size=size)
+    ]
+    new_cff_author = CffAuthorContributor(
+        cff_author_data={"given-names": "Jane", "family-names": "Doe", "email": "jane@example.com"}
+    )
+
+    def run():
+        # a new author is compared with every author before it is added
+        return any(new_cff_author.is_same_author(cff_author) for cff_author in cff_authors)
+
+    return run
+
+
+def bench_cff_manager_validate_old_cff_authors_are_unique(size: int, work_dir: Path):
+    cff = {"authors": create_cff_authors_data(size=size, duplicate_ratio=0.05)}
+    cff_manager = CffManager.__new__(CffManager)
+
+    def run():
+        return cff_manager.validate_old_cff_authors_are_unique(cff=cff)
+
+    return run
+
+
+def bench_github_pull_request_manager_add_commit_contributions(size: int, work_dir: Path):
+    rng = random.Random(size)
+    co_author_count = max(1, size // 10)
+    commits = [
+        {
+            "sha": f"{i:040x}",
+            "message": "Fix a bug\n\nA longer description of the fix.\n\n"
+            + "\n".join(
+                f"Co-authored-by: Given{j} Family{j} <author{j}@example.com>"
+                for j in rng.sample(range(co_author_count), k=min(3, co_author_count))
+            ),
+        }
+        for i in range(size)
+    ]
+    commit_date = datetime(2024, 1, 1)
+
+    def run():
+        github_pull_request_manager = create_github_pull_request_manager()
+        contribution_manager = ContributionManager()
+        for commit in commits:
+            github_pull_request_manager._add_commit_contributions(
+                contribution_manager=contribution_manager,
+                sha=commit["sha"],
+                commit_date=commit_date,
+                github_username=None,
+                git_name="Jane Doe",
+                git_email="jane@example.com",
+                message=commit["message"],
+            )
+        return contribution_manager
+
+    return run
+
+
+def bench_github_pull_request_manager_scan_pr_comments_for_skip_commands(size: int, work_dir: Path):
+    rng = random.Random(size)
+    commands = (
+        "skip-authorship-by-orcid https://orcid.org/0000-0000-0000-{i:04d}",
+        "unskip-authorship-by-name Given{i} Family{i}",
+        "skip-authorship-by-email author{i}@example.com",
+        "skip-authorship-by-github-username author{i}",
+    )
+    start = datetime(2024, 1, 1)
+    comments = [
+        {
+            "created_at": (start + timedelta(minutes=rng.randrange(size * 10))).isoformat(),
+            "body": "Thanks for the pull request!\n\n"
+            + (rng.choice(commands).format(i=i % 10000) if i % 4 == 0 else "Looks good to me."),
+        }
+        for i in range(size)
+    ]
+    github_pull_request_manager = create_github_pull_request_manager()
+    github_pull_request_manager.get_github_paginated = lambda url, params=None: comments  # type: ignore
+
+    def run():
+        return github_pull_request_manager.scan_pr_comments_for_skip_commands()
+
+    return run
+
+
+def bench_cff_author_review_get_review(size: int, work_dir: Path):
+    contribution_manager = create_contribution_manager(size=size)
+    start = datetime(2024, 1, 1)
+    for i, contributor in enumerate(contribution_manager.contributors):
+        contribution_manager.add_contribution(
+            GitHubPullRequestCommitContribution(sha=f"{i:040x}", created_at=start), contributor
+        )
+    cff_path = write_cff(size=size, work_dir=work_dir)
+    cff_file = CffFile(cff_path=cff_path, validate=False)
+    cff_file.cff["authors"].append({"given-names": "Jane", "family-names": "Doe"})
+    cff_author_review = CffAuthorReview(
+        cff_file=cff_file,
+        github_pull_request_manager=create_github_pull_request_manager(),
+        contribution_manager=contribution_manager,
+        contributors_skipped_for_authorship=set(),
+        missing_authors=set(contribution_manager.contributors[::2]),
+        missing_author_invalidates_pr=True,
+        duplicate_authors=set(),
+        duplicate_author_invalidates_pr=True,
+        cffconvert_validation_errors=[],
+    )
+
+    def run():
+        return cff_author_review.get_review()
+
+    return run
+
+
+def bench_cff_file_load(size: int, work_dir: Path):
+    cff_path = write_cff(size=size, work_dir=work_dir)
+
+    def run():
+        return CffFile(cff_path=cff_path, validate=True)
+
+    return run
+
+
+def bench_cff_file_save(size: int, work_dir: Path):
+    cff_file = CffFile(cff_path=write_cff(size=size, work_dir=work_dir), validate=False)
+
+    def run():
+        cff_file.cff["authors"].append({"given-names": "Jane", "family-names": "Doe"})
+        return cff_file.save()
+
+    return run
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "ContributionManager.add_contribution": bench_contribution_manager_add_contribution,
+    "ContributionManager.merge": bench_contribution_manager_merge,
+    "ColumnarContributionManager.add_contribution": bench_columnar_contribution_manager_add_contribution,
+    "CffAuthorContributor.is_same_author": bench_cff_author_contributor_is_same_author,
+    "CffManager.validate_old_cff_authors_are_unique": bench_cff_manager_validate_old_cff_authors_are_unique,
+    "GitHubPullRequestManager._add_commit_contributions": bench_github_pull_request_manager_add_commit_contributions,
+    "GitHubPullRequestManager.scan_pr_comments_for_skip_commands": bench_github_pull_request_manager_scan_pr_comments_for_skip_commands,
+    "CffAuthorReview.get_review": bench_cff_author_review_get_review,
+    "CffFile.load": bench_cff_file_load,
+    "CffFile.save": bench_cff_file_save,
+}
+
+
+def time_benchmark(benchmark: Benchmark, size: int, repeat: int) -> list[float]:
+    """
+    Time a benchmark `repeat` times, with fresh inputs for each run so that runs that
+    change their inputs are timed alike.
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="cff-author-updater-bench-") as work_dir:
+            run = benchmark(size, Path(work_dir))
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(names: list[str], sizes: list[int], repeat: int) -> dict:
+    results: list[dict] = []
+    for name in names:
+        for size in sizes:
+            timings = time_benchmark(benchmark=BENCHMARKS[name], size=size, repeat=repeat)
+            result = {
+                "benchmark": name,
+                "size": size,
+                "repeat": repeat,
+                "min_seconds": min(timings),
+                "median_seconds": statistics.median(timings),
+            }
+            results.append(result)
+            print(f"{name} [{size}]: {result['median_seconds'] * 1000:.3f} ms", file=sys.stderr)
+    return {
+        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> tuple[list[dict], list[dict]]:
+    """
+    Compare the median times of the benchmarks that are in both results.
+    Returns all comparisons and the regressions, i.e. the benchmarks whose median
+    time grew by more than the threshold factor.
+    """
+    baseline_results: dict[tuple[str, int], dict] = {
+        (result["benchmark"], result["size"]): result for result in baseline["results"]
+    }
+    comparisons: list[dict] = []
+    for result in current["results"]:
+        baseline_result = baseline_results.get((result["benchmark"], result["size"]))
+        if baseline_result is None:
+            continue
+        comparisons.append(
+            {
+                "benchmark": result["benchmark"],
+                "size": result["size"],
+                "baseline_seconds": baseline_result["median_seconds"],
+                "current_seconds": result["median_seconds"],
+                "ratio": result["median_seconds"] / max(baseline_result["median_seconds"], 1e-9),
+            }
+        )
+    regressions = [comparison for comparison in comparisons if comparison["ratio"] > threshold]
+    return comparisons, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the CPU hot paths of cff-author-updater.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and write the results as JSON.")
+    run_parser.add_argument("--output", type=Path, help="Where to write the results. Defaults to stdout.")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument(
+        "--benchmark",
+        dest="names",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only this benchmark. Can be given more than once.",
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare results with a baseline.")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        # the code under test logs every duplicate and skipped author
+        logging.disable(logging.CRITICAL)
+        Flags.flags["incremental_collection"] = False
+        results = run_benchmarks(
+            names=args.names or list(BENCHMARKS), sizes=args.sizes, repeat=args.repeat
+        )
+        text = json.dumps(results, indent=2)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(text + "\n", encoding="utf-8")
+        else:
+            print(text)
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    comparisons, regressions = compare_results(
+        baseline=baseline, current=current, threshold=args.threshold
+    )
+    for comparison in comparisons:
+        marker = "  REGRESSION" if comparison in regressions else ""
+        print(
+            f"{comparison['benchmark']} [{comparison['size']}]: "
+            f"{comparison['baseline_seconds'] * 1000:.3f} ms -> {comparison['current_seconds'] * 1000:.3f} ms "
+            f"({comparison['ratio']:.2f}x){marker}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
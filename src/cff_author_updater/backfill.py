@@ -0,0 +1,327 @@
+import json
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from cff_author_updater.cff_author_index import CffAuthorIndex
+from cff_author_updater.cff_file import CffFile, CffFileValidationError
+from cff_author_updater.collection import collect_contributions
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+from cff_author_updater.flags import Flags
+from cff_author_updater.managers.cff_manager import CffManager
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_manager import (
+    GitHubManager,
+    parse_github_datetime,
+)
+from cff_author_updater.managers.github_pull_request_manager import (
+    GitHubPullRequestManager,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKFILL_MAX_WORKERS = 4
+
+
+def create_pull_request_event(pull_request: dict) -> dict:
+    """
+    Create the `pull_request` event that a workflow run for the pull request would have
+    received. The head repository of a pull request from a deleted fork is null, so the
+    base repository stands in for it.
+    """
+    head: dict = pull_request["head"]
+    if head.get("repo") is None:
+        head = {**head, "repo": pull_request["base"]["repo"]}
+    return {
+        "number": pull_request["number"],
+        "pull_request": {**pull_request, "head": head},
+    }
+
+
+def is_pull_request_in_range(
+    pull_request: dict,
+    since: date | None = None,
+    until: date | None = None,
+    from_number: int | None = None,
+    to_number: int | None = None,
+) -> bool:
+    """
+    Return whether a pull request was merged within the inclusive date and number ranges.
+    """
+    merged_at: str | None = pull_request.get("merged_at")
+    if not merged_at:
+        return False
+    number: int = pull_request["number"]
+    if from_number is not None and number < from_number:
+        return False
+    if to_number is not None and number > to_number:
+        return False
+    merged_on: date = parse_github_datetime(merged_at).date()
+    if since is not None and merged_on < since:
+        return False
+    if until is not None and merged_on > until:
+        return False
+    return True
+
+
+def list_merged_pull_requests(
+    github_manager: GitHubManager,
+    repo: str,
+    since: date | None = None,
+    until: date | None = None,
+    from_number: int | None = None,
+    to_number: int | None = None,
+) -> list[dict]:
+    """
+    List the merged pull requests of the repository within the ranges, oldest first.
+
+    Pull requests are listed in the order in which they were created, which is also
+    the order of their numbers, so the listing stops at the first pull request that
+    was created after both ranges.
+    """
+    merged_pull_requests: list[dict] = []
+    for pull_request in github_manager.iter_github_paginated(
+        url=f"https://api.github.com/repos/{repo}/pulls",
+        params={"state": "closed", "sort": "created", "direction": "asc"},
+    ):
+        if to_number is not None and pull_request["number"] > to_number:
+            break
+        if until is not None and parse_github_datetime(pull_request.get("created_at")).date() > until:
+            break
+        if is_pull_request_in_range(
+            pull_request=pull_request,
+            since=since,
+            until=until,
+            from_number=from_number,
+            to_number=to_number,
+        ):
+            merged_pull_requests.append(pull_request)
+    return merged_pull_requests
+
+
+def create_pull_request_managers(
+    github_manager: GitHubManager,
+    repo: str,
+    pull_requests: list[dict],
+) -> list[GitHubPullRequestManager]:
+    """
+    Create a GitHub pull request manager for each pull request of a repository. The
+    managers share the HTTP client, rate limiter, enrichment caches, and contributor
+    registry of the GitHub manager, or of the first pull request manager if the GitHub
+    manager is not a pull request manager.
+    """
+    github_pull_request_managers: list[GitHubPullRequestManager] = []
+    for pull_request in pull_requests:
+        shared_github_manager: GitHubManager = (
+            github_manager
+            if isinstance(github_manager, GitHubPullRequestManager) or not github_pull_request_managers
+            else github_pull_request_managers[0]
+        )
+        github_pull_request_managers.append(
+            GitHubPullRequestManager(
+                event=create_pull_request_event(pull_request=pull_request),
+                shared_github_manager=shared_github_manager,
+                repo=repo,
+            )
+        )
+    return github_pull_request_managers
+
+
+def collect_authorship_contributions(
+    github_pull_request_manager: GitHubPullRequestManager,
+    cff_path: Path,
+) -> ContributionManager:
+    """
+    Collect the contributions of a pull request, leaving out the contributors that the
+    skip commands in its comments skip for authorship, as the action would have done
+    for that pull request.
+    """
+    contribution_manager = collect_contributions(github_pull_request_manager)
+    if not Flags.has("can_skip_authorship"):
+        return contribution_manager
+    skip_commands: dict[str, set[str]] = github_pull_request_manager.scan_pr_comments_for_skip_commands()
+    if not any(skip_commands.values()):
+        return contribution_manager
+
+    cff_manager = CffManager(cff_path=cff_path, github_pull_request_manager=github_pull_request_manager)
+    authorship_contribution_manager = ContributionManager()
+    for contributor in contribution_manager.contributors:
+        if github_pull_request_manager.should_skip_contributor_for_authorship(contributor, skip_commands):
+            continue
+        # the skip commands can also name the ORCID, email, or name of the enriched author
+        cff_author: CffAuthorContributor | None = cff_manager.create_cff_author_contributor(
+            contributor=contributor,
+            contribution_manager=contribution_manager,
+        )
+        if cff_author is not None and github_pull_request_manager.should_skip_contributor_for_authorship(
+            contributor=cff_author, skip_commands=skip_commands
+        ):
+            continue
+        for contribution in contribution_manager.get_contributions_for(contributor):
+            authorship_contribution_manager.add_contribution(contribution, contributor)
+
+    logger.info(
+        f"{github_pull_request_manager.repo}#{github_pull_request_manager.pr_number}: Skipped {len(contribution_manager) - len(authorship_contribution_manager)} contributor(s) for authorship based on skip commands."
+    )
+    return authorship_contribution_manager
+
+
+def collect_pull_request_contributions(
+    github_pull_request_managers: list[GitHubPullRequestManager],
+    cff_path: Path,
+    max_workers: int = DEFAULT_BACKFILL_MAX_WORKERS,
+) -> dict[str, ColumnarContributionManager]:
+    """
+    Run the collectors for many pull requests at once in a thread pool, and merge their
+    contributions by repository in the order of the pull requests. The contributors that
+    a pull request skips for authorship are left out of its contributions.
+    """
+    contribution_managers: dict[str, ColumnarContributionManager] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for github_pull_request_manager, collected_contribution_manager in zip(
+            github_pull_request_managers,
+            executor.map(
+                lambda github_pull_request_manager: collect_authorship_contributions(
+                    github_pull_request_manager=github_pull_request_manager, cff_path=cff_path
+                ),
+                github_pull_request_managers,
+            ),
+        ):
+            logger.info(
+                f"{github_pull_request_manager.repo}#{github_pull_request_manager.pr_number}: {len(collected_contribution_manager)} contributor(s)."
+            )
+            contribution_managers.setdefault(
+                github_pull_request_manager.repo, ColumnarContributionManager()
+            ).merge(collected_contribution_manager)
+    return contribution_managers
+
+
+def create_cff_authors(
+    cff_manager: CffManager,
+    contribution_manager: ColumnarContributionManager,
+) -> list[CffAuthorContributor]:
+    """
+    Create the CFF authors of the contributors in the order of their first contribution,
+    leaving out the contributors that cannot become CFF authors.
+    """
+    cff_authors: list[CffAuthorContributor] = []
+    for contributor in contribution_manager.contributors_sorted_by_first_contribution:
+        cff_author: CffAuthorContributor | None = cff_manager.create_cff_author_contributor(
+            contributor=contributor,
+            contribution_manager=contribution_manager,  # type: ignore
+        )
+        if cff_author is not None:
+            cff_authors.append(cff_author)
+    return cff_authors
+
+
+def append_missing_cff_authors(
+    cff_file: CffFile,
+    cff_authors: list[CffAuthorContributor],
+) -> list[CffAuthorContributor]:
+    """
+    Append the CFF authors that are not yet authors to the CFF, and return them.
+    """
+    cff: dict = cff_file.cff
+    cff.setdefault("authors", [])
+    cff_author_index = CffAuthorIndex.from_cff_authors_data(cff_authors_data=cff["authors"])
+
+    new_cff_authors: list[CffAuthorContributor] = []
+    for cff_author in cff_authors:
+        if cff_author_index.has_same_author(cff_author=cff_author):
+            continue
+        cff["authors"].append(cff_author.cff_author_data)
+        cff_author_index.add(cff_author)
+        new_cff_authors.append(cff_author)
+    return new_cff_authors
+
+
+def run_backfill(
+    cff_path: Path,
+    report_path: Path,
+    suggested_cff_path: Path,
+    since: date | None = None,
+    until: date | None = None,
+    from_number: int | None = None,
+    to_number: int | None = None,
+    max_workers: int = DEFAULT_BACKFILL_MAX_WORKERS,
+) -> bool:
+    """
+    Audit the merged pull requests of the repository within the ranges, and write an
+    aggregated contributor report and a CFF file with the missing authors.
+    Returns whether the suggested CFF file is valid.
+    """
+    github_manager = GitHubManager(event={})
+    pull_requests: list[dict] = list_merged_pull_requests(
+        github_manager=github_manager,
+        repo=github_manager.repo,
+        since=since,
+        until=until,
+        from_number=from_number,
+        to_number=to_number,
+    )
+    logger.info(f"Backfilling {len(pull_requests)} merged pull request(s) of {github_manager.repo}.")
+    if not pull_requests:
+        return True
+
+    github_pull_request_managers = create_pull_request_managers(
+        github_manager=github_manager,
+        repo=github_manager.repo,
+        pull_requests=pull_requests,
+    )
+    contribution_manager = collect_pull_request_contributions(
+        github_pull_request_managers=github_pull_request_managers,
+        cff_path=cff_path,
+        max_workers=max_workers,
+    )[github_manager.repo]
+
+    # the suggested CFF starts as a copy of the CFF file, so that its formatting is kept
+    shutil.copyfile(cff_path, suggested_cff_path)
+    cff_file = CffFile(cff_path=suggested_cff_path, validate=False)
+    cff_manager = CffManager(
+        cff_path=suggested_cff_path,
+        github_pull_request_manager=github_pull_request_managers[0],
+    )
+    new_cff_authors = append_missing_cff_authors(
+        cff_file=cff_file,
+        cff_authors=create_cff_authors(
+            cff_manager=cff_manager, contribution_manager=contribution_manager
+        ),
+    )
+
+    is_valid_cff: bool = True
+    try:
+        cff_file.save()
+    except CffFileValidationError as e:
+        is_valid_cff = False
+        logger.error(
+            f"The suggested CFF is not valid CFF, so the missing authors were not added to `{suggested_cff_path}`.\n"
+            + "\n".join(e.cffconvert_validation_errors)
+        )
+
+    report: dict = {
+        "repo": github_manager.repo,
+        "pull_requests": [pull_request["number"] for pull_request in pull_requests],
+        "new_authors": [new_cff_author.cff_author_data for new_cff_author in new_cff_authors],
+        "contributors": contribution_manager.to_dict(),
+    }
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info(
+        f"Found {len(contribution_manager)} contributor(s) and {len(new_cff_authors)} missing author(s) in {len(pull_requests)} pull request(s). "
+        f"Wrote the report to `{report_path}` and the suggested CFF to `{suggested_cff_path}`."
+    )
+    logger.info(
+        f"GitHub rate limit budget consumed by this run: {github_manager.rate_limiter.get_summary()}."
+    )
+    contributor_registry = github_pull_request_managers[0].contributor_registry
+    logger.debug(
+        f"Contributor registry: {contributor_registry.misses} distinct contributor(s) resolved, {contributor_registry.hits} repeated lookup(s) reused."
+    )
+    return is_valid_cff
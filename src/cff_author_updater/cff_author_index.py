@@ -0,0 +1,102 @@
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+
+# the matching keys in the order in which CffAuthorContributor.is_same_author compares them
+MATCHING_KEY_NAMES = ("orcid", "alias", "email", "full_name")
+
+
+class CffAuthorIndex:
+    """
+    An index of CFF authors by their normalized ORCID, GitHub alias, email, and full name.
+
+    It answers the same question as comparing an author with
+    CffAuthorContributor.is_same_author against every indexed author, but with one
+    dict lookup per key instead of one comparison per author. Authors are added
+    incrementally, so authors appended during an update are found by later lookups.
+    """
+
+    def __init__(self, cff_authors: list[CffAuthorContributor] | None = None):
+        self.cff_authors: list[CffAuthorContributor] = []
+        self._positions_by_key: tuple[dict[str, list[int]], ...] = tuple(
+            {} for _ in MATCHING_KEY_NAMES
+        )
+        # is_same_author raises for these authors unless an earlier key matched
+        self._positions_without_full_name: list[int] = []
+        for cff_author in cff_authors or []:
+            self.add(cff_author)
+
+    @classmethod
+    def from_cff_authors_data(cls, cff_authors_data: list[dict]) -> "CffAuthorIndex":
+        return cls(
+            cff_authors=[
+                CffAuthorContributor(cff_author_data=cff_author_data)
+                for cff_author_data in cff_authors_data
+            ]
+        )
+
+    def add(self, cff_author: CffAuthorContributor) -> int:
+        """
+        Index an author and return its position.
+        """
+        position: int = len(self.cff_authors)
+        self.cff_authors.append(cff_author)
+        for positions_by_key, key in zip(self._positions_by_key, cff_author.matching_keys):
+            if key:
+                positions_by_key.setdefault(key, []).append(position)
+        if not cff_author.matching_keys[-1]:
+            self._positions_without_full_name.append(position)
+        return position
+
+    def _find(self, cff_author: CffAuthorContributor) -> tuple[set[int], int | None]:
+        """
+        Return the positions of the same authors, and the first position for which
+        is_same_author would raise because one of the authors lacks a full name.
+        """
+        positions: set[int] = set()
+        *identifier_keys, full_name = cff_author.matching_keys
+        for positions_by_key, key in zip(self._positions_by_key, identifier_keys):
+            if key:
+                positions.update(positions_by_key.get(key, ()))
+
+        first_invalid_position: int | None
+        if not full_name:
+            first_invalid_position = next(
+                (position for position in range(len(self.cff_authors)) if position not in positions),
+                None,
+            )
+        else:
+            first_invalid_position = next(
+                (position for position in self._positions_without_full_name if position not in positions),
+                None,
+            )
+            positions.update(self._positions_by_key[-1].get(full_name, ()))
+        return positions, first_invalid_position
+
+    def find_same_authors(self, cff_author: CffAuthorContributor) -> list[int]:
+        """
+        Return the positions of all indexed authors that are the same author, in order.
+        Raises ValueError if is_same_author would raise for any of the indexed authors.
+        """
+        positions, first_invalid_position = self._find(cff_author=cff_author)
+        if first_invalid_position is not None:
+            raise ValueError(
+                "Cannot compare a CFF author that lacks an ORCID, email, alias, and name."
+            )
+        return sorted(positions)
+
+    def has_same_author(self, cff_author: CffAuthorContributor) -> bool:
+        """
+        Return whether any indexed author is the same author. Like comparing the
+        authors in order, it raises ValueError only if an author that cannot be
+        compared comes before the first match.
+        """
+        positions, first_invalid_position = self._find(cff_author=cff_author)
+        if first_invalid_position is not None and first_invalid_position < min(
+            positions, default=len(self.cff_authors)
+        ):
+            raise ValueError(
+                "Cannot compare a CFF author that lacks an ORCID, email, alias, and name."
+            )
+        return len(positions) > 0
+
+    def __len__(self) -> int:
+        return len(self.cff_authors)
@@ -3,7 +3,6 @@ import os
 from datetime import datetime, timezone
 
 import regex
-import yaml
 
 from cff_author_updater.cff_file import CffFile
 from cff_author_updater.contributions.github_pull_request_commit_contribution import (
@@ -16,6 +15,7 @@ from cff_author_updater.flags import Flags
 from cff_author_updater.logging_config import get_log_collector
 from cff_author_updater.managers.contribution_manager import ContributionManager
 from cff_author_updater.managers.github_pull_request_manager import (
+    PR_COMMENT_MARKER,
     GitHubPullRequestManager,
 )
 
@@ -61,15 +61,16 @@ class CffAuthorReview:
     def get_review(self) -> str:
 
         cff_path = self.cff_file.cff_path
-        cff = self.cff_file.cff
-        original_cff = self.cff_file.original_cff
 
         log_collector = get_log_collector()
         error_logs = log_collector.get_error_logs(is_unique=True)
         warning_logs = log_collector.get_warning_logs(is_unique=True)
         info_logs = log_collector.get_info_logs(is_unique=True)
 
-        marker: str = "<!-- cff-author-updater-pr-comment -->"
+        marker: str = PR_COMMENT_MARKER
+        incremental_state: str = self.github_pull_request_manager.create_incremental_state(
+            contribution_manager=self.contribution_manager
+        )
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
 
         commit_sha = os.environ.get("GITHUB_SHA", "")
@@ -159,7 +160,7 @@ class CffAuthorReview:
             body_contributions += "\n**No contributions.**\n"
 
         body = f"""
-{marker}
+{marker}{incremental_state}
 ### CFF Author Updater ###
 
 {body_pr_validation_status}
@@ -170,7 +171,7 @@ class CffAuthorReview:
             body += f"""
 **Recommended `{cff_path}` file (updated with missing authors):**
 ```yaml
-{yaml.dump(cff, sort_keys=False)}
+{self.cff_file.get_cff_yaml()}
 ```
 """
             body += (
@@ -193,7 +194,7 @@ class CffAuthorReview:
                 body += f"The pull request will remain invalid until no duplicate authors exist in the `{cff_path}` file."
             body += f"""
 ```yaml
-{yaml.dump(original_cff, sort_keys=False)}
+{self.cff_file.get_original_cff_yaml()}
 ```
 """
 
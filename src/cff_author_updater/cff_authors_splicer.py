@@ -0,0 +1,115 @@
+import logging
+
+import regex
+import yaml
+
+from cff_author_updater.ordered_yaml_loader import OrderedYamlLoader, dump_yaml
+
+logger = logging.getLogger(__name__)
+
+# the line of a block sequence item up to its first key, e.g. `  - ` in `  - given-names: Jane`
+SEQUENCE_ITEM_PREFIX_REGEX = regex.compile(r"^(?P<indent> *)- +$")
+
+COLLECTION_START_EVENTS = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+COLLECTION_END_EVENTS = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+NODE_EVENTS = (yaml.ScalarEvent, yaml.AliasEvent, *COLLECTION_START_EVENTS)
+
+
+def find_cff_authors_span(cff_text: str) -> tuple[int, int] | None:
+    """
+    Find where the top-level `authors` block sequence of a CFF text can be extended.
+
+    Returns the column of the dash of the first author and the index after the last
+    author, or None if `authors` is missing, empty, or not a block sequence of block
+    mappings. The text is only parsed up to the end of `authors`.
+    """
+    # the flow style of each open collection
+    open_collections: list[bool] = []
+    is_top_level_key: bool = True
+    is_authors_value: bool = False
+    authors_depth: int | None = None
+    dash_column: int | None = None
+    last_end_index: int = 0
+
+    for event in yaml.parse(cff_text, Loader=OrderedYamlLoader):
+        if isinstance(event, COLLECTION_END_EVENTS):
+            is_flow_style: bool = open_collections.pop()
+            if authors_depth is not None:
+                if len(open_collections) < authors_depth:
+                    # the end of `authors`
+                    break
+                if is_flow_style:
+                    last_end_index = max(last_end_index, event.end_mark.index)
+            continue
+
+        if not isinstance(event, NODE_EVENTS):
+            continue
+
+        if authors_depth is not None:
+            if len(open_collections) == authors_depth:
+                # the start of an author
+                if not isinstance(event, yaml.MappingStartEvent) or event.flow_style:
+                    return None
+                if dash_column is None:
+                    line_start_index: int = cff_text.rfind("\n", 0, event.start_mark.index) + 1
+                    match = SEQUENCE_ITEM_PREFIX_REGEX.match(
+                        cff_text[line_start_index : event.start_mark.index]
+                    )
+                    if not match:
+                        return None
+                    dash_column = len(match.group("indent"))
+            if not isinstance(event, COLLECTION_START_EVENTS):
+                last_end_index = max(last_end_index, event.end_mark.index)
+        elif not open_collections:
+            # the document itself must be a block mapping
+            if not isinstance(event, yaml.MappingStartEvent) or event.flow_style:
+                return None
+        elif len(open_collections) == 1:
+            if is_top_level_key:
+                is_authors_value = isinstance(event, yaml.ScalarEvent) and event.value == "authors"
+            elif is_authors_value:
+                if not isinstance(event, yaml.SequenceStartEvent) or event.flow_style:
+                    return None
+                authors_depth = len(open_collections) + 1
+            is_top_level_key = not is_top_level_key
+
+        if isinstance(event, COLLECTION_START_EVENTS):
+            open_collections.append(bool(event.flow_style))
+
+    if dash_column is None:
+        return None
+    return dash_column, last_end_index
+
+
+def splice_cff_authors(cff_text: str, new_authors: list[dict]) -> str | None:
+    """
+    Append authors to the `authors` sequence of a CFF text without re-serializing the rest
+    of the file, so that comments, anchors, and formatting are kept.
+
+    Returns None if the `authors` sequence cannot be extended in place, in which case
+    the whole CFF must be serialized instead.
+    """
+    try:
+        authors_span = find_cff_authors_span(cff_text)
+    except yaml.YAMLError as e:
+        logger.debug(f"Cannot find the authors in the CFF text: {e}")
+        return None
+    if authors_span is None:
+        return None
+    dash_column, last_end_index = authors_span
+
+    # insert after the line of the last author, which keeps its trailing comment
+    if last_end_index > 0 and cff_text[last_end_index - 1] == "\n":
+        insert_index = last_end_index
+    else:
+        line_end_index: int = cff_text.find("\n", last_end_index)
+        insert_index = len(cff_text) if line_end_index == -1 else line_end_index + 1
+
+    newline: str = "\r\n" if "\r\n" in cff_text else "\n"
+    indent: str = " " * dash_column
+    new_authors_text: str = "".join(
+        f"{indent}{line}{newline}" for line in dump_yaml(new_authors).splitlines()
+    )
+    if insert_index == len(cff_text) and cff_text and not cff_text.endswith("\n"):
+        new_authors_text = newline + new_authors_text
+    return cff_text[:insert_index] + new_authors_text + cff_text[insert_index:]
@@ -1,9 +1,14 @@
+import os
+import stat
+import tempfile
 from copy import deepcopy
 from pathlib import Path
 
 import yaml
 
-from cff_author_updater.ordered_yaml_loader import OrderedYamlLoader
+from cff_author_updater.cff_authors_splicer import splice_cff_authors
+from cff_author_updater.cff_validator import validate_cff
+from cff_author_updater.ordered_yaml_loader import OrderedYamlLoader, dump_yaml
 
 
 class CffFileValidationError(ValueError):
@@ -38,9 +43,16 @@ class CffFile:
 
         # create a dictionary from the CFF file
         with open(self.cff_path, "r") as f:
-            self.original_cff = yaml.load(f, Loader=OrderedYamlLoader)
+            original_cff_text: str = f.read()
+        self.original_cff = yaml.load(original_cff_text, Loader=OrderedYamlLoader)
 
         self.cff = deepcopy(self.original_cff)
+        # the contents and text of the CFF file, to skip saving an unchanged dictionary
+        # and to append new authors to the text; the original is never modified
+        self.saved_cff = self.original_cff
+        self.saved_cff_text: str = original_cff_text
+        # each YAML text is serialized once and reused by every consumer
+        self._original_cff_yaml: str | None = None
 
         if validate:
             # make sure the CFF file is valid
@@ -54,55 +66,101 @@ class CffFile:
                     message=error_message, validation_errors=validation_errors
                 )
 
-    def save(self):
+    def save(self) -> bool:
+        """
+        Write the CFF dictionary to the CFF file if it differs from the file's contents.
 
-        # save to a temp file first to make sure it works
-        import tempfile
-
-        is_valid_cff: bool = False
-        with tempfile.NamedTemporaryFile(mode="w+", delete=True) as temp_file:
-            yaml.dump(self.cff, temp_file, sort_keys=False)
-            is_valid_cff, validation_errors = self.validate(
-                cff_path=Path(temp_file.name)
-            )
-
-        if not is_valid_cff:
-            error_message = (
-                f"Invalid CFF dictionary before saving {self.cff}\n"
-                + "\n".join(f"[cffconvert] {error}" for error in validation_errors)
-            )
-            raise CffFileValidationError(
-                message=error_message, validation_errors=validation_errors
-            )
-
-        # now save to the original CFF file
-        with open(self.cff_path, "w") as f:
-            yaml.dump(self.cff, f, sort_keys=False)
+        The dictionary is validated and serialized once, then written to a temp file in
+        the same directory that replaces the CFF file atomically, so the CFF file is
+        never left half-written. If only authors were appended, they are spliced into the
+        text of the file, which keeps its comments and formatting. Returns whether the
+        file was written.
+        """
+        if self.cff == self.saved_cff:
+            return False
 
         is_valid_cff, validation_errors = self.validate()
         if not is_valid_cff:
             error_message = (
-                f"Invalid CFF dictionary after saving {self.cff}\n"
+                f"Invalid CFF dictionary before saving {self.cff}\n"
                 + "\n".join(f"[cffconvert] {error}" for error in validation_errors)
             )
             raise CffFileValidationError(
                 message=error_message, validation_errors=validation_errors
             )
 
-    def validate(self, cff_path: Path | None = None) -> tuple[bool, list[str]]:
-        if cff_path is None:
-            cff_path = self.cff_path
-
-        import subprocess
-
+        cff_text: str = self._get_cff_text_to_save()
+        file_mode: int = stat.S_IMODE(os.stat(self.cff_path).st_mode)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=self.cff_path.parent,
+            prefix=f".{self.cff_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_path = Path(temp_file.name)
+            try:
+                temp_file.write(cff_text)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            except BaseException:
+                temp_file.close()
+                temp_path.unlink(missing_ok=True)
+                raise
         try:
-            subprocess.run(
-                ["cffconvert", "--validate", "--infile", cff_path],
-                check=True,
-                capture_output=True,
-                text=True,
+            os.chmod(temp_path, file_mode)
+            os.replace(temp_path, self.cff_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        self.saved_cff = deepcopy(self.cff)
+        self.saved_cff_text = cff_text
+        return True
+
+    def _get_cff_text_to_save(self) -> str:
+        saved_authors = self.saved_cff.get("authors")
+        authors = self.cff.get("authors")
+        if (
+            isinstance(saved_authors, list)
+            and isinstance(authors, list)
+            and len(authors) > len(saved_authors)
+            and list(self.cff) == list(self.saved_cff)
+            and all(
+                value == self.saved_cff[key]
+                for key, value in self.cff.items()
+                if key != "authors"
+            )
+            and authors[: len(saved_authors)] == saved_authors
+        ):
+            cff_text: str | None = splice_cff_authors(
+                cff_text=self.saved_cff_text,
+                new_authors=authors[len(saved_authors) :],
             )
-            return True, []
-        except subprocess.CalledProcessError as e:
-            stderr_output = [e.stderr] if e.stderr else []
-            return False, stderr_output
+            if cff_text is not None:
+                return cff_text
+        return dump_yaml(self.cff)
+
+    def get_original_cff_yaml(self) -> str:
+        if self._original_cff_yaml is None:
+            self._original_cff_yaml = dump_yaml(self.original_cff)
+        return self._original_cff_yaml
+
+    def get_cff_yaml(self) -> str:
+        """
+        Return the YAML of the CFF dictionary, reusing the text that was loaded or saved
+        if the dictionary has not changed since.
+        """
+        if self.cff == self.original_cff:
+            return self.get_original_cff_yaml()
+        if self.cff == self.saved_cff:
+            return self.saved_cff_text
+        return dump_yaml(self.cff)
+
+    def validate(self, cff: dict | None = None) -> tuple[bool, list[str]]:
+        """
+        Validate the CFF dictionary in-process with the schema that cffconvert uses.
+        """
+        if cff is None:
+            cff = self.cff
+        return validate_cff(cff=cff)
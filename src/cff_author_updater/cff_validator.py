@@ -0,0 +1,100 @@
+import contextlib
+import functools
+import io
+import json
+import logging
+from datetime import date, datetime
+from pathlib import Path
+
+import jsonschema
+from cffconvert.citation import Citation
+from cffconvert.root import get_package_root
+
+from cff_author_updater.ordered_yaml_loader import dump_yaml
+
+# cffconvert validates older CFF versions with pykwalify, which logs its errors and
+# raises them joined into one message with this prefix
+PYKWALIFY_LOGGER_NAME = "pykwalify.core"
+PYKWALIFY_ERRORS_PREFIX = "Schema validation failed:\n - "
+PYKWALIFY_ERRORS_SEPARATOR = ".\n - "
+
+
+@functools.cache
+def get_cff_schema_validator(cff_version: str) -> jsonschema.Draft7Validator | None:
+    """
+    Return a validator for the JSON schema that cffconvert ships for the CFF version.
+    The schema is loaded once per process. Returns None if cffconvert validates the
+    version with a YAML schema instead.
+    """
+    schema_path = Path(get_package_root()) / "schemas" / cff_version / "schema.json"
+    if not schema_path.exists():
+        return None
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema: dict = json.load(f)
+    validator_class = jsonschema.validators.validator_for(schema)
+    return validator_class(schema, format_checker=jsonschema.FormatChecker())
+
+
+def convert_timestamps_to_strings(value):
+    """
+    cffconvert reads YAML timestamps, e.g. `date-released: 2024-01-01`, as strings,
+    so dates are validated as the strings that would be written to the CFF file.
+    """
+    if isinstance(value, dict):
+        return {key: convert_timestamps_to_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [convert_timestamps_to_strings(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def validate_cff(cff: dict) -> tuple[bool, list[str]]:
+    """
+    Validate a CFF dictionary in-process with the schema that `cffconvert --validate` uses.
+
+    Returns whether the CFF is valid and the validation errors. Errors have the same
+    text as the errors that cffconvert reports, e.g. "Failed validating 'uniqueItems'
+    in schema['properties']['authors']" for duplicate authors.
+    """
+    if not isinstance(cff, dict):
+        return False, ["Provided CITATION.cff does not seem valid YAML."]
+
+    cff_version: str = str(cff.get("cff-version", ""))
+    if cff_version not in Citation.supported_cff_versions:
+        return False, [f'Unrecognized value for key "cff-version": `{cff_version}`.']
+
+    validator = get_cff_schema_validator(cff_version=cff_version)
+    if validator is None:
+        # older CFF versions use a YAML schema, so let cffconvert validate them
+        return validate_cff_with_yaml_schema(cff=cff)
+
+    validation_errors: list[str] = [
+        str(error) for error in validator.iter_errors(convert_timestamps_to_strings(cff))
+    ]
+    return len(validation_errors) == 0, validation_errors
+
+
+def validate_cff_with_yaml_schema(cff: dict) -> tuple[bool, list[str]]:
+    """
+    Validate a CFF dictionary with cffconvert, whose output is suppressed, and return
+    one error per failed rule like the JSON schema validation does.
+    """
+    pykwalify_logger = logging.getLogger(PYKWALIFY_LOGGER_NAME)
+    was_disabled: bool = pykwalify_logger.disabled
+    pykwalify_logger.disabled = True
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            Citation(dump_yaml(cff)).validate()
+    except Exception as e:
+        message: str = str(getattr(e, "msg", ""))
+        if message.startswith(PYKWALIFY_ERRORS_PREFIX):
+            return False, message[len(PYKWALIFY_ERRORS_PREFIX) :].removesuffix(".").split(
+                PYKWALIFY_ERRORS_SEPARATOR
+            )
+        return False, [f"{type(e).__name__}: {e}"]
+    finally:
+        pykwalify_logger.disabled = was_disabled
+    return True, []
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from cff_author_updater.flags import Flags
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    GitHubPullRequestManager,
+)
+
+
+def collect_contributions(
+    github_pull_request_manager: GitHubPullRequestManager,
+) -> ContributionManager:
+    """
+    Run every enabled contribution collector and merge their results.
+
+    When the `concurrent_collection` flag is set, the collectors run in a thread pool
+    so that their HTTP round trips overlap. The results are always merged in the same
+    fixed order, so the merged ContributionManager matches a sequential run exactly.
+
+    With the `graphql` collection backend, all enabled kinds of contributions are
+    fetched together by a single paginated GraphQL query instead.
+
+    When the `incremental_collection` flag is set, the contributions of the previous run
+    are carried over and only new contributions are collected and enriched.
+    """
+    contribution_manager = ContributionManager()
+    if Flags.has("incremental_collection"):
+        previous_contribution_manager: ContributionManager | None = (
+            github_pull_request_manager.load_incremental_state()
+        )
+        if previous_contribution_manager is not None:
+            contribution_manager.merge(previous_contribution_manager)
+
+    if github_pull_request_manager.collection_backend == "graphql":
+        contribution_manager.merge(
+            github_pull_request_manager.collect_contributors_for_pr_graphql()
+        )
+        return contribution_manager
+
+    collectors: list[tuple[str, Callable[[], ContributionManager]]] = [
+        (
+            "authorship_for_pr_commits",
+            github_pull_request_manager.collect_contributors_for_pr_commits,
+        ),
+        (
+            "authorship_for_pr_reviews",
+            github_pull_request_manager.collect_contributors_for_pr_reviews,
+        ),
+        (
+            "authorship_for_pr_issues",
+            github_pull_request_manager.collect_contributors_for_pr_issues,
+        ),
+        (
+            "authorship_for_pr_issue_comments",
+            github_pull_request_manager.collect_contributors_for_pr_issue_comments,
+        ),
+        (
+            "authorship_for_pr_comments",
+            github_pull_request_manager.collect_contributors_for_pr_comments,
+        ),
+    ]
+    enabled_collectors = [collect for flag, collect in collectors if Flags.has(flag)]
+
+    if Flags.has("concurrent_collection") and len(enabled_collectors) > 1:
+        with ThreadPoolExecutor(max_workers=len(enabled_collectors)) as executor:
+            futures = [executor.submit(collect) for collect in enabled_collectors]
+            collected_contribution_managers = [future.result() for future in futures]
+    else:
+        collected_contribution_managers = [collect() for collect in enabled_collectors]
+
+    for collected_contribution_manager in collected_contribution_managers:
+        contribution_manager.merge(collected_contribution_manager)
+    return contribution_manager
@@ -2,9 +2,43 @@ from datetime import datetime
 
 
 class Contribution:
+    """
+    Contributions are equal if they have the same type and id, e.g. the same commit
+    of a co-authored commit, which makes them cheap to deduplicate in sets and dicts.
+    """
+
+    __slots__ = ("id", "created_at", "_hash")
+
     def __init__(self, id: str, created_at: datetime):
         self.id = id
         self.created_at: datetime = created_at
+        self._hash: int = hash((type(self), id))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return type(other) is type(self) and self._hash == other._hash and self.id == other.id
+
+    def __getstate__(self) -> dict:
+        # hashes differ between processes, so the cached hash is not pickled
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name != "_hash"
+        }
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = hash((type(self), self.id))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Contribution":
+        return cls(id=data["id"], created_at=datetime.fromisoformat(data["created_at"]))
 
     def to_dict(self) -> dict:
         return {
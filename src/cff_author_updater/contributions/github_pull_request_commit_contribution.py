@@ -4,10 +4,16 @@ from cff_author_updater.contributions.contribution import Contribution
 
 class GitHubPullRequestCommitContribution(Contribution):
 
+    __slots__ = ("sha",)
+
     def __init__(self, sha: str, created_at: datetime):
         super().__init__(id=sha, created_at=created_at)
         self.sha = sha
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "GitHubPullRequestCommitContribution":
+        return cls(sha=data["sha"], created_at=datetime.fromisoformat(data["created_at"]))
+
     def to_dict(self) -> dict:
         data = super().to_dict()
         data["sha"] = self.sha
@@ -2,4 +2,4 @@ from cff_author_updater.contributions.contribution import Contribution
 
 
 class GitHubPullRequestIssueContribution(Contribution):
-    pass
+    __slots__ = ()
@@ -5,6 +5,8 @@ from cff_author_updater.contributions.contribution import Contribution
 
 class UnknownContribution(Contribution):
 
+    __slots__ = ()
+
     def __init__(
         self,
         id: str,
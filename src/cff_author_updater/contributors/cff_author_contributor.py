@@ -9,6 +9,8 @@ from cff_author_updater.contributors.github_contributor import (
 
 class CffAuthorContributor(Contributor):
 
+    __slots__ = ("id", "cff_author_data", "author_type", "matching_keys")
+
     def __init__(self, cff_author_data: dict):
         super().__init__()
 
@@ -21,6 +23,7 @@ class CffAuthorContributor(Contributor):
         self.id = self._get_id_from_cff_author_data(
             cff_author_data=self.cff_author_data
         )
+        self.matching_keys: tuple[str, str, str, str] = self._get_matching_keys()
 
     def to_dict(self) -> dict:
         """
@@ -59,14 +62,34 @@ class CffAuthorContributor(Contributor):
         else:
             raise ValueError(f"Invalid CFF author data {cff_author_data}")
 
-    def is_same_author(self, cff_author: CffAuthorContributor):
-        a: dict = self.cff_author_data
-        b: dict = cff_author.cff_author_data
+    def _get_normalized_field(self, field: str) -> str:
+        # case-insensitive and surrounding whitespace insensitive
+        return str(self.cff_author_data.get(field) or "").casefold().strip()
 
-        a_type: str = self.author_type
-        b_type: str = cff_author.author_type
+    def _get_matching_keys(self) -> tuple[str, str, str, str]:
+        """
+        Return the normalized ORCID, GitHub alias, email, and full name that identify the author.
+        The alias is only used if it is a GitHub user profile URL. The full name is
+        'given-names' + ' ' + 'family-names' for persons, and 'name' for entities.
+        """
+        alias: str = self._get_normalized_field("alias")
+        if not is_github_user_profile_url(url=alias):
+            alias = ""
 
-        if a_type == "unknown" or b_type == "unknown":
+        if self.author_type == "person":
+            full_name: str = f"{self._get_normalized_field('given-names')} {self._get_normalized_field('family-names')}".strip()
+        else:
+            full_name: str = self._get_normalized_field("name")
+
+        return (
+            self._get_normalized_field("orcid"),
+            alias,
+            self._get_normalized_field("email"),
+            full_name,
+        )
+
+    def is_same_author(self, cff_author: CffAuthorContributor):
+        if self.author_type == "unknown" or cff_author.author_type == "unknown":
             raise ValueError("Cannot compare unknown author types.")
 
         # Match in the following order (case-insensitive and surrounding whitespace insensitive):
@@ -74,50 +97,21 @@ class CffAuthorContributor(Contributor):
         # 2. alias (only using GitHub user profile URL)
         # 3. email
         # 4. full name (using given-names + ' ' + family-names if type person, or 'name' that has at least two parts if type is entity)
+        a_orcid, a_alias, a_email, a_fullname = self.matching_keys
+        b_orcid, b_alias, b_email, b_fullname = cff_author.matching_keys
 
-        # match orcid
-        a_orcid = a.get("orcid", "").casefold().strip()
-        b_orcid = b.get("orcid", "").casefold().strip()
         if a_orcid and a_orcid == b_orcid:
             return True
 
-        # else match on alias if and only if it's a GitHub user profile URL
-        a_alias = a.get("alias", "").casefold().strip()
-        b_alias = b.get("alias", "").casefold().strip()
-        a_is_github_user = is_github_user_profile_url(url=a_alias)
-        if a_alias and b_alias and a_is_github_user and a_alias == b_alias:
+        if a_alias and a_alias == b_alias:
             return True
 
-        # else, match on email
-        a_email = a.get("email", "").casefold().strip()
-        b_email = b.get("email", "").casefold().strip()
         if a_email and a_email == b_email:
             return True
 
-        # else match on full name
-        # for persons, full name is 'given-names' + ' ' + 'family-names'
-        # for entities, full name is 'name'
-
-        if a_type == "person":
-            a_fullname: str = (
-                f"{a.get('given-names', '').casefold().strip()} {a.get('family-names', '').casefold().strip()}".strip()
-            )
-        else:
-            a_fullname: str = a.get("name", "").casefold().strip()
-
-        if b_type == "person":
-            b_fullname: str = (
-                f"{b.get('given-names', '').casefold().strip()} {b.get('family-names', '').casefold().strip()}".strip()
-            )
-        else:
-            b_fullname: str = b.get("name", "").casefold().strip()
-
         if not a_fullname or not b_fullname:
             raise ValueError(
                 "Cannot compare a CFF author that lacks an ORCID, email, alias, and name."
             )
 
-        if a_fullname == b_fullname:
-            return True
-        else:
-            return False
+        return a_fullname == b_fullname
@@ -1,15 +1,63 @@
+from collections.abc import Hashable
+
+
 class Contributor:
+    """
+    Contributors are compared by an identity key that is computed once, the first time
+    the contributor is hashed or compared, and cached together with its hash. A
+    contributor must therefore not change after it has been added to a set or dict.
+    """
+
+    __slots__ = ("_identity_key", "_hash")
+
+    def __init__(self):
+        self._identity_key: Hashable | None = None
+        self._hash: int | None = None
 
     def to_dict(self) -> dict:
         return {}
 
+    def get_identity_key(self) -> Hashable:
+        """
+        Return the key that identifies this contributor. Subclasses override it with
+        the fields that identify them; by default it is the string of its to_dict().
+        """
+        return str(self.to_dict())
+
+    @property
+    def identity_key(self) -> Hashable:
+        if self._identity_key is None:
+            self._identity_key = self.get_identity_key()
+        return self._identity_key
+
     def __hash__(self):
         """
-        Return a hash based on its to_dict().
+        Return a hash based on its identity key.
         This allows it to be used in sets and as dictionary keys.
         """
-        return hash(str(self.to_dict()))
+        if self._hash is None:
+            self._hash = hash(self.identity_key)
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        return (
+            type(other) is type(self)
+            and hash(self) == hash(other)
+            and self.identity_key == other.identity_key
+        )
+
+    def __getstate__(self) -> dict:
+        # hashes differ between processes, so the cached hash is not pickled
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name != "_hash" and hasattr(self, name)
+        }
 
-        return type(other) is type(self) and str(self.to_dict()) == str(other.to_dict())
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = None
@@ -0,0 +1,51 @@
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.contributors.github_contributor import GitHubContributor
+from cff_author_updater.managers.github_manager import GitHubManager
+from cff_author_updater.request_memo import RequestMemo
+
+
+class ContributorRegistry:
+    """
+    A run-scoped registry that creates each contributor once per identity.
+
+    Creating a contributor fetches its profile and resolves its ORCID, so the
+    collectors ask the registry for a contributor instead of constructing one for
+    every commit, review, or comment. All contributions of the same GitHub user or
+    git name and email then share one instance. The registry is safe to use from the
+    concurrent collectors: a contributor that is being created is waited for, not
+    created twice.
+    """
+
+    def __init__(self, github_manager: GitHubManager):
+        self.github_manager = github_manager
+        self._contributors = RequestMemo()
+
+    def get_github_contributor(self, github_username: str) -> GitHubContributor:
+        github_username = github_username.strip()
+        return self._contributors.get(
+            key=("github", github_username),
+            fetch=lambda: GitHubContributor(
+                github_username=github_username, github_manager=self.github_manager
+            ),
+        )
+
+    def get_git_commit_contributor(self, git_name: str, git_email: str) -> GitCommitContributor:
+        git_name = git_name.strip()
+        git_email = git_email.strip()
+        return self._contributors.get(
+            key=("git", git_name, git_email),
+            fetch=lambda: GitCommitContributor(
+                git_name=git_name,
+                git_email=git_email,
+                orcid_manager=self.github_manager.orcid_manager,
+                identity_cache=self.github_manager.identity_cache,
+            ),
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._contributors.hits
+
+    @property
+    def misses(self) -> int:
+        return self._contributors.misses
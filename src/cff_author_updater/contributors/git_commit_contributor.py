@@ -1,13 +1,22 @@
 import logging
 
 from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.identity_cache import IdentityCache
 from cff_author_updater.managers.orcid_manager import OrcidManager
 
 logger = logging.getLogger(__name__)
 
 class GitCommitContributor(Contributor):
 
-    def __init__(self, git_name: str, git_email: str, orcid_manager: OrcidManager):
+    __slots__ = ("id", "git_name", "git_email", "orcid", "orcid_name")
+
+    def __init__(
+        self,
+        git_name: str,
+        git_email: str,
+        orcid_manager: OrcidManager,
+        identity_cache: IdentityCache | None = None,
+    ):
         super().__init__()
         self.git_name: str = git_name
         self.git_email: str = git_email
@@ -15,12 +24,26 @@ class GitCommitContributor(Contributor):
         self.orcid: str | None = None
         self.orcid_name: str | None = None
 
+        if self.git_email and identity_cache is not None:
+            cached_identity: dict | None = identity_cache.get(kind="email", key=self.git_email)
+            if cached_identity is not None:
+                self.orcid = cached_identity.get("orcid")
+                self.orcid_name = cached_identity.get("orcid_name")
+                return
+
         if self.git_email:
             # do not include the git name in the id when searching for the ORCID. Only search by email since they may have another name.
             orcids: list[str] = orcid_manager.search_orcid(name=None, email=self.git_email, return_url=True)
             
             if not orcids:
                 logger.info(f"`{self.git_email}`: No ORCID found.")
+                if identity_cache is not None:
+                    identity_cache.set(
+                        kind="email",
+                        key=self.git_email,
+                        value={"orcid": None, "orcid_name": None},
+                        is_negative=True,
+                    )
             elif orcid_manager.validate_orcid(orcids[0], is_url=True):
                 self.orcid = orcids[0]
                 orcid_names, credit_name, combined_credit_name, other_names = orcid_manager.get_names_from_orcid(orcid=self.orcid)
@@ -36,12 +59,32 @@ class GitCommitContributor(Contributor):
                             )
                     else:
                         logger.info(f"`{self.git_email}`: Added name `{self.orcid_name}` from ORCID `{self.orcid}`.")    
-                    
+                if identity_cache is not None:
+                    identity_cache.set(
+                        kind="email",
+                        key=self.git_email,
+                        value={"orcid": self.orcid, "orcid_name": self.orcid_name},
+                    )
+
             else:
                 logger.warning(
                     f"`{self.git_name}`: ORCID `{orcids[0]}` is invalid or unreachable."
                 )
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "GitCommitContributor":
+        """
+        Restore a Git Commit Contributor from its to_dict() representation without searching ORCID.
+        """
+        contributor = cls.__new__(cls)
+        Contributor.__init__(contributor)
+        for field, value in data.items():
+            setattr(contributor, field, value)
+        return contributor
+
+    def get_identity_key(self) -> tuple:
+        return ("git", self.git_name, self.git_email)
+
     def to_dict(self) -> dict:
         """
         Convert the Git Commit Contributor to a serializable dictionary representation.
@@ -3,6 +3,7 @@ import logging
 import regex  # Unicode-aware regex module
 
 from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.identity_cache import IdentityCache
 from cff_author_updater.managers.github_manager import GitHubManager
 from cff_author_updater.managers.orcid_manager import OrcidManager
 
@@ -14,6 +15,16 @@ GITHUB_USER_PROFILE_URL_REGEX = regex.compile(
     flags=regex.IGNORECASE | regex.UNICODE
 )
 
+# commits made through the GitHub web UI, or by users with a private email, use a noreply address
+GITHUB_NOREPLY_EMAIL_REGEX = regex.compile(
+    r"^(?:\d+\+)?(?P<username>[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})@users\.noreply\.github\.com$",
+    flags=regex.IGNORECASE | regex.UNICODE
+)
+
+def parse_github_username_from_github_noreply_email(email: str) -> str | None:
+    match = GITHUB_NOREPLY_EMAIL_REGEX.match(email.strip())
+    return match.group("username") if match else None
+
 def is_github_user_profile_url(url: str) -> bool:
     return GITHUB_USER_PROFILE_URL_REGEX.match(url) is not None
 
@@ -30,8 +41,33 @@ def create_github_user_profile_url(github_username: str) -> str:
 
 logger = logging.getLogger(__name__)
 
+# the resolved fields that are stored in the identity cache
+CACHED_IDENTITY_FIELDS = (
+    "github_name",
+    "github_bio",
+    "github_blog",
+    "github_email",
+    "github_is_organization",
+    "orcid",
+    "orcid_name",
+)
+
 class GitHubContributor(Contributor):
 
+    __slots__ = (
+        "id",
+        "github_username",
+        "github_user_profile_url",
+        "github_name",
+        "github_bio",
+        "github_blog",
+        "github_email",
+        "github_is_organization",
+        "orcid",
+        "orcid_name",
+        "is_valid_github_user",
+    )
+
     def __init__(
         self,
         github_username: str,
@@ -47,6 +83,8 @@ class GitHubContributor(Contributor):
         self.github_blog: str | None = None
         self.github_email: str | None = None
         self.github_is_organization: bool = False
+        # None when the profile did not say which social accounts are linked
+        github_social_accounts: list[str] | None = None
         self.orcid: str | None = None
         self.orcid_name: str | None = None
 
@@ -57,6 +95,16 @@ class GitHubContributor(Contributor):
             self.is_valid_github_user = False
             return
 
+        identity_cache: IdentityCache | None = github_manager.identity_cache
+        if identity_cache is not None:
+            cached_identity: dict | None = github_manager.get_cached_github_identity(
+                github_username=self.github_username
+            )
+            if cached_identity is not None:
+                for field in CACHED_IDENTITY_FIELDS:
+                    setattr(self, field, cached_identity.get(field))
+                return
+
         # Fetch profile data via GitHubManager
         user_profile_data: dict | None = github_manager.get_github_user_profile(self.github_username)
         if not user_profile_data:
@@ -82,12 +130,22 @@ class GitHubContributor(Contributor):
             # Store organization flag
             self.github_is_organization = user_profile_data.get("type", "User") == "Organization"
 
+            github_social_accounts = user_profile_data.get("social_accounts")
+
         # Assign ORCID in priority order:
         orcid_manager: OrcidManager = github_manager.orcid_manager
 
         if not self.orcid and self.github_username:
-            # 1. Badge from profile
-            linked_orcid: str | None = orcid_manager.scrape_orcid_from_github_profile(github_username=self.github_username)
+            # 1. Badge from profile: an ORCID social account or website, which are both in the profile
+            # vcard, so the vcard is only scraped if neither links an ORCID. The vcard also shows the
+            # ORCID iD linked through GitHub's ORCID integration, which is not a social account.
+            linked_orcid: str | None = None
+            if github_social_accounts is not None:
+                linked_orcid = orcid_manager.get_orcid_from_social_accounts(github_social_accounts)
+                if not linked_orcid and self.github_blog:
+                    linked_orcid = orcid_manager.extract_orcid(self.github_blog, find_url=True, return_url=True)
+            if not linked_orcid:
+                linked_orcid = orcid_manager.scrape_orcid_from_github_profile(github_username=self.github_username)
             if linked_orcid:
                 self.orcid = linked_orcid
 
@@ -112,9 +170,12 @@ class GitHubContributor(Contributor):
             if orcids:
                 self.orcid = orcids[0]
         
+        # an unreachable ORCID may be a network failure, so it is not cached
+        is_resolved: bool = self.is_valid_github_user
         if not self.orcid:
             logger.info(f"@{self.github_username}: No ORCID found.")
         elif not orcid_manager.validate_orcid(orcid=self.orcid):
+            is_resolved = False
             logger.warning(
                 f"@{self.github_username}: ORCID `{self.orcid}` is invalid or unreachable."
             )
@@ -133,9 +194,30 @@ class GitHubContributor(Contributor):
                             )
                     else:
                         logger.info(f"`{self.github_email}`: Added name `{self.orcid_name}` from ORCID `{self.orcid}`.")    
-                
-                
 
+        if identity_cache is not None and is_resolved:
+            identity_cache.set(
+                kind="github",
+                key=self.github_username,
+                value={field: getattr(self, field) for field in CACHED_IDENTITY_FIELDS},
+                is_negative=not self.orcid,
+            )
+
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GitHubContributor":
+        """
+        Restore a GitHubContributor from its to_dict() representation without fetching anything.
+        """
+        contributor = cls.__new__(cls)
+        Contributor.__init__(contributor)
+        for field, value in data.items():
+            setattr(contributor, field, value)
+        return contributor
+
+    def get_identity_key(self) -> tuple:
+        return ("github", self.github_username)
 
     def to_dict(self) -> dict:
         """
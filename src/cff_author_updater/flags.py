@@ -48,6 +48,14 @@ class Flags:
             "CAN_SKIP_AUTHORSHIP", "true"
         ).casefold()
         == "true",
+        "concurrent_collection": os.environ.get(
+            "CONCURRENT_COLLECTION", "false"
+        ).casefold()
+        == "true",
+        "incremental_collection": os.environ.get(
+            "INCREMENTAL_COLLECTION", "false"
+        ).casefold()
+        == "true",
     }
 
     @classmethod
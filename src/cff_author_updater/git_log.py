@@ -0,0 +1,97 @@
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+# fields are separated by the ASCII unit separator and commits by NUL (`git log -z`)
+GIT_LOG_FIELD_SEPARATOR = "\x1f"
+GIT_LOG_FORMAT = "%H%x1f%an%x1f%ae%x1f%aI%x1f%B"
+GIT_LOG_READ_CHUNK_SIZE = 64 * 1024
+
+
+class GitLogError(Exception):
+    pass
+
+
+def run_git(args: list[str], cwd: Path | None = None) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+        )
+    except OSError as e:
+        raise GitLogError(f"Cannot run git: {e}")
+    if completed.returncode != 0:
+        raise GitLogError(
+            f"`git {' '.join(args)}` failed: {completed.stderr.strip()}"
+        )
+    return completed.stdout
+
+
+def parse_git_log_record(record: bytes) -> dict:
+    sha, name, email, date, message = record.decode("utf-8", errors="replace").split(
+        GIT_LOG_FIELD_SEPARATOR, 4
+    )
+    return {
+        "sha": sha.strip(),
+        "name": name,
+        "email": email,
+        "date": date,
+        "message": message,
+    }
+
+
+def iter_git_log_commits(
+    base_sha: str, head_sha: str, cwd: Path | None = None
+) -> Iterator[dict]:
+    """
+    Stream the commits in `base_sha..head_sha` of a local checkout, oldest first.
+
+    Each commit is a dict with its `sha`, author `name`, `email`, and `date`, and its
+    full `message`. The output of `git log` is parsed while it is read, so thousands of
+    commits never need to be held as one string.
+
+    Raises GitLogError if git is unavailable, the clone is shallow, or either commit
+    is missing, since the log would then be incomplete.
+    """
+    if run_git(["rev-parse", "--is-shallow-repository"], cwd=cwd).strip() == "true":
+        raise GitLogError(
+            "The repository is a shallow clone. Check it out with `fetch-depth: 0`."
+        )
+    for sha in (base_sha, head_sha):
+        run_git(["rev-parse", "--verify", "--quiet", f"{sha}^{{commit}}"], cwd=cwd)
+
+    # stderr goes to a file instead of a pipe, which would block git once it is full
+    # because it is only read after stdout
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            [
+                "git",
+                "log",
+                "-z",
+                "--reverse",
+                f"--format={GIT_LOG_FORMAT}",
+                f"{base_sha}..{head_sha}",
+            ],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        )
+        assert process.stdout is not None
+
+        try:
+            buffer = b""
+            for chunk in iter(lambda: process.stdout.read(GIT_LOG_READ_CHUNK_SIZE), b""):  # type: ignore
+                buffer += chunk
+                *records, buffer = buffer.split(b"\0")
+                for record in records:
+                    yield parse_git_log_record(record)
+            if buffer:
+                yield parse_git_log_record(buffer)
+        finally:
+            process.stdout.close()
+            returncode: int = process.wait()
+            stderr_file.seek(0)
+            stderr: str = stderr_file.read().decode("utf-8", errors="replace")
+
+    if returncode != 0:
+        raise GitLogError(f"`git log {base_sha}..{head_sha}` failed: {stderr.strip()}")
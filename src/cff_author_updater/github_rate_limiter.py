@@ -0,0 +1,185 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT = 900.0
+# start pacing requests once less than this fraction of a budget is left
+DEFAULT_RESERVE_RATIO = 0.1
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_MIN_WAIT = 60.0
+
+
+class GitHubRateLimitError(Exception):
+    pass
+
+
+class RateLimitBudget:
+    """
+    The known state of one GitHub rate limit resource (e.g. `core` or `graphql`).
+
+    `remaining` is decremented locally for every request that is sent, so that concurrent
+    requests pace each other, while `reported_remaining` is only taken from GitHub and is
+    used to account for the points the run consumed.
+    """
+
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reported_remaining: int | None = None
+        self.reset_at: float | None = None
+        self.requests: int = 0
+        self.used: int = 0
+        self.graphql_cost: int = 0
+
+    def update(self, limit: int | None, remaining: int, reset_at: float | None):
+        if limit is not None:
+            self.limit = limit
+
+        if self.reported_remaining is None:
+            # the first response only tells us about its own request
+            self.used += 1
+        elif reset_at is not None and reset_at != self.reset_at:
+            # the budget was reset since the last response
+            self.used += max((self.limit or remaining) - remaining, 0)
+        else:
+            self.used += max(self.reported_remaining - remaining, 0)
+
+        self.remaining = remaining
+        self.reported_remaining = remaining
+        self.reset_at = reset_at
+
+
+class GitHubRateLimiter:
+    """
+    Paces GitHub requests according to the REST and GraphQL rate limit budgets.
+
+    Budgets are read from the `X-RateLimit-*` headers of every response, and the cost of
+    GraphQL queries from their `rateLimit { cost }` field. Once a budget runs low, the
+    remaining requests are spread over the time until it resets instead of failing,
+    and secondary rate limits are honoured with `Retry-After` or a backoff.
+    """
+
+    def __init__(
+        self,
+        max_wait: float | None = None,
+        reserve_ratio: float = DEFAULT_RESERVE_RATIO,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_wait is None:
+            max_wait = float(
+                os.environ.get("GITHUB_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT)
+            )
+        self.max_wait = max_wait
+        self.reserve_ratio = reserve_ratio
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._blocked_until: float = 0.0
+        self._secondary_rate_limit_count: int = 0
+        self.budgets: dict[str, RateLimitBudget] = {}
+
+    def _get_budget(self, resource: str) -> RateLimitBudget:
+        if resource not in self.budgets:
+            self.budgets[resource] = RateLimitBudget(resource=resource)
+        return self.budgets[resource]
+
+    def before_request(self, resource: str):
+        """
+        Block until a request for the resource may be sent.
+        """
+        with self._lock:
+            now = self._clock()
+            delay = self._blocked_until - now
+            budget = self._get_budget(resource)
+            budget.requests += 1
+
+            if budget.remaining is not None and budget.reset_at is not None:
+                time_until_reset = budget.reset_at - now
+                if time_until_reset > 0:
+                    if budget.remaining <= 0:
+                        delay = max(delay, time_until_reset)
+                    elif (
+                        budget.limit
+                        and budget.remaining < budget.limit * self.reserve_ratio
+                    ):
+                        delay = max(delay, time_until_reset / budget.remaining)
+                # count this request right away, so concurrent callers pace each other
+                budget.remaining -= 1
+
+        if delay > self.max_wait:
+            raise GitHubRateLimitError(
+                f"GitHub `{resource}` rate limit is exhausted for another {delay:.0f} seconds, which is longer than the maximum wait of {self.max_wait:.0f} seconds."
+            )
+        if delay > 0:
+            logger.debug(f"Waiting {delay:.1f} seconds for the GitHub `{resource}` rate limit.")
+            self._sleep(delay)
+
+    def after_response(self, resource: str, response: requests.Response) -> float | None:
+        """
+        Update the budget from the response headers.
+
+        Returns the number of seconds to wait before retrying if the request was
+        rejected by a primary or secondary rate limit, and None otherwise.
+        """
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+        now = self._clock()
+
+        with self._lock:
+            if "X-RateLimit-Remaining" in headers:
+                self._get_budget(resource).update(
+                    limit=int(headers["X-RateLimit-Limit"]) if "X-RateLimit-Limit" in headers else None,
+                    remaining=int(headers["X-RateLimit-Remaining"]),
+                    reset_at=float(headers["X-RateLimit-Reset"]) if "X-RateLimit-Reset" in headers else None,
+                )
+
+            if response.status_code not in (403, 429):
+                self._secondary_rate_limit_count = 0
+                return None
+
+            wait: float | None = None
+            if "Retry-After" in headers:
+                wait = float(headers["Retry-After"])
+            elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+                wait = float(headers["X-RateLimit-Reset"]) - now + 1
+            elif "rate limit" in response.text.casefold():
+                # secondary rate limit without Retry-After: back off exponentially
+                wait = SECONDARY_RATE_LIMIT_MIN_WAIT * 2**self._secondary_rate_limit_count
+            else:
+                # a 403 that is not about rate limits, e.g. missing permissions
+                return None
+
+            self._secondary_rate_limit_count += 1
+            wait = max(wait, 1.0)
+            self._blocked_until = max(self._blocked_until, now + wait)
+            return wait
+
+    def record_graphql_rate_limit(self, rate_limit: dict):
+        """
+        Record the `rateLimit { cost }` field of a GraphQL response.
+        The remaining budget itself is already tracked from the response headers.
+        """
+        if not rate_limit:
+            return
+        with self._lock:
+            self._get_budget("graphql").graphql_cost += int(rate_limit.get("cost") or 0)
+
+    def get_summary(self) -> str:
+        parts: list[str] = []
+        with self._lock:
+            for resource, budget in sorted(self.budgets.items()):
+                part = f"`{resource}`: {budget.requests} request(s), {budget.used} point(s) used"
+                if budget.graphql_cost:
+                    part += f" (query cost {budget.graphql_cost})"
+                if budget.remaining is not None:
+                    part += f", {max(budget.remaining, 0)} remaining"
+                parts.append(part)
+        return "; ".join(parts) if parts else "no requests"
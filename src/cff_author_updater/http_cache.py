@@ -0,0 +1,169 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# response headers that are kept with a cached body; `Link` is needed for pagination
+CACHED_RESPONSE_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+# headers of a `304 Not Modified` reply that describe its own empty body, not the cached one
+NOT_MODIFIED_BODY_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class HttpCache:
+    """
+    An on-disk cache of GET responses that is revalidated with conditional requests.
+
+    Each cached response stores its `ETag` and `Last-Modified` validators. The next GET for
+    the same URL sends `If-None-Match` / `If-Modified-Since`, and a `304 Not Modified` reply
+    is answered from disk. GitHub does not count 304 responses against the rate limit.
+
+    The cache key ignores the `Authorization` header, because the `GITHUB_TOKEN` of a
+    workflow changes on every run, which would otherwise make the cache useless across runs.
+    The cache directory can be persisted between runs with `actions/cache`. Each hit
+    touches its entry, and the least recently used entries are evicted once the cache
+    holds more than `max_entries`, so the persisted directory does not grow forever.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        # the counters are updated by the concurrent collectors
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._evict_least_recently_used()
+
+    @classmethod
+    def from_environment(cls) -> "HttpCache | None":
+        cache_dir = os.environ.get("HTTP_CACHE_DIR", "").strip()
+        if not cache_dir:
+            return None
+        return cls(cache_dir=Path(cache_dir))
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def _evict_least_recently_used(self):
+        entries: list[tuple[float, Path]] = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_path.stat().st_mtime, entry_path))
+            except OSError:
+                # removed by a parallel job
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, entry_path in entries[: len(entries) - self.max_entries]:
+            entry_path.unlink(missing_ok=True)
+        logger.debug(f"Evicted {len(entries) - self.max_entries} HTTP cache entries from `{self.cache_dir}`.")
+
+    def _get_key(self, url: str, accept: str) -> str:
+        return hashlib.sha256(f"{accept}\n{url}".encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, url: str, accept: str) -> dict | None:
+        entry_path = self._get_entry_path(self._get_key(url=url, accept=accept))
+        try:
+            with entry_path.open("r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, accept: str, response: requests.Response):
+        if not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            # without a validator, the response can never be revalidated
+            return
+
+        entry: dict = {
+            "url": url,
+            "headers": {
+                name: response.headers[name]
+                for name in CACHED_RESPONSE_HEADERS
+                if name in response.headers
+            },
+            "encoding": response.encoding,
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+
+        self._write_entry(entry_path=self._get_entry_path(self._get_key(url=url, accept=accept)), entry=entry)
+
+    def refresh(self, url: str, accept: str, entry: dict, not_modified_response: requests.Response):
+        """
+        Keep the validators of a revalidated entry up to date, and mark it as recently used.
+        """
+        entry_path = self._get_entry_path(self._get_key(url=url, accept=accept))
+        validators: dict = {
+            name: not_modified_response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in not_modified_response.headers
+        }
+        if any(entry["headers"].get(name) != value for name, value in validators.items()):
+            entry["headers"].update(validators)
+            self._write_entry(entry_path=entry_path, entry=entry)
+            return
+        try:
+            os.utime(entry_path)
+        except OSError:
+            # removed by a parallel job
+            pass
+
+    def _write_entry(self, entry_path: Path, entry: dict):
+        # write atomically so that parallel jobs sharing the directory never read a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Failed to write HTTP cache entry for {entry['url']}: {e}")
+            Path(temp_path).unlink(missing_ok=True)
+
+    @staticmethod
+    def get_conditional_headers(entry: dict) -> dict:
+        headers: dict = {}
+        if "ETag" in entry["headers"]:
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if "Last-Modified" in entry["headers"]:
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    @staticmethod
+    def create_response_from_entry(
+        entry: dict, not_modified_response: requests.Response
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.encoding = entry["encoding"]
+        # the reply carries the current rate limit budget and validators
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers.update(
+            (name, value)
+            for name, value in not_modified_response.headers.items()
+            if name.lower() not in NOT_MODIFIED_BODY_HEADERS
+        )
+        response._content = base64.b64decode(entry["content"])
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+        return response
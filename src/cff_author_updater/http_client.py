@@ -0,0 +1,122 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cff_author_updater.http_cache import HttpCache
+
+DEFAULT_USER_AGENT = "cff-author-updater"
+DEFAULT_TIMEOUT = 10
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_BACKOFF_JITTER = 0.5
+
+# one pool per host: api.github.com, github.com, and pub.orcid.org
+DEFAULT_POOL_CONNECTIONS = 4
+# enough connections per host for the concurrent collectors
+DEFAULT_POOL_MAXSIZE = 10
+
+# 429 is left to the GitHub rate limiter, which waits until the budget resets
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class HttpClient:
+    """
+    A pooled HTTP client that is created once per run and shared by the managers.
+
+    Connections are kept alive and pooled per host, so repeated calls to the same
+    host reuse a connection instead of paying a new TLS handshake. Failed requests are
+    retried with exponential backoff and jitter, but only for idempotent methods, so a
+    POST (e.g. a pull request comment) is never sent twice.
+
+    With an HttpCache, GET requests are sent as conditional requests and
+    `304 Not Modified` replies are served from disk.
+    """
+
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        backoff_factor: float | None = None,
+        backoff_jitter: float = DEFAULT_BACKOFF_JITTER,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        user_agent: str = DEFAULT_USER_AGENT,
+        cache: HttpCache | None = None,
+    ):
+        if max_retries is None:
+            max_retries = int(os.environ.get("HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        if backoff_factor is None:
+            backoff_factor = float(
+                os.environ.get("HTTP_BACKOFF_FACTOR", DEFAULT_BACKOFF_FACTOR)
+            )
+
+        self.timeout = timeout
+        self.cache = cache
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            # return the last response instead of raising, so callers keep using raise_for_status()
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+
+        self.session: requests.Session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.cache is not None and method == "GET" and not kwargs.get("stream"):
+            return self._cached_get(url, **kwargs)
+        return self.session.request(method, url, **kwargs)
+
+    def _cached_get(self, url: str, **kwargs) -> requests.Response:
+        assert self.cache is not None
+
+        full_url: str = requests.Request(
+            "GET", url, params=kwargs.pop("params", None)
+        ).prepare().url or url
+        headers: dict = dict(kwargs.pop("headers", None) or {})
+        accept: str = headers.get("Accept", "")
+
+        entry: dict | None = self.cache.load(url=full_url, accept=accept)
+        if entry is not None:
+            headers.update(HttpCache.get_conditional_headers(entry))
+
+        response = self.session.request("GET", full_url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record_hit()
+            self.cache.refresh(
+                url=full_url, accept=accept, entry=entry, not_modified_response=response
+            )
+            return HttpCache.create_response_from_entry(
+                entry=entry, not_modified_response=response
+            )
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.store(url=full_url, accept=accept, response=response)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+IDENTITY_CACHE_FILE_NAME = "identities.sqlite3"
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+# "no ORCID found" expires sooner, so that a newly linked ORCID is picked up quickly
+DEFAULT_NEGATIVE_TTL = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 10000
+
+# how long a connection waits for another job that is writing to the same database
+BUSY_TIMEOUT_SECONDS = 30
+
+
+class IdentityCache:
+    """
+    A persistent store of resolved identities that is shared across runs and jobs.
+
+    Entries map a kind of identity (e.g. a GitHub login or a git email) to the profile
+    fields, ORCID, and ORCID name that were resolved for it. Each entry expires after a
+    TTL, and the least recently used entries are evicted once the store grows beyond
+    `max_entries`. The SQLite database uses write-ahead logging, so parallel jobs can
+    read and write the same cache directory.
+
+    The cache never fails a run: database errors are logged and treated as a miss.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(
+            self.cache_dir / IDENTITY_CACHE_FILE_NAME,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS identities (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS identities_accessed_at ON identities (accessed_at)"
+            )
+            self._connection.execute(
+                "DELETE FROM identities WHERE expires_at <= ?", (self._clock(),)
+            )
+
+    @classmethod
+    def from_environment(cls) -> "IdentityCache | None":
+        cache_dir = os.environ.get("IDENTITY_CACHE_DIR", "").strip()
+        if not cache_dir:
+            return None
+        ttl = float(os.environ.get("IDENTITY_CACHE_TTL", DEFAULT_TTL))
+        try:
+            return cls(cache_dir=Path(cache_dir), ttl=ttl, negative_ttl=min(ttl, DEFAULT_NEGATIVE_TTL))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cannot open identity cache in `{cache_dir}`: {e}")
+            return None
+
+    def get(self, kind: str, key: str) -> dict | None:
+        """
+        Return the cached identity, or None if it is missing or expired.
+        """
+        now = self._clock()
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT value FROM identities WHERE kind = ? AND key = ? AND expires_at > ?",
+                    (kind, key.casefold(), now),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE identities SET accessed_at = ? WHERE kind = ? AND key = ?",
+                        (now, kind, key.casefold()),
+                    )
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read identity cache entry {kind} `{key}`: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, kind: str, key: str, value: dict, is_negative: bool = False):
+        """
+        Store a resolved identity. A negative entry, e.g. "no ORCID found", uses the shorter negative TTL.
+        """
+        now = self._clock()
+        expires_at = now + (self.negative_ttl if is_negative else self.ttl)
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO identities (kind, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (kind, key.casefold(), json.dumps(value), expires_at, now),
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to write identity cache entry {kind} `{key}`: {e}")
+
+    def _evict(self):
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM identities").fetchone()
+        if count > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM identities WHERE rowid IN (SELECT rowid FROM identities ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM identities").fetchone()
+        return count
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,144 @@
+import base64
+import binascii
+import json
+import logging
+import zlib
+
+import regex
+
+from cff_author_updater.contributions.contribution import Contribution
+from cff_author_updater.contributions.github_pull_request_comment_contribution import (
+    GitHubPullRequestCommentContribution,
+)
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributions.github_pull_request_issue_comment_contribution import (
+    GitHubPullRequestIssueCommentContribution,
+)
+from cff_author_updater.contributions.github_pull_request_issue_contribution import (
+    GitHubPullRequestIssueContribution,
+)
+from cff_author_updater.contributions.github_pull_request_review_contribution import (
+    GitHubPullRequestReviewContribution,
+)
+from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.contributors.github_contributor import GitHubContributor
+from cff_author_updater.managers.contribution_manager import ContributionManager
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_STATE_VERSION = 1
+
+# a PR comment may hold at most 65536 characters, which must also fit the review itself
+MAX_INCREMENTAL_STATE_LENGTH = 30000
+
+INCREMENTAL_STATE_REGEX = regex.compile(
+    r"<!-- cff-author-updater-state:(?P<state>[A-Za-z0-9+/=]+) -->"
+)
+
+CONTRIBUTOR_CLASSES: dict[str, type] = {
+    cls.__name__: cls for cls in (GitHubContributor, GitCommitContributor)
+}
+
+CONTRIBUTION_CLASSES: dict[str, type[Contribution]] = {
+    cls.__name__: cls
+    for cls in (
+        GitHubPullRequestCommitContribution,
+        GitHubPullRequestReviewContribution,
+        GitHubPullRequestIssueContribution,
+        GitHubPullRequestIssueCommentContribution,
+        GitHubPullRequestCommentContribution,
+    )
+}
+
+
+def encode_incremental_state(state: dict) -> str | None:
+    """
+    Encode the state as a hidden HTML comment for the PR comment.
+    Returns None if the encoded state is too large to embed.
+    """
+    payload: bytes = zlib.compress(
+        json.dumps(state, separators=(",", ":")).encode("utf-8"), 9
+    )
+    encoded_state: str = (
+        f"<!-- cff-author-updater-state:{base64.b64encode(payload).decode('ascii')} -->"
+    )
+    if len(encoded_state) > MAX_INCREMENTAL_STATE_LENGTH:
+        logger.debug(
+            f"Incremental state is too large to embed ({len(encoded_state)} characters). The next run will be a full run."
+        )
+        return None
+    return encoded_state
+
+
+def decode_incremental_state(comment_body: str) -> dict | None:
+    """
+    Decode the state embedded in a PR comment. Returns None if there is no readable state.
+    """
+    match = INCREMENTAL_STATE_REGEX.search(comment_body)
+    if not match:
+        return None
+    try:
+        state: dict = json.loads(
+            zlib.decompress(base64.b64decode(match.group("state"))).decode("utf-8")
+        )
+    except (binascii.Error, zlib.error, ValueError) as e:
+        logger.debug(f"Cannot read the incremental state of the previous run: {e}")
+        return None
+    if state.get("version") != INCREMENTAL_STATE_VERSION:
+        return None
+    return state
+
+
+def normalize_incremental_state(comment_body: str) -> str:
+    """
+    Replace the state embedded in a PR comment by its content without the time of the run
+    that collected it, so that two runs that collected the same state compare equal.
+    """
+    state: dict | None = decode_incremental_state(comment_body=comment_body)
+    if state is None:
+        return comment_body
+    state.pop("collected_at", None)
+    return INCREMENTAL_STATE_REGEX.sub(
+        lambda match: json.dumps(state, sort_keys=True, separators=(",", ":")), comment_body
+    )
+
+
+def serialize_contribution_manager(contribution_manager: ContributionManager) -> dict:
+    """
+    Serialize the contributors and contributions, storing each contributor only once.
+    """
+    contributors: list[dict] = []
+    contributor_indexes: dict[Contributor, int] = {}
+    contributions: list[dict] = []
+    for contributor in contribution_manager.contributors:
+        contributor_indexes[contributor] = len(contributors)
+        contributors.append({"type": type(contributor).__name__, **contributor.to_dict()})
+        for contribution in contribution_manager.get_contributions_for(contributor):
+            contributions.append(
+                {
+                    "type": type(contribution).__name__,
+                    "contributor": contributor_indexes[contributor],
+                    **contribution.to_dict(),
+                }
+            )
+    return {"contributors": contributors, "contributions": contributions}
+
+
+def deserialize_contribution_manager(data: dict) -> ContributionManager:
+    contributors: list[Contributor] = []
+    for contributor_data in data.get("contributors", []):
+        contributor_data = dict(contributor_data)
+        contributor_class = CONTRIBUTOR_CLASSES[contributor_data.pop("type")]
+        contributors.append(contributor_class.from_dict(contributor_data))
+
+    contribution_manager = ContributionManager()
+    for contribution_data in data.get("contributions", []):
+        contribution_class = CONTRIBUTION_CLASSES[contribution_data["type"]]
+        contribution_manager.add_contribution(
+            contribution_class.from_dict(contribution_data),
+            contributors[contribution_data["contributor"]],
+        )
+    return contribution_manager
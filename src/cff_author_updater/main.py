@@ -1,15 +1,19 @@
+import argparse
 import logging
 import os
 import sys
+from datetime import date
 from pathlib import Path
 
+from cff_author_updater.backfill import DEFAULT_BACKFILL_MAX_WORKERS, run_backfill
+from cff_author_updater.collection import collect_contributions
 from cff_author_updater.flags import Flags
 from cff_author_updater.logging_config import setup_logging
 from cff_author_updater.managers.cff_manager import CffManager
-from cff_author_updater.managers.contribution_manager import ContributionManager
 from cff_author_updater.managers.github_pull_request_manager import (
     GitHubPullRequestManager,
 )
+from cff_author_updater.scan import run_scan
 
 # Set up logging
 setup_logging()
@@ -17,7 +21,122 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
-def main():
+def create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cff-author-updater",
+        description="Update the authors of a CFF file with the contributors of a pull request.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    # the options shared by the commands that collect many pull requests
+    pull_requests_parser = argparse.ArgumentParser(add_help=False)
+    pull_requests_parser.add_argument("--since", type=date.fromisoformat, help="Earliest merge date, e.g. 2024-01-01.")
+    pull_requests_parser.add_argument("--until", type=date.fromisoformat, help="Latest merge date, e.g. 2024-12-31.")
+    pull_requests_parser.add_argument("--from-number", type=int, help="Lowest pull request number.")
+    pull_requests_parser.add_argument("--to-number", type=int, help="Highest pull request number.")
+    pull_requests_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_BACKFILL_MAX_WORKERS,
+        help="Number of pull requests that are collected at once.",
+    )
+
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        parents=[pull_requests_parser],
+        help="Audit the merged pull requests of the repository and suggest the missing authors.",
+    )
+    backfill_parser.add_argument(
+        "--report-path",
+        type=Path,
+        default=Path("cff-author-backfill.json"),
+        help="Where to write the aggregated contributor report.",
+    )
+    backfill_parser.add_argument(
+        "--suggested-cff-path",
+        type=Path,
+        default=Path("CITATION.suggested.cff"),
+        help="Where to write the CFF file with the missing authors.",
+    )
+
+    scan_parser = subparsers.add_parser(
+        "scan",
+        parents=[pull_requests_parser],
+        help="Scan the open pull requests, or the merged pull requests within a range, of many repositories.",
+    )
+    scan_parser.add_argument("--org", help="Scan every repository of the organization that is not archived.")
+    scan_parser.add_argument("--repos", nargs="+", default=[], help="Repositories to scan, e.g. owner/repo.")
+    scan_parser.add_argument(
+        "--max-processes",
+        type=int,
+        help="Number of CFF files that are processed at once. Defaults to the number of CPUs.",
+    )
+    scan_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("cff-author-scan"),
+        help="Where to write the report and suggested CFF file of each repository and the identity table.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = create_argument_parser().parse_args(argv)
+    if args.command == "backfill":
+        backfill(args=args)
+    elif args.command == "scan":
+        scan(args=args)
+    else:
+        update_pull_request()
+
+
+def backfill(args: argparse.Namespace):
+    if not os.environ.get("REPO"):
+        raise Exception("REPO environment variable is missing.")
+    cff_path: Path = Path(os.environ.get("CFF_PATH", "CITATION.cff"))
+    if not cff_path or not cff_path.exists():
+        raise Exception(f"Invalid CFF_PATH env variable: `{cff_path}` does not exist.")
+    if args.max_workers < 1:
+        raise Exception(f"Invalid --max-workers: `{args.max_workers}` must be at least 1.")
+
+    is_valid_cff: bool = run_backfill(
+        cff_path=cff_path,
+        report_path=args.report_path,
+        suggested_cff_path=args.suggested_cff_path,
+        since=args.since,
+        until=args.until,
+        from_number=args.from_number,
+        to_number=args.to_number,
+        max_workers=args.max_workers,
+    )
+    if not is_valid_cff:
+        sys.exit(1)
+
+
+def scan(args: argparse.Namespace):
+    if not args.org and not args.repos:
+        raise Exception("Invalid scan: give an organization with --org and/or repositories with --repos.")
+    if args.max_workers < 1:
+        raise Exception(f"Invalid --max-workers: `{args.max_workers}` must be at least 1.")
+
+    is_valid_cff: bool = run_scan(
+        repos=args.repos,
+        # the path of the CFF file within each repository
+        cff_path=os.environ.get("CFF_PATH", "CITATION.cff"),
+        output_dir=args.output_dir,
+        org=args.org,
+        since=args.since,
+        until=args.until,
+        from_number=args.from_number,
+        to_number=args.to_number,
+        max_workers=args.max_workers,
+        max_processes=args.max_processes,
+    )
+    if not is_valid_cff:
+        sys.exit(1)
+
+
+def update_pull_request():
     cff_path: Path = Path(os.environ.get("CFF_PATH", "CITATION.cff"))
     if not cff_path or not cff_path.exists():
         raise Exception(f"Invalid CFF_PATH env variable: `{cff_path}` does not exist.")
@@ -28,41 +147,39 @@ def main():
         github_pull_request_manager=github_pull_request_manager,
     )
 
-    contribution_manager = ContributionManager()
+    contribution_manager = collect_contributions(
+        github_pull_request_manager=github_pull_request_manager
+    )
 
-    if Flags.has("authorship_for_pr_commits"):
-        pr_commit_contribution_manager = (
-            github_pull_request_manager.collect_contributors_for_pr_commits()
-        )
-        contribution_manager.merge(pr_commit_contribution_manager)
+    missing_authors, duplicate_authors, cffconvert_validation_errors = (
+        cff_manager.update_cff(contribution_manager=contribution_manager)
+    )
 
-    if Flags.has("authorship_for_pr_reviews"):
-        pr_review_contribution_manager = (
-            github_pull_request_manager.collect_contributors_for_pr_reviews()
-        )
-        contribution_manager.merge(pr_review_contribution_manager)
+    logger.info(
+        f"GitHub rate limit budget consumed by this run: {github_pull_request_manager.rate_limiter.get_summary()}."
+    )
 
-    if Flags.has("authorship_for_pr_issues"):
-        pr_issue_contribution_manager = (
-            github_pull_request_manager.collect_contributors_for_pr_issues()
-        )
-        contribution_manager.merge(pr_issue_contribution_manager)
+    request_memo = github_pull_request_manager.request_memo
+    logger.debug(
+        f"Request memo: {request_memo.hits} duplicate API call(s) avoided, {request_memo.misses} fetched."
+    )
 
-    if Flags.has("authorship_for_pr_issue_comments"):
-        pr_issue_comment_contribution_manager = (
-            github_pull_request_manager.collect_contributors_for_pr_issue_comments()
-        )
-        contribution_manager.merge(pr_issue_comment_contribution_manager)
+    contributor_registry = github_pull_request_manager.contributor_registry
+    logger.debug(
+        f"Contributor registry: {contributor_registry.misses} distinct contributor(s) resolved, {contributor_registry.hits} repeated lookup(s) reused."
+    )
 
-    if Flags.has("authorship_for_pr_comments"):
-        pr_comment_contribution_manager = (
-            github_pull_request_manager.collect_contributors_for_pr_comments()
+    http_cache = github_pull_request_manager.http_client.cache
+    if http_cache is not None:
+        logger.debug(
+            f"HTTP cache: {http_cache.hits} response(s) served from `{http_cache.cache_dir}`, {http_cache.misses} fetched."
         )
-        contribution_manager.merge(pr_comment_contribution_manager)
 
-    missing_authors, duplicate_authors, cffconvert_validation_errors = (
-        cff_manager.update_cff(contribution_manager=contribution_manager)
-    )
+    identity_cache = github_pull_request_manager.identity_cache
+    if identity_cache is not None:
+        logger.debug(
+            f"Identity cache: {identity_cache.hits} identities reused from `{identity_cache.cache_dir}`, {identity_cache.misses} resolved."
+        )
 
     if Flags.has("missing_author_invalidates_pr") and len(missing_authors):
         sys.exit(1)
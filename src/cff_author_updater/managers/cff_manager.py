@@ -1,10 +1,8 @@
-import copy
 import json
 import logging
 from pathlib import Path
 
-import yaml
-
+from cff_author_updater.cff_author_index import CffAuthorIndex
 from cff_author_updater.cff_author_review import CffAuthorReview
 from cff_author_updater.cff_file import CffFile, CffFileValidationError
 from cff_author_updater.contributions.github_pull_request_commit_contribution import (
@@ -126,6 +124,37 @@ class CffManager:
 
         return contribution_warning_postfix
 
+    def create_cff_author_contributor(
+        self,
+        contributor: Contributor,
+        contribution_manager: ContributionManager,
+    ) -> CffAuthorContributor | None:
+        """
+        Create the CFF author for a GitHub or git commit contributor.
+        Returns None if the contributor cannot become a CFF author.
+        """
+        if isinstance(contributor, GitHubContributor) or isinstance(
+            contributor, GitCommitContributor
+        ):
+            contribution_warning_postfix = self._get_contribution_warning_postfix(
+                contributor=contributor,
+                contribution_manager=contribution_manager,
+            )
+        else:
+            raise ValueError(
+                "Contributor must be either a GitCommitContributor or a GitHubContributor."
+            )
+
+        if isinstance(contributor, GitHubContributor):
+            return self.create_cff_author_contributor_from_github_contributor(
+                github_contributor=contributor,
+                contribution_warning_postfix=contribution_warning_postfix,
+            )
+        return self.create_cff_author_contributor_from_git_commit_contributor(
+            git_commit_contributor=contributor,
+            contribution_warning_postfix=contribution_warning_postfix,
+        )
+
     def create_cff_author_contributor_from_github_contributor(
         self,
         github_contributor: GitHubContributor,
@@ -231,26 +260,34 @@ class CffManager:
             CffAuthorContributor(cff_author_data=cff_author_data)
             for cff_author_data in cff["authors"]
         ]
-        for i, author_a in enumerate(old_authors):
+
+        # find each author's earlier duplicates with the index instead of comparing all pairs
+        cff_author_index = CffAuthorIndex()
+        duplicate_pairs: list[tuple[int, int]] = []
+        for j, author_b in enumerate(old_authors):
+            for i in cff_author_index.find_same_authors(cff_author=author_b):
+                duplicate_pairs.append((i, j))
+            cff_author_index.add(author_b)
+
+        for i, j in sorted(duplicate_pairs):
+            author_a = old_authors[i]
+            author_b = old_authors[j]
             author_a_identifier = create_identifier_of_cff_author_for_logger(
                 cff_author=author_a
             )
-            for j in range(i + 1, len(old_authors)):
-                author_b = old_authors[j]
-                if author_a.is_same_author(cff_author=author_b):
-                    author_b_identifier = (
-                        create_identifier_of_cff_author_for_logger(
-                            cff_author=author_b
-                        )
-                    )
-                    duplicate_authors.add(author_b)
-                    duplication_message: str = (
-                        f"The original CFF file has these duplicate authors: {author_a_identifier} and {author_b_identifier}"
-                    )
-                    if Flags.has("duplicate_author_invalidates_pr"):
-                        logger.error(duplication_message)
-                    else:
-                        logger.warning(duplication_message)
+            author_b_identifier = (
+                create_identifier_of_cff_author_for_logger(
+                    cff_author=author_b
+                )
+            )
+            duplicate_authors.add(author_b)
+            duplication_message: str = (
+                f"The original CFF file has these duplicate authors: {author_a_identifier} and {author_b_identifier}"
+            )
+            if Flags.has("duplicate_author_invalidates_pr"):
+                logger.error(duplication_message)
+            else:
+                logger.warning(duplication_message)
 
         return duplicate_authors
 
@@ -324,11 +361,13 @@ class CffManager:
             self._process_cff_validation_errors(cff_file_validation_error=e)
             cffconvert_validation_errors += e.cffconvert_validation_errors
 
-        cff = copy.deepcopy(self.cff_file.cff)
+        # CffFile keeps its own copy of the original CFF, so the CFF is updated in place
+        cff = self.cff_file.cff
 
         cff.setdefault("authors", [])
 
         duplicate_authors: set[CffAuthorContributor] = self.validate_old_cff_authors_are_unique(cff=cff)
+        cff_author_index = CffAuthorIndex.from_cff_authors_data(cff_authors_data=cff["authors"])
 
         contributors: set[Contributor] = set(contribution_manager.contributors)
         contributors_already_author_in_cff: set[Contributor] = set()
@@ -344,37 +383,10 @@ class CffManager:
                 contributors_skipped_for_authorship.add(contributor)
                 continue
 
-            new_cff_author: CffAuthorContributor | None = None
-
-            if isinstance(contributor, GitHubContributor) or isinstance(
-                contributor, GitCommitContributor
-            ):
-                contribution_warning_postfix = self._get_contribution_warning_postfix(
-                    contributor=contributor,
-                    contribution_manager=contribution_manager,
-                )
-            else:
-                raise ValueError(
-                    "Contributor must be either a GitCommitContributor or a GitHubContributor."
-                )
-
-            if isinstance(contributor, GitHubContributor):
-
-                new_cff_author = (
-                    self.create_cff_author_contributor_from_github_contributor(
-                        github_contributor=contributor,
-                        contribution_warning_postfix=contribution_warning_postfix,
-                    )
-                )
-            elif isinstance(contributor, GitCommitContributor):
-                new_cff_author = (
-                    self.create_cff_author_contributor_from_git_commit_contributor(
-                        git_commit_contributor=contributor,
-                        contribution_warning_postfix=contribution_warning_postfix,
-                    )
-                )
-            else:
-                raise Exception("Invalid contributor class.")
+            new_cff_author: CffAuthorContributor | None = self.create_cff_author_contributor(
+                contributor=contributor,
+                contribution_manager=contribution_manager,
+            )
 
             if new_cff_author is None:
                 # there was some error creating the cff author, so we will skip it
@@ -389,14 +401,7 @@ class CffManager:
                     contributors_skipped_for_authorship.add(contributor)
                     continue
 
-                if any(
-                    new_cff_author.is_same_author(
-                        cff_author=CffAuthorContributor(
-                            cff_author_data=existing_cff_author
-                        )
-                    )
-                    for existing_cff_author in cff["authors"]
-                ):
+                if cff_author_index.has_same_author(cff_author=new_cff_author):
                     identifier: str = create_identifier_of_cff_author_for_logger(
                         cff_author=new_cff_author
                     )
@@ -407,13 +412,15 @@ class CffManager:
                     
 
             cff["authors"].append(new_cff_author.cff_author_data)
+            cff_author_index.add(new_cff_author)
             contributors_added_to_cff.add(contributor)
 
         self.cff_file.cff = cff
         updated_cff_is_valid_cff: bool = original_cff_is_valid_cff
         if original_cff_is_valid_cff:
             try:
-                self.cff_file.save()
+                if not self.cff_file.save():
+                    logger.debug(f"{self.cff_path} is unchanged, so it was not written.")
             except CffFileValidationError as e:
                 updated_cff_is_valid_cff = False
                 self._process_cff_validation_errors(cff_file_validation_error=e)
@@ -485,11 +492,11 @@ class CffManager:
             f.write("\nEOF\n")
 
             f.write("original_cff<<EOF\n")
-            f.write(yaml.dump(self.cff_file.original_cff, sort_keys=False))
+            f.write(self.cff_file.get_original_cff_yaml())
             f.write("\nEOF\n")
 
             f.write("updated_cff<<EOF\n")
-            f.write(yaml.dump(cff, sort_keys=False))
+            f.write(self.cff_file.get_cff_yaml())
             f.write("\nEOF\n")
 
             if error_logs:
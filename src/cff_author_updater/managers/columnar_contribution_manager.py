@@ -0,0 +1,188 @@
+import sys
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from cff_author_updater.contributions.contribution import Contribution
+from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.managers.contribution_manager import ContributionManager
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_epoch_microseconds(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // MICROSECOND
+
+
+def epoch_microseconds_to_datetime(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+class ColumnarContributionManager:
+    """
+    A ContributionManager for very large runs, such as repository-wide audits.
+
+    Instead of one Contribution object per row, contributions are stored in parallel
+    columns: epoch timestamps in microseconds, interned ids, a category code, and a
+    contributor index. Rows are appended in O(1), and the rows are sorted and grouped
+    by contributor once, the first time they are queried after a write, with the
+    standard library, because the project does not depend on numpy. Queries
+    return the same values as ContributionManager, with Contribution objects created
+    on demand. Timestamps are returned as naive UTC datetimes.
+    """
+
+    def __init__(self):
+        self._contributors: list[Contributor] = []
+        self._contributor_indexes: dict[Contributor, int] = {}
+        self._categories: list[type[Contribution]] = []
+        self._category_codes: dict[type[Contribution], int] = {}
+
+        self._timestamps = array("q")
+        self._ids: list[str] = []
+        self._category_column = array("H")
+        self._contributor_column = array("L")
+
+        # built on the first query after a write
+        self._is_indexed: bool = True
+        self._row_order = array("L")
+        self._contributor_row_starts = array("L")
+        self._contributors_sorted_by_first_contribution: list[Contributor] = []
+
+    def add_contribution(self, contribution: Contribution, contributor: Contributor):
+        if not isinstance(contributor, Contributor):
+            raise ValueError(
+                "Cannot add contribution: contributor must be a Contributor instance"
+            )
+        if not isinstance(contribution, Contribution):
+            raise ValueError(
+                "Cannot add contribution: contribution must be a Contribution instance"
+            )
+
+        contributor_index: int | None = self._contributor_indexes.get(contributor)
+        if contributor_index is None:
+            contributor_index = len(self._contributors)
+            self._contributor_indexes[contributor] = contributor_index
+            self._contributors.append(contributor)
+
+        category: type[Contribution] = type(contribution)
+        category_code: int | None = self._category_codes.get(category)
+        if category_code is None:
+            category_code = len(self._categories)
+            self._category_codes[category] = category_code
+            self._categories.append(category)
+
+        self._timestamps.append(datetime_to_epoch_microseconds(contribution.created_at))
+        self._ids.append(sys.intern(contribution.id))
+        self._category_column.append(category_code)
+        self._contributor_column.append(contributor_index)
+        self._is_indexed = False
+
+    def _build_index(self):
+        """
+        Group the rows by contributor and sort each group by time, dropping duplicate rows.
+
+        The rows are grouped in one pass, so only the rows of each contributor are sorted,
+        by the timestamp column itself instead of a key tuple per row. The sort is stable,
+        so rows with the same time keep the order they were added in.
+        """
+        timestamps = self._timestamps
+        category_column = self._category_column
+        ids = self._ids
+        rows_by_contributor: list[list[int]] = [[] for _ in self._contributors]
+        for row, contributor_index in enumerate(self._contributor_column):
+            rows_by_contributor[contributor_index].append(row)
+
+        row_order = array("L")
+        contributor_row_starts = array("L", [0])
+        for rows in rows_by_contributor:
+            rows.sort(key=timestamps.__getitem__)
+            # the contributor is the same for all rows of a group
+            seen: set[tuple[int, str]] = set()
+            for row in rows:
+                key = (category_column[row], ids[row])
+                if key not in seen:
+                    seen.add(key)
+                    row_order.append(row)
+            contributor_row_starts.append(len(row_order))
+
+        # the first row of each contributor is its earliest contribution
+        contributor_indexes: list[int] = sorted(
+            range(len(self._contributors)),
+            key=lambda contributor_index: timestamps[row_order[contributor_row_starts[contributor_index]]],
+        )
+
+        self._row_order = row_order
+        self._contributor_row_starts = contributor_row_starts
+        self._contributors_sorted_by_first_contribution = [
+            self._contributors[contributor_index] for contributor_index in contributor_indexes
+        ]
+        self._is_indexed = True
+
+    def _get_rows_for(self, contributor: Contributor) -> array:
+        if not self._is_indexed:
+            self._build_index()
+        contributor_index: int | None = self._contributor_indexes.get(contributor)
+        if contributor_index is None:
+            return array("L")
+        return self._row_order[
+            self._contributor_row_starts[contributor_index] : self._contributor_row_starts[contributor_index + 1]
+        ]
+
+    def _create_contribution(self, row: int) -> Contribution:
+        contribution_id: str = self._ids[row]
+        return self._categories[self._category_column[row]].from_dict(
+            {
+                "id": contribution_id,
+                "sha": contribution_id,
+                "created_at": epoch_microseconds_to_datetime(self._timestamps[row]).isoformat(),
+            }
+        )
+
+    @property
+    def contributors(self) -> list[Contributor]:
+        return list(self._contributors)
+
+    @property
+    def contributors_sorted_by_first_contribution(self) -> list[Contributor]:
+        if not self._is_indexed:
+            self._build_index()
+        return list(self._contributors_sorted_by_first_contribution)
+
+    def get_contributions_for(self, contributor: Contributor) -> list[Contribution]:
+        return [self._create_contribution(row) for row in self._get_rows_for(contributor)]
+
+    def get_contribution_categories_for(
+        self, contributor: Contributor
+    ) -> dict[str, list[Contribution]]:
+        categories = defaultdict(list)
+        for row in self._get_rows_for(contributor):
+            contribution: Contribution = self._create_contribution(row)
+            categories[contribution.__class__.__name__].append(contribution)
+        return dict(categories)
+
+    def to_dict(self) -> list[dict]:
+        result = []
+        for contributor in self.contributors_sorted_by_first_contribution:
+            contribution_ids_by_category: dict[str, list[str]] = defaultdict(list)
+            for row in self._get_rows_for(contributor):
+                contribution_ids_by_category[
+                    self._categories[self._category_column[row]].__name__
+                ].append(self._ids[row])
+            result.append(
+                {
+                    "contributor": contributor.to_dict(),
+                    "contributions": dict(contribution_ids_by_category),
+                }
+            )
+        return result
+
+    def merge(self, other: "ColumnarContributionManager | ContributionManager"):
+        for contributor in other.contributors:
+            for contribution in other.get_contributions_for(contributor):
+                self.add_contribution(contribution, contributor)
+
+    def __len__(self):
+        return len(self._contributors)
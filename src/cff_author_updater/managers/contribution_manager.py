@@ -1,14 +1,32 @@
+import bisect
+from collections import defaultdict
+
 from cff_author_updater.contributions.contribution import Contribution
 from cff_author_updater.contributors.contributor import Contributor
-from collections import defaultdict
+
+
+def get_contribution_created_at(contribution: Contribution):
+    return contribution.created_at
 
 
 class ContributionManager:
+    """
+    Indexes contributions by contributor and contributors by contribution.
+
+    Membership is checked with sets, and the contributions of each contributor are
+    kept sorted by inserting them in order, so adding a contribution is O(log n).
+    Contributions with the same time keep the order in which they were added.
+    The contributors sorted by their first contribution are cached until the next write.
+    """
 
     def __init__(self):
         self._contributions: list[Contribution] = []
+        self._contribution_set: set[Contribution] = set()
         self._contributions_by_contributor: dict[Contributor, list[Contribution]] = {}
+        self._contribution_sets_by_contributor: dict[Contributor, set[Contribution]] = {}
         self._contributors_by_contribution: dict[Contribution, list[Contributor]] = {}
+        self._contributor_sets_by_contribution: dict[Contribution, set[Contributor]] = {}
+        self._contributors_sorted_by_first_contribution: list[Contributor] | None = None
 
     def add_contribution(self, contribution: Contribution, contributor: Contributor):
         if not isinstance(contributor, Contributor):
@@ -20,20 +38,30 @@ class ContributionManager:
                 "Cannot add contribution: contribution must be a Contribution instance"
             )
 
-        if contribution not in self._contributions:
+        if contribution not in self._contribution_set:
+            self._contribution_set.add(contribution)
             self._contributions.append(contribution)
 
         if contributor not in self._contributions_by_contributor:
             self._contributions_by_contributor[contributor] = []
-        if contribution not in self._contributions_by_contributor[contributor]:
-            self._contributions_by_contributor[contributor].append(contribution)
-            self._contributions_by_contributor[contributor].sort(
-                key=lambda x: x.created_at
+            self._contribution_sets_by_contributor[contributor] = set()
+            self._contributors_sorted_by_first_contribution = None
+        contribution_set: set[Contribution] = self._contribution_sets_by_contributor[contributor]
+        if contribution not in contribution_set:
+            contribution_set.add(contribution)
+            bisect.insort_right(
+                self._contributions_by_contributor[contributor],
+                contribution,
+                key=get_contribution_created_at,
             )
+            self._contributors_sorted_by_first_contribution = None
 
         if contribution not in self._contributors_by_contribution:
             self._contributors_by_contribution[contribution] = []
-        if contributor not in self._contributors_by_contribution[contribution]:
+            self._contributor_sets_by_contribution[contribution] = set()
+        contributor_set: set[Contributor] = self._contributor_sets_by_contribution[contribution]
+        if contributor not in contributor_set:
+            contributor_set.add(contributor)
             self._contributors_by_contribution[contribution].append(contributor)
 
     @property
@@ -42,22 +70,21 @@ class ContributionManager:
 
     @property
     def contributors_sorted_by_first_contribution(self) -> list[Contributor]:
-        contributor_and_first_contribution_tuple_list: list[
-            tuple[Contributor, Contribution]
-        ] = []
-        for contributor in self._contributions_by_contributor.keys():
-            if len(self._contributions_by_contributor[contributor]) > 0:
-                first_contribution: Contribution = self._contributions_by_contributor[
-                    contributor
-                ][0]
-                contributor_and_first_contribution_tuple_list.append(
-                    (contributor, first_contribution)
-                )
-
-        contributor_and_first_contribution_tuple_list.sort(
-            key=lambda x: x[1].created_at
-        )
-        return [x[0] for x in contributor_and_first_contribution_tuple_list]
+        if self._contributors_sorted_by_first_contribution is None:
+            contributor_and_first_contribution_tuple_list: list[
+                tuple[Contributor, Contribution]
+            ] = [
+                (contributor, contributions[0])
+                for contributor, contributions in self._contributions_by_contributor.items()
+                if contributions
+            ]
+            contributor_and_first_contribution_tuple_list.sort(
+                key=lambda x: x[1].created_at
+            )
+            self._contributors_sorted_by_first_contribution = [
+                x[0] for x in contributor_and_first_contribution_tuple_list
+            ]
+        return list(self._contributors_sorted_by_first_contribution)
 
     def get_contributions_for(self, contributor: Contributor) -> list[Contribution]:
         return self._contributions_by_contributor.get(contributor, [])
@@ -1,44 +1,232 @@
 import json
 import logging
 import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import requests
 import yaml
 
+from cff_author_updater.github_rate_limiter import (
+    GitHubRateLimiter,
+    GitHubRateLimitError,
+)
+from cff_author_updater.http_cache import HttpCache
+from cff_author_updater.http_client import HttpClient
+from cff_author_updater.identity_cache import IdentityCache
 from cff_author_updater.managers.orcid_manager import OrcidManager
 
 logger = logging.getLogger(__name__)
 
+# GitHub's REST API defaults to 30 items per page and allows at most 100.
+GITHUB_MAX_PER_PAGE = 100
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# how often a request that was rejected by a rate limit is retried after waiting
+MAX_RATE_LIMIT_RETRIES = 3
+
+# added to GraphQL queries so that their cost is reported by the rate limiter
+GRAPHQL_RATE_LIMIT = "rateLimit { cost }"
+
+# number of aliased user profiles fetched per GraphQL query
+GITHUB_USER_PROFILE_BATCH_SIZE = 100
+
+# `repositoryOwner` resolves both users and organizations, and is null for unknown logins.
+# The organization email is aliased because `User.email` is non-null and `Organization.email` is not.
+GRAPHQL_USER_PROFILE_FIELDS = """
+    __typename
+    login
+    ... on User {
+        name email bio websiteUrl
+        socialAccounts(first: 10) { nodes { provider url } }
+    }
+    ... on Organization { name organizationEmail: email description websiteUrl }
+"""
+
+
+def parse_github_datetime(datetime_str: str | None) -> datetime:
+    """
+    Parse a GitHub timestamp into a naive UTC datetime.
+
+    REST timestamps look like `2024-01-02T03:04:05Z`, while GraphQL git timestamps may carry
+    a UTC offset such as `2024-01-02T05:04:05+02:00`. Missing timestamps become `datetime.min`
+    so that they sort first.
+    """
+    if not datetime_str:
+        return datetime.min
+    parsed = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_graphql_user_profile(owner: dict) -> dict:
+    """
+    Convert a GraphQL `repositoryOwner` into the same shape as a REST `/users/{login}` profile.
+    """
+    is_organization: bool = owner.get("__typename") == "Organization"
+    if is_organization:
+        bio, email = owner.get("description"), owner.get("organizationEmail")
+    else:
+        bio, email = owner.get("bio"), owner.get("email")
+    social_accounts: list[dict] = (owner.get("socialAccounts") or {}).get("nodes") or []
+    return {
+        "login": owner.get("login", ""),
+        "name": owner.get("name"),
+        "bio": bio,
+        "blog": owner.get("websiteUrl") or "",
+        # GraphQL returns an empty string for a private email, REST returns null
+        "email": email or None,
+        "type": "Organization" if is_organization else "User",
+        "social_accounts": [
+            account["url"] for account in social_accounts if account.get("url")
+        ],
+    }
+
+
+class GitHubGraphQLError(Exception):
+    pass
+
 
 class GitHubManager:
-    def __init__(self):
-        self.github_action_version = self.get_github_action_version()
+    def __init__(
+        self,
+        event: dict | None = None,
+        shared_github_manager: "GitHubManager | None" = None,
+        repo: str | None = None,
+    ):
+        """
+        The event and repository are read from GITHUB_EVENT_PATH and REPO unless they
+        are given, e.g. by the backfill and scan commands. A shared GitHub manager lends
+        its HTTP client, rate limiter, and enrichment caches, so that the managers of
+        many pull requests look up each user profile and ORCID once, and its action version,
+        so that the CITATION.cff of the action is read once.
+        """
+        self.github_action_version: str = (
+            shared_github_manager.github_action_version
+            if shared_github_manager is not None
+            else self.get_github_action_version()
+        )
+        # REPO is required unless the repository is given
+        self.repo: str = repo if repo is not None else os.environ["REPO"]
         self._load_from_environment_variables()
-        self.orcid_manager = OrcidManager()
+        self._load_github_event(event if event is not None else self._read_github_event())
+        if shared_github_manager is not None:
+            self.http_client = shared_github_manager.http_client
+            self.rate_limiter = shared_github_manager.rate_limiter
+            self.github_user_profiles = shared_github_manager.github_user_profiles
+            self.orcid_manager = shared_github_manager.orcid_manager
+            self.identity_cache = shared_github_manager.identity_cache
+            self.cached_github_identities = shared_github_manager.cached_github_identities
+            return
+        # one pooled HTTP client per run, shared with the ORCID manager
+        self.http_client = HttpClient(cache=HttpCache.from_environment())
+        self.rate_limiter = GitHubRateLimiter()
+        # user profiles by casefolded login; None for logins that do not exist
+        self.github_user_profiles: dict[str, dict | None] = {}
+        self.orcid_manager = OrcidManager(http_client=self.http_client)
+        # resolved identities that persist across runs, if a cache directory is configured
+        self.identity_cache: IdentityCache | None = IdentityCache.from_environment()
+        # identity cache lookups by casefolded login, shared by the prefetch and the contributors
+        self.cached_github_identities: dict[str, dict | None] = {}
 
     def _load_from_environment_variables(self):
 
-        self.repo: str = os.environ["REPO"]
         self.github_token: str = os.environ["GITHUB_TOKEN"]
         self.output_file: str = os.environ.get(
             "GITHUB_OUTPUT", "/tmp/github_output.txt"
         )
         self.github_event_path: Path = Path(os.environ.get("GITHUB_EVENT_PATH", ""))
 
+    def _read_github_event(self) -> dict:
         if self.github_event_path and self.github_event_path.exists():
             with open(self.github_event_path, "r") as f:
-                event = json.load(f)
-                self._load_github_event(event)
+                return json.load(f)
         else:
             raise Exception("GITHUB_EVENT_PATH is missing.")
 
-    def get_github_session(self, token) -> requests.Session:
-        session: requests.Session = requests.Session()
-        session.headers.update(
-            {"Authorization": f"token {token}", "Accept": "application/vnd.github+json"}
+    def get_github_headers(self) -> dict:
+        return {
+            "Authorization": f"token {self.github_token}",
+            "Accept": "application/vnd.github+json",
+        }
+
+    def github_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to GitHub through the shared HTTP client with the GitHub auth headers.
+        Headers passed in `kwargs` override the defaults.
+
+        Every request passes through the rate limiter. A request that is rejected by a
+        primary or secondary rate limit is retried after the wait that GitHub asks for,
+        which is safe for any method because GitHub did not process the request.
+        """
+        headers = {**self.get_github_headers(), **kwargs.pop("headers", {})}
+        resource: str = "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.before_request(resource)
+            response = self.http_client.request(method, url, headers=headers, **kwargs)
+            wait: float | None = self.rate_limiter.after_response(resource, response)
+            if wait is None:
+                return response
+            if attempt < MAX_RATE_LIMIT_RETRIES:
+                logger.debug(
+                    f"GitHub rate limit reached for `{url}`. Retrying in {wait:.0f} seconds."
+                )
+
+        raise GitHubRateLimitError(
+            f"GitHub rate limit reached for `{url}` after {MAX_RATE_LIMIT_RETRIES} retries."
         )
-        return session
+
+    def iter_github_paginated(
+        self, url: str, params: dict | None = None
+    ) -> Iterator[dict]:
+        """
+        Yield the items of a paginated GitHub REST list endpoint one at a time.
+
+        Requests `per_page=100` and follows the `Link: rel="next"` header until
+        the last page, so only a single page is held in memory at once.
+        """
+        for page in self.iter_github_paginated_pages(url=url, params=params):
+            yield from page
+
+    def iter_github_paginated_pages(
+        self, url: str, params: dict | None = None
+    ) -> Iterator[list[dict]]:
+        """
+        Yield the pages of a paginated GitHub REST list endpoint one at a time, so that
+        a caller can prefetch what the items of a page refer to before handling them.
+        """
+        page_params: dict | None = {"per_page": GITHUB_MAX_PER_PAGE, **(params or {})}
+        next_url: str | None = url
+        while next_url:
+            response = self.github_request("GET", next_url, params=page_params)
+            response.raise_for_status()
+            yield response.json()
+
+            next_url = response.links.get("next", {}).get("url")
+            # the next link already carries the query string of the first request
+            page_params = None
+
+    def post_github_graphql(self, query: str, variables: dict) -> dict:
+        """
+        Run a GitHub GraphQL query and return its `data` object.
+        """
+        response = self.github_request(
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+        payload: dict = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in payload["errors"])
+            raise GitHubGraphQLError(f"GitHub GraphQL query failed: {messages}")
+        data: dict = payload.get("data") or {}
+        self.rate_limiter.record_graphql_rate_limit(data.get("rateLimit") or {})
+        return data
 
     def get_github_action_version(self) -> str:
         action_root = (
@@ -56,29 +244,97 @@ class GitHubManager:
 
         return cff_data.get("version", "")
     
+    def prefetch_github_user_profiles(self, github_usernames: Iterable[str | None]):
+        """
+        Fetch the profiles of many users at once with aliased GraphQL fields, so that
+        `get_github_user_profile` does not need one REST request per user.
+
+        Bots cannot be resolved through GraphQL and are left to the REST fallback, as are
+        all logins of a batch that fails. Logins with a live entry in the identity cache
+        are skipped, because their contributors are restored without a profile.
+        """
+        pending: list[str] = []
+        for github_username in github_usernames:
+            if (
+                github_username
+                and not github_username.endswith("[bot]")
+                and github_username.casefold() not in self.github_user_profiles
+                and github_username not in pending
+                and self.get_cached_github_identity(github_username=github_username) is None
+            ):
+                pending.append(github_username)
+
+        for start in range(0, len(pending), GITHUB_USER_PROFILE_BATCH_SIZE):
+            batch: list[str] = pending[start : start + GITHUB_USER_PROFILE_BATCH_SIZE]
+            variables: str = ", ".join(f"$login{i}: String!" for i in range(len(batch)))
+            fields: str = "\n".join(
+                f"user{i}: repositoryOwner(login: $login{i}) {{ {GRAPHQL_USER_PROFILE_FIELDS} }}"
+                for i in range(len(batch))
+            )
+            query = f"query({variables}) {{ {GRAPHQL_RATE_LIMIT} {fields} }}"
+
+            try:
+                data = self.post_github_graphql(
+                    query=query,
+                    variables={f"login{i}": login for i, login in enumerate(batch)},
+                )
+            except (GitHubGraphQLError, GitHubRateLimitError, requests.RequestException) as e:
+                logger.debug(f"Failed to prefetch {len(batch)} GitHub user profile(s): {e}")
+                continue
+
+            for i, github_username in enumerate(batch):
+                owner: dict | None = data.get(f"user{i}")
+                if owner is None:
+                    logger.error(
+                        f"Invalid GitHub username: failed to find GitHub user profile for @{github_username}"
+                    )
+                self.github_user_profiles[github_username.casefold()] = (
+                    parse_graphql_user_profile(owner) if owner else None
+                )
+
+    def get_cached_github_identity(self, github_username: str) -> dict | None:
+        """
+        Return the identity of a login from the identity cache, or None if it is not cached.
+        Each login is looked up once per run, so the prefetch and the contributor of a login
+        share one lookup.
+        """
+        if self.identity_cache is None:
+            return None
+        key: str = github_username.casefold()
+        if key not in self.cached_github_identities:
+            self.cached_github_identities[key] = self.identity_cache.get(kind="github", key=github_username)
+        return self.cached_github_identities[key]
+
     def get_github_user_profile(self, github_username: str) -> dict | None:
+        if github_username.casefold() in self.github_user_profiles:
+            return self.github_user_profiles[github_username.casefold()]
+
         url = f"https://api.github.com/users/{github_username}"
         headers = {
             "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "cff-author-updater",
         }
-        if self.github_token:
-            headers["Authorization"] = f"Bearer {self.github_token}"
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.github_request("GET", url, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            return {
+            user_profile: dict = {
                 "login": data.get("login", ""),
                 "name": data.get("name", ""),
                 "bio": data.get("bio", ""),
                 "blog": data.get("blog", ""),
                 "email": data.get("email", ""),
                 "type": data.get("type", "User"),
+                # unknown, because the REST profile does not include social accounts
+                "social_accounts": None,
             }
+            self.github_user_profiles[github_username.casefold()] = user_profile
+            return user_profile
 
+        except GitHubRateLimitError as e:
+            logger.error(f"Cannot fetch GitHub user profile for @{github_username}: {e}")
+            return None
         except requests.RequestException:
             msg = f"Invalid GitHub username: failed to find GitHub user profile for @{github_username}"
             logger.error(msg)
@@ -86,4 +342,6 @@ class GitHubManager:
 
 
     def _load_github_event(self, event: dict):
-        pass
+        # the head before and after the push, set by `push` and `pull_request` synchronize events
+        self.event_before_sha: str | None = event.get("before")
+        self.event_after_sha: str | None = event.get("after")
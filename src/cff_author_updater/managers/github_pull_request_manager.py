@@ -1,10 +1,16 @@
+import hashlib
+import json
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator
 
 import regex
 import requests
 
+from cff_author_updater.contributions.contribution import Contribution
 from cff_author_updater.contributions.github_pull_request_comment_contribution import (
     GitHubPullRequestCommentContribution,
 )
@@ -22,24 +28,144 @@ from cff_author_updater.contributions.github_pull_request_review_contribution im
 )
 from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
 from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.contributors.contributor_registry import ContributorRegistry
 from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
 from cff_author_updater.contributors.github_contributor import (
     GitHubContributor,
     create_github_user_profile_url,
+    parse_github_username_from_github_noreply_email,
 )
 from cff_author_updater.flags import Flags
+from cff_author_updater.git_log import GitLogError, iter_git_log_commits
+from cff_author_updater.incremental_state import (
+    INCREMENTAL_STATE_VERSION,
+    decode_incremental_state,
+    deserialize_contribution_manager,
+    encode_incremental_state,
+    normalize_incremental_state,
+    serialize_contribution_manager,
+)
 from cff_author_updater.managers.contribution_manager import ContributionManager
-from cff_author_updater.managers.github_manager import GitHubManager
+from cff_author_updater.managers.github_manager import (
+    GITHUB_MAX_PER_PAGE,
+    GRAPHQL_RATE_LIMIT,
+    GitHubManager,
+    parse_github_datetime,
+)
+from cff_author_updater.request_memo import RequestMemo
 
 UNKNOWN_CONTRIBUTOR_KEY = ("unknown", None)
+PR_COMMENT_MARKER = "<!-- cff-author-updater-pr-comment -->"
+# the footer of the PR comment, which changes on every run
+PR_COMMENT_FOOTER_REGEX = regex.compile(r"^_Last updated: .*_$", flags=regex.MULTILINE)
 DEFAULT_GITHUB_ACTION_BOT = "github-actions[bot]"
+COLLECTION_BACKENDS = ("rest", "graphql")
+COMMIT_SOURCES = ("api", "git")
+
+# Regex to match co-authors in commit messages
+COAUTHOR_REGEX = regex.compile(
+    r"^Co-authored-by:\s*(?P<name>.+?)\s*<(?P<email>[^<>@\s]+@[^<>@\s]+\.[^<>@\s]+)>\s*$",
+    flags=regex.IGNORECASE | regex.UNICODE
+)
+
+# GraphQL selection sets shared by the full contribution query and its follow-up page queries.
+# Bots are reported by GraphQL without the `[bot]` suffix that REST uses, so `__typename` is
+# requested to restore it before checking the bot blacklist.
+GRAPHQL_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+GRAPHQL_AUTHOR = "author { __typename login }"
+GRAPHQL_COMMIT_NODE = "commit { oid message author { name email date user { login } } }"
+GRAPHQL_REVIEW_NODE = f"url submittedAt {GRAPHQL_AUTHOR}"
+GRAPHQL_COMMENT_NODE = f"url createdAt {GRAPHQL_AUTHOR}"
+GRAPHQL_LINKED_ISSUE_NODE = f"number url createdAt {GRAPHQL_AUTHOR}"
+GRAPHQL_ISSUE_NODE = (
+    f"{GRAPHQL_LINKED_ISSUE_NODE} "
+    f"comments(first: {GITHUB_MAX_PER_PAGE}) @include(if: $withIssueComments) "
+    f"{{ {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_COMMENT_NODE} }} }}"
+)
+
+PR_CONTRIBUTIONS_GRAPHQL_QUERY = f"""
+query(
+    $owner: String!, $name: String!, $prNumber: Int!,
+    $withCommits: Boolean!, $withReviews: Boolean!, $withComments: Boolean!,
+    $withIssues: Boolean!, $withIssueComments: Boolean!
+) {{
+    {GRAPHQL_RATE_LIMIT}
+    repository(owner: $owner, name: $name) {{
+        pullRequest(number: $prNumber) {{
+            commits(first: {GITHUB_MAX_PER_PAGE}) @include(if: $withCommits) {{
+                {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_COMMIT_NODE} }}
+            }}
+            reviews(first: {GITHUB_MAX_PER_PAGE}) @include(if: $withReviews) {{
+                {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_REVIEW_NODE} }}
+            }}
+            comments(first: {GITHUB_MAX_PER_PAGE}) @include(if: $withComments) {{
+                {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_COMMENT_NODE} }}
+            }}
+            closingIssuesReferences(first: {GITHUB_MAX_PER_PAGE}) @include(if: $withIssues) {{
+                {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_ISSUE_NODE} }}
+            }}
+        }}
+    }}
+}}
+"""
+
+# GraphQL rejects declared but unused variables, so `$withIssueComments` is only
+# declared for the connections whose nodes use it. A null cursor fetches the first page.
+PR_CONNECTION_PAGE_GRAPHQL_QUERY = """
+query(
+    $owner: String!, $name: String!, $prNumber: Int!, $cursor: String{extra_variables}
+) {{
+    {rate_limit}
+    repository(owner: $owner, name: $name) {{
+        pullRequest(number: $prNumber) {{
+            {connection}(first: {first}, after: $cursor) {{
+                {page_info} nodes {{ {node} }}
+            }}
+        }}
+    }}
+}}
+"""
+
+ISSUE_COMMENTS_PAGE_GRAPHQL_QUERY = f"""
+query($owner: String!, $name: String!, $issueNumber: Int!, $cursor: String!) {{
+    {GRAPHQL_RATE_LIMIT}
+    repository(owner: $owner, name: $name) {{
+        issue(number: $issueNumber) {{
+            comments(first: {GITHUB_MAX_PER_PAGE}, after: $cursor) {{
+                {GRAPHQL_PAGE_INFO} nodes {{ {GRAPHQL_COMMENT_NODE} }}
+            }}
+        }}
+    }}
+}}
+"""
 
 logger = logging.getLogger(__name__)
 
 class GitHubPullRequestManager(GitHubManager):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        event: dict | None = None,
+        shared_github_manager: GitHubManager | None = None,
+        repo: str | None = None,
+    ):
+        super().__init__(
+            event=event, shared_github_manager=shared_github_manager, repo=repo
+        )
+        # API results shared by the collectors and the skip command scan within this run
+        self.request_memo = RequestMemo()
+        # contributors are created once per identity and shared across collectors,
+        # and across the pull requests that share a GitHub pull request manager
+        self.contributor_registry = (
+            shared_github_manager.contributor_registry
+            if isinstance(shared_github_manager, GitHubPullRequestManager)
+            else ContributorRegistry(github_manager=self)
+        )
+        self.collected_at: str = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # the state of the previous run, when running incrementally
+        self.incremental_state: dict | None = None
+        # contributions carried over from the previous run, which the collectors skip
+        self.known_contribution_ids: set[str] = set()
 
     def _load_from_environment_variables(self):
         super()._load_from_environment_variables()
@@ -53,6 +179,31 @@ class GitHubPullRequestManager(GitHubManager):
                 "BOT_BLACKLIST environment variable is empty. Please set it to a comma-separated list of bot usernames."
             )
 
+        # only PR comments posted by this account are treated as comments of this action
+        self.pr_comment_author: str = (
+            os.environ.get("PR_COMMENT_AUTHOR", "").strip() or DEFAULT_GITHUB_ACTION_BOT
+        )
+
+        self.collection_backend: str = (
+            os.environ.get("COLLECTION_BACKEND", "rest").strip().casefold()
+        )
+        if self.collection_backend not in COLLECTION_BACKENDS:
+            raise Exception(
+                f"Invalid COLLECTION_BACKEND environment variable: `{self.collection_backend}`. Must be one of: {', '.join(COLLECTION_BACKENDS)}."
+            )
+
+        self.commit_source: str = (
+            os.environ.get("COMMIT_SOURCE", "api").strip().casefold()
+        )
+        if self.commit_source not in COMMIT_SOURCES:
+            raise Exception(
+                f"Invalid COMMIT_SOURCE environment variable: `{self.commit_source}`. Must be one of: {', '.join(COMMIT_SOURCES)}."
+            )
+        # the checkout that the `git` commit source reads from
+        self.git_workspace: Path | None = (
+            Path(os.environ["GITHUB_WORKSPACE"]) if os.environ.get("GITHUB_WORKSPACE") else None
+        )
+
     def _load_github_event(self, event: dict):
         super()._load_github_event(event=event)
         self.pr_number = str(event.get("number")) or str(event.get("pull_request", {}).get(
@@ -65,6 +216,10 @@ class GitHubPullRequestManager(GitHubManager):
             )
 
         if "pull_request" in event:
+            self.head_sha: str | None = (
+                event["pull_request"]["head"].get("sha") or self.event_after_sha
+            )
+            self.base_sha: str | None = event["pull_request"]["base"].get("sha")
             self.head_repo = event["pull_request"]["head"]["repo"]["full_name"]
             self.head_branch = event["pull_request"]["head"]["ref"]
             self.base_branch = event["pull_request"]["base"]["ref"]
@@ -74,37 +229,160 @@ class GitHubPullRequestManager(GitHubManager):
                 "GitHubPullRequestManager only supports pull_request events."
             )
 
+    def get_github_paginated(self, url: str, params: dict | None = None) -> list[dict]:
+        """
+        Fetch all items of a paginated GitHub resource once per run.
+        Later calls for the same URL and params return the memoized items.
+
+        Only resources with several consumers, like the PR comments and the PR commits,
+        are worth holding in memory. Collectors of the other resources stream them page
+        by page instead.
+        """
+        return self.request_memo.get(
+            key=("GET", url, tuple(sorted((params or {}).items()))),
+            fetch=lambda: list(self.iter_github_paginated(url=url, params=params)),
+        )
+
+    def _get_pr_commits_url(self) -> str:
+        return f"https://api.github.com/repos/{self.repo}/pulls/{self.pr_number}/commits"
+
+    def _get_pr_comments_url(self) -> str:
+        return f"https://api.github.com/repos/{self.repo}/issues/{self.pr_number}/comments"
+
+    def _get_issue_comments_since_params(self, issue_number: int) -> dict | None:
+        """
+        When running incrementally, only fetch the comments of an issue that were updated since
+        the previous run. All comments are fetched for an issue that was not linked back then.
+        """
+        if self.incremental_state and issue_number in self.incremental_state.get(
+            "linked_issue_numbers", []
+        ):
+            return {"since": self.incremental_state["collected_at"]}
+        return None
+
+    def _get_incremental_state_fingerprint(self) -> str:
+        """
+        The settings that the collected contributions depend on. A previous state that was
+        collected with different settings cannot be reused.
+        """
+        return json.dumps(
+            {
+                "version": self.github_action_version,
+                "flags": {
+                    flag: Flags.has(flag)
+                    for flag in (
+                        "authorship_for_pr_commits",
+                        "authorship_for_pr_reviews",
+                        "authorship_for_pr_issues",
+                        "authorship_for_pr_issue_comments",
+                        "authorship_for_pr_comments",
+                    )
+                },
+                "bot_blacklist": sorted(self.bot_blacklist),
+            },
+            sort_keys=True,
+        )
+
+    def load_incremental_state(self) -> ContributionManager | None:
+        """
+        Load the state that the previous run embedded in its PR comment.
+
+        Returns the contributions carried over from the previous run, or None if there is no
+        usable state and the run must collect everything. The collectors then skip every
+        carried-over contribution, so that only new contributors are enriched, and fetch
+        linked issue comments only since the previous run. Carried-over commits that are no
+        longer part of the pull request, e.g. after a force push, are dropped.
+        """
+        state: dict | None = None
+        previous_comment: dict | None = self.find_previous_pull_request_comment()
+        if previous_comment is not None:
+            state = decode_incremental_state(comment_body=previous_comment.get("body") or "")
+
+        if state is None:
+            logger.debug("No incremental state from a previous run: collecting all contributions.")
+            return None
+        if state.get("fingerprint") != self._get_incremental_state_fingerprint():
+            logger.debug("The settings changed since the previous run: collecting all contributions.")
+            return None
+
+        try:
+            previous_contribution_manager = deserialize_contribution_manager(data=state)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.debug(f"Cannot restore the previous run: {e}. Collecting all contributions.")
+            return None
+
+        contribution_manager = ContributionManager()
+        pr_commit_shas: set[str] | None = None
+        if state["head_sha"] != self.head_sha and Flags.has("authorship_for_pr_commits"):
+            # the commits collector reuses the memoized commits
+            pr_commit_shas = {
+                commit["sha"] for commit in self.get_github_paginated(url=self._get_pr_commits_url())
+            }
+        for contributor in previous_contribution_manager.contributors:
+            for contribution in previous_contribution_manager.get_contributions_for(contributor):
+                if (
+                    pr_commit_shas is not None
+                    and isinstance(contribution, GitHubPullRequestCommitContribution)
+                    and contribution.sha not in pr_commit_shas
+                ):
+                    continue
+                contribution_manager.add_contribution(contribution, contributor)
+                self.known_contribution_ids.add(contribution.id)
+
+        self.incremental_state = state
+        logger.debug(
+            f"Carried over {len(self.known_contribution_ids)} contribution(s) from the run at {state['collected_at']} for commit {state['head_sha']}."
+        )
+        return contribution_manager
+
+    def create_incremental_state(self, contribution_manager: ContributionManager) -> str:
+        """
+        Create the state to embed in the PR comment for the next incremental run,
+        or an empty string if incremental collection is disabled.
+        """
+        if not Flags.has("incremental_collection"):
+            return ""
+        state: dict = {
+            "version": INCREMENTAL_STATE_VERSION,
+            "fingerprint": self._get_incremental_state_fingerprint(),
+            "head_sha": self.head_sha,
+            "collected_at": self.collected_at,
+            "linked_issue_numbers": (
+                [issue["number"] for issue in self.get_linked_issues_graphql()]
+                if Flags.has("authorship_for_pr_issue_comments")
+                and self.collection_backend == "rest"
+                else []
+            ),
+            **serialize_contribution_manager(contribution_manager=contribution_manager),
+        }
+        return encode_incremental_state(state=state) or ""
+
     def collect_contributors_for_pr_reviews(self) -> ContributionManager:
         contribution_manager = ContributionManager()
 
         # PR Reviews
         if Flags.has("authorship_for_pr_reviews"):
 
-            token = self.github_token
             repo = self.repo
             pr_number = self.pr_number
-            bot_blacklist = self.bot_blacklist
-
-            session: requests.Session = self.get_github_session(token=token)
 
             reviews_url = (
                 f"https://api.github.com/repos/{repo}/pulls/{pr_number}/reviews"
             )
-            for review in session.get(reviews_url).json():
-                github_username = review.get("user", {}).get("login")
-                url = review.get("html_url")
-                created_at_str = review.get("submitted_at")
-                created_at = (
-                    datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
-                    if created_at_str
-                    else datetime.min
+            for reviews in self.iter_github_paginated_pages(url=reviews_url):
+                self.prefetch_github_user_profiles(
+                    github_usernames=[(review.get("user") or {}).get("login") for review in reviews]
                 )
-                if github_username and github_username not in bot_blacklist:
-                    contributor = GitHubContributor(github_username=github_username, github_manager=self)
+                for review in reviews:
                     contribution = GitHubPullRequestReviewContribution(
-                        id=url, created_at=created_at
+                        id=review.get("html_url"),
+                        created_at=parse_github_datetime(review.get("submitted_at")),
+                    )
+                    self._add_github_user_contribution(
+                        contribution_manager=contribution_manager,
+                        github_username=(review.get("user") or {}).get("login"),
+                        contribution=contribution,
                     )
-                    contribution_manager.add_contribution(contribution, contributor)
 
         return contribution_manager
 
@@ -113,31 +391,26 @@ class GitHubPullRequestManager(GitHubManager):
 
         # PR Comments
         if Flags.has("authorship_for_pr_comments"):
-            token = self.github_token
             repo = self.repo
             pr_number = self.pr_number
-            bot_blacklist = self.bot_blacklist
-
-            session: requests.Session = self.get_github_session(token=token)
 
             comments_url = (
                 f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
             )
-            for comment in session.get(comments_url).json():
-                github_username = comment.get("user", {}).get("login")
-                url = comment.get("html_url")
-                created_at_str = comment.get("created_at")
-                created_at = (
-                    datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
-                    if created_at_str
-                    else datetime.min
+            comments = self.get_github_paginated(url=comments_url)
+            self.prefetch_github_user_profiles(
+                github_usernames=[(comment.get("user") or {}).get("login") for comment in comments]
+            )
+            for comment in comments:
+                contribution = GitHubPullRequestCommentContribution(
+                    id=comment.get("html_url"),
+                    created_at=parse_github_datetime(comment.get("created_at")),
+                )
+                self._add_github_user_contribution(
+                    contribution_manager=contribution_manager,
+                    github_username=(comment.get("user") or {}).get("login"),
+                    contribution=contribution,
                 )
-                if github_username and github_username not in bot_blacklist:
-                    contributor = GitHubContributor(github_username=github_username, github_manager=self)
-                    contribution = GitHubPullRequestCommentContribution(
-                        id=url, created_at=created_at
-                    )
-                    contribution_manager.add_contribution(contribution, contributor)
 
         return contribution_manager
 
@@ -182,27 +455,18 @@ class GitHubPullRequestManager(GitHubManager):
 
         if Flags.has("authorship_for_pr_issues"):
 
-            bot_blacklist = self.bot_blacklist
-
             linked_issues = self.get_linked_issues_graphql()
+            self.prefetch_github_user_profiles(
+                github_usernames=[self._get_graphql_node_github_username(issue) for issue in linked_issues]
+            )
 
             for issue in linked_issues:
-                github_username = issue["author"]["login"] if issue["author"] else None
-                url = issue["url"]
-                created_at_str = issue["createdAt"]
-                created_at = (
-                    datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
-                    if created_at_str
-                    else datetime.min
+                self._add_graphql_node_contribution(
+                    contribution_manager=contribution_manager,
+                    node=issue,
+                    contribution_class=GitHubPullRequestIssueContribution,
                 )
 
-                if github_username and github_username not in bot_blacklist:
-                    contributor = GitHubContributor(github_username=github_username, github_manager=self)
-                    contribution = GitHubPullRequestIssueContribution(
-                        id=url, created_at=created_at
-                    )
-                    contribution_manager.add_contribution(contribution, contributor)
-
         return contribution_manager
 
 
@@ -248,11 +512,7 @@ class GitHubPullRequestManager(GitHubManager):
 
         if Flags.has("authorship_for_pr_issue_comments"):
 
-            token = self.github_token
             repo = self.repo
-            bot_blacklist = self.bot_blacklist
-
-            session: requests.Session = self.get_github_session(token=token)
 
             linked_issues = self.get_linked_issues_graphql()
 
@@ -260,74 +520,44 @@ class GitHubPullRequestManager(GitHubManager):
                 issue_number = issue["number"]
 
                 comments_url = f"https://api.github.com/repos/{repo}/issues/{issue_number}/comments"
-                response = session.get(comments_url)
-                response.raise_for_status()
-
-                comments = response.json()
-                for comment in comments:
-                    github_username = comment.get("user", {}).get("login")
-                    url = comment.get("html_url")
-                    created_at_str = comment.get("created_at")
-                    created_at = (
-                        datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
-                        if created_at_str
-                        else datetime.min
+                for comments in self.iter_github_paginated_pages(
+                    url=comments_url,
+                    params=self._get_issue_comments_since_params(issue_number=issue_number),
+                ):
+                    self.prefetch_github_user_profiles(
+                        github_usernames=[(comment.get("user") or {}).get("login") for comment in comments]
                     )
-                    if github_username and github_username not in bot_blacklist:
-                        contributor = GitHubContributor(github_username=github_username, github_manager=self)
+                    for comment in comments:
                         contribution = GitHubPullRequestIssueCommentContribution(
-                            id=url, created_at=created_at
+                            id=comment.get("html_url"),
+                            created_at=parse_github_datetime(comment.get("created_at")),
+                        )
+                        self._add_github_user_contribution(
+                            contribution_manager=contribution_manager,
+                            github_username=(comment.get("user") or {}).get("login"),
+                            contribution=contribution,
                         )
-                        contribution_manager.add_contribution(contribution, contributor)
 
         return contribution_manager
 
     
     def get_linked_issues_graphql(self) -> list[dict]:
-        token = self.github_token
-        repo_owner, repo_name = self.repo.split("/")
-        pr_number = int(self.pr_number)
-
-        url = "https://api.github.com/graphql"
-        headers = {
-            "Authorization": f"bearer {token}",
-            "Accept": "application/vnd.github+json",
-        }
+        return self.request_memo.get(
+            key=("GRAPHQL", "closingIssuesReferences", self.repo, self.pr_number),
+            fetch=self._fetch_linked_issues_graphql,
+        )
 
-        query = """
-        query($owner: String!, $name: String!, $prNumber: Int!) {
-        repository(owner: $owner, name: $name) {
-            pullRequest(number: $prNumber) {
-            closingIssuesReferences(first: 50) {
-                nodes {
-                number
-                url
-                author {
-                    login
-                }
-                createdAt
-                }
-            }
-            }
-        }
-        }
+    def _fetch_linked_issues_graphql(self) -> list[dict]:
+        """
+        Fetch all issues that the pull request closes, page by page.
         """
 
-        variables = {
-            "owner": repo_owner,
-            "name": repo_name,
-            "prNumber": pr_number,
-        }
-
-        response = requests.post(
-            url, json={"query": query, "variables": variables}, headers=headers
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        issues = data.get("data", {}).get("repository", {}).get("pullRequest", {}).get("closingIssuesReferences", {}).get("nodes", [])
+        def fetch_page(cursor: str | None) -> dict:
+            return self._fetch_pr_connection_page(
+                connection_name="closingIssuesReferences", node=GRAPHQL_LINKED_ISSUE_NODE, cursor=cursor
+            )
 
-        return issues
+        return list(self._iter_graphql_connection(connection=fetch_page(None), fetch_page=fetch_page))
 
 
     def collect_contributors_for_pr_commits(self) -> ContributionManager:
@@ -335,77 +565,381 @@ class GitHubPullRequestManager(GitHubManager):
 
         if Flags.has("authorship_for_pr_commits"):
 
-            token = self.github_token
-            repo = self.repo
-            pr_number = self.pr_number
-            bot_blacklist = self.bot_blacklist
+            if self.incremental_state and self.incremental_state["head_sha"] == self.head_sha:
+                # no new commits since the previous run
+                return contribution_manager
 
-            session: requests.Session = self.get_github_session(token=token)
+            if self.commit_source == "git":
+                git_contribution_manager: ContributionManager | None = (
+                    self._collect_contributors_for_pr_commits_from_git()
+                )
+                if git_contribution_manager is not None:
+                    return git_contribution_manager
+
+            # the API lists at most 250 commits, which the incremental state check may have fetched
+            pr_commits: list[dict] = self.get_github_paginated(url=self._get_pr_commits_url())
+            for start in range(0, len(pr_commits), GITHUB_MAX_PER_PAGE):
+                commits: list[dict] = pr_commits[start : start + GITHUB_MAX_PER_PAGE]
+                self.prefetch_github_user_profiles(
+                    github_usernames=[(c.get("author") or {}).get("login") for c in commits]
+                )
 
-            url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/commits"
-            r = session.get(url)
-            r.raise_for_status()
-            commits = r.json()
+                for c in commits:
+                    commit_data = c.get("commit") or {}
+                    commit_author_data = commit_data.get("author") or {}
+                    self._add_commit_contributions(
+                        contribution_manager=contribution_manager,
+                        sha=c.get("sha"),
+                        commit_date=parse_github_datetime(commit_author_data.get("date")),
+                        github_username=(c.get("author") or {}).get("login"),
+                        git_name=commit_author_data.get("name"),
+                        git_email=commit_author_data.get("email"),
+                        message=commit_data.get("message") or "",
+                    )
 
-            # Regex to match co-authors in commit messages
-            coauthor_regex = regex.compile(
-                r"^Co-authored-by:\s*(?P<name>.+?)\s*<(?P<email>[^<>@\s]+@[^<>@\s]+\.[^<>@\s]+)>\s*$",
-                flags=regex.IGNORECASE | regex.UNICODE
-)
+        return contribution_manager
 
-            for c in commits:
-                sha = c.get("sha")
-                commit_author_data = c.get("commit", {}).get("author", {})
-                github_author = c.get("author")
+    def _collect_contributors_for_pr_commits_from_git(self) -> ContributionManager | None:
+        """
+        Collect the commit authors and co-authors from `git log base..head` of the local
+        checkout instead of the API. This needs no requests and is not limited to the
+        250 commits that the API returns.
+
+        The local log does not link commits to GitHub accounts, so only commits with a
+        GitHub noreply email are attributed to a GitHub user. Returns None if the log
+        cannot be read, e.g. in a shallow clone, so that the API is used instead.
+        """
+        if not self.base_sha or not self.head_sha:
+            logger.warning("Cannot read commits with git: the event lacks the base or head commit. Using the GitHub API.")
+            return None
 
-                commit_date_str = commit_author_data.get("date")
-                commit_date = (
-                    datetime.strptime(commit_date_str, "%Y-%m-%dT%H:%M:%SZ")
-                    if commit_date_str
-                    else datetime.min
+        commits: Iterator[dict] = iter_git_log_commits(
+            base_sha=self.base_sha, head_sha=self.head_sha, cwd=self.git_workspace
+        )
+        contribution_manager = ContributionManager()
+        try:
+            # the log is read lazily, and the profiles are prefetched for a batch at a time
+            while batch := list(islice(commits, GITHUB_MAX_PER_PAGE)):
+                for commit in batch:
+                    commit["github_username"] = parse_github_username_from_github_noreply_email(commit["email"])
+                self.prefetch_github_user_profiles(
+                    github_usernames=[commit["github_username"] for commit in batch]
                 )
+                for commit in batch:
+                    self._add_commit_contributions(
+                        contribution_manager=contribution_manager,
+                        sha=commit["sha"],
+                        commit_date=parse_github_datetime(commit["date"]),
+                        github_username=commit["github_username"],
+                        git_name=commit["name"],
+                        git_email=commit["email"],
+                        message=commit["message"],
+                    )
+        except GitLogError as e:
+            logger.warning(f"Cannot read commits with git: {e}. Using the GitHub API.")
+            return None
+        return contribution_manager
 
-                if github_author and github_author.get("login"):
-                    username = github_author["login"]
-                    if username not in bot_blacklist:
-                        contributor = GitHubContributor(github_username=username, github_manager=self)
-                        contribution = GitHubPullRequestCommitContribution(
-                            sha=sha, created_at=commit_date
-                        )
-                        contribution_manager.add_contribution(contribution, contributor)
-                elif commit_author_data:
-                    name = commit_author_data.get("name")
-                    logger.debug(f'commit author name: {name}')
-                    if name in bot_blacklist:
-                        continue
-                    email = commit_author_data.get("email")
-                    logger.debug(f'commit author email: {email}')
-                    if name or email:
-                        contributor = GitCommitContributor(
-                            git_name=name.strip(), git_email=email.strip(), orcid_manager=self.orcid_manager
-                        )
-                        contribution = GitHubPullRequestCommitContribution(
-                            sha=sha, created_at=commit_date
+    def _add_github_user_contribution(
+        self,
+        contribution_manager: ContributionManager,
+        github_username: str | None,
+        contribution: Contribution,
+    ):
+        if contribution.id in self.known_contribution_ids:
+            # carried over from the previous run
+            return
+        if github_username and github_username not in self.bot_blacklist:
+            contributor = self.contributor_registry.get_github_contributor(github_username=github_username)
+            contribution_manager.add_contribution(contribution, contributor)
+
+    def _get_graphql_node_github_username(self, node: dict) -> str | None:
+        """
+        GraphQL returns bot logins without the `[bot]` suffix that the REST API uses.
+        """
+        author: dict = node.get("author") or {}
+        github_username: str | None = author.get("login")
+        if github_username and author.get("__typename") == "Bot":
+            github_username += "[bot]"
+        return github_username
+
+    def _add_graphql_node_contribution(
+        self,
+        contribution_manager: ContributionManager,
+        node: dict,
+        contribution_class: type[Contribution],
+        created_at_field: str = "createdAt",
+    ):
+        github_username: str | None = self._get_graphql_node_github_username(node)
+        contribution = contribution_class(
+            id=node["url"], created_at=parse_github_datetime(node.get(created_at_field))
+        )
+        self._add_github_user_contribution(
+            contribution_manager=contribution_manager,
+            github_username=github_username,
+            contribution=contribution,
+        )
+
+    def _add_commit_contributions(
+        self,
+        contribution_manager: ContributionManager,
+        sha: str,
+        commit_date: datetime,
+        github_username: str | None,
+        git_name: str | None,
+        git_email: str | None,
+        message: str,
+    ):
+        """
+        Add the author and the `Co-authored-by` co-authors of a single commit.
+        The author is a GitHub user when the commit is linked to a GitHub account,
+        and a raw git name and email otherwise.
+        """
+        bot_blacklist = self.bot_blacklist
+
+        if sha in self.known_contribution_ids:
+            # carried over from the previous run, including its co-authors
+            return
+
+        if github_username:
+            if github_username not in bot_blacklist:
+                contributor = self.contributor_registry.get_github_contributor(github_username=github_username)
+                contribution = GitHubPullRequestCommitContribution(
+                    sha=sha, created_at=commit_date
+                )
+                contribution_manager.add_contribution(contribution, contributor)
+        elif git_name or git_email:
+            logger.debug(f'commit author name: {git_name}')
+            if git_name in bot_blacklist:
+                # skip the whole commit, including its co-authors
+                return
+            logger.debug(f'commit author email: {git_email}')
+            contributor = self.contributor_registry.get_git_commit_contributor(
+                git_name=git_name or "", git_email=git_email or ""
+            )
+            contribution = GitHubPullRequestCommitContribution(
+                sha=sha, created_at=commit_date
+            )
+            contribution_manager.add_contribution(contribution, contributor)
+
+        # add coauthors
+        for line in message.splitlines():
+            match = COAUTHOR_REGEX.match(line.strip())
+            if match:
+                name = match.group("name")
+                email = match.group("email")
+                if name not in bot_blacklist:
+                    contributor = self.contributor_registry.get_git_commit_contributor(
+                        git_name=name, git_email=email
+                    )
+                    contribution = GitHubPullRequestCommitContribution(
+                        sha=sha, created_at=commit_date
+                    )
+                    contribution_manager.add_contribution(
+                        contribution, contributor
+                    )
+
+    def _iter_graphql_connection(
+        self, connection: dict | None, fetch_page: Callable[[str], dict]
+    ) -> Iterator[dict]:
+        """
+        Yield the nodes of a GraphQL connection, fetching further pages by cursor as needed.
+        """
+        while connection:
+            yield from connection.get("nodes") or []
+            page_info: dict = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                return
+            connection = fetch_page(page_info["endCursor"])
+
+    def _fetch_pr_connection_page(self, connection_name: str, node: str, cursor: str | None) -> dict:
+        repo_owner, repo_name = self.repo.split("/")
+        variables: dict = {
+            "owner": repo_owner,
+            "name": repo_name,
+            "prNumber": int(self.pr_number),
+            "cursor": cursor,
+        }
+        extra_variables: str = ""
+        if "$withIssueComments" in node:
+            extra_variables = ", $withIssueComments: Boolean!"
+            variables["withIssueComments"] = Flags.has("authorship_for_pr_issue_comments")
+
+        query = PR_CONNECTION_PAGE_GRAPHQL_QUERY.format(
+            extra_variables=extra_variables,
+            rate_limit=GRAPHQL_RATE_LIMIT,
+            connection=connection_name,
+            first=GITHUB_MAX_PER_PAGE,
+            page_info=GRAPHQL_PAGE_INFO,
+            node=node,
+        )
+        data = self.post_github_graphql(query=query, variables=variables)
+        return ((data.get("repository") or {}).get("pullRequest") or {}).get(connection_name) or {}
+
+    def _fetch_issue_comments_page(self, issue_number: int, cursor: str) -> dict:
+        repo_owner, repo_name = self.repo.split("/")
+        data = self.post_github_graphql(
+            query=ISSUE_COMMENTS_PAGE_GRAPHQL_QUERY,
+            variables={
+                "owner": repo_owner,
+                "name": repo_name,
+                "issueNumber": issue_number,
+                "cursor": cursor,
+            },
+        )
+        return ((data.get("repository") or {}).get("issue") or {}).get("comments") or {}
+
+    def collect_contributors_for_pr_graphql(self) -> ContributionManager:
+        """
+        Collect commits, reviews, PR comments, linked issues, and linked issue comments
+        with a single cursor-paginated GraphQL query instead of one REST call per resource.
+
+        Follow-up queries are only made for connections that have more than one page.
+        The per-category results are merged in the same order as the REST collectors,
+        so the resulting ContributionManager matches the REST backend.
+        """
+        with_issue_comments: bool = Flags.has("authorship_for_pr_issue_comments")
+        with_issues: bool = Flags.has("authorship_for_pr_issues")
+
+        # commits read from the local checkout are left out of the query
+        git_commit_contribution_manager: ContributionManager | None = None
+        if Flags.has("authorship_for_pr_commits") and self.commit_source == "git":
+            git_commit_contribution_manager = self._collect_contributors_for_pr_commits_from_git()
+
+        repo_owner, repo_name = self.repo.split("/")
+        data = self.post_github_graphql(
+            query=PR_CONTRIBUTIONS_GRAPHQL_QUERY,
+            variables={
+                "owner": repo_owner,
+                "name": repo_name,
+                "prNumber": int(self.pr_number),
+                "withCommits": Flags.has("authorship_for_pr_commits")
+                and git_commit_contribution_manager is None,
+                "withReviews": Flags.has("authorship_for_pr_reviews"),
+                "withComments": Flags.has("authorship_for_pr_comments"),
+                "withIssues": with_issues or with_issue_comments,
+                "withIssueComments": with_issue_comments,
+            },
+        )
+        pull_request: dict = (data.get("repository") or {}).get("pullRequest") or {}
+
+        commits: list[dict] = list(
+            self._iter_graphql_connection(
+                connection=pull_request.get("commits"),
+                fetch_page=lambda cursor: self._fetch_pr_connection_page(
+                    connection_name="commits", node=GRAPHQL_COMMIT_NODE, cursor=cursor
+                ),
+            )
+        )
+        reviews: list[dict] = list(
+            self._iter_graphql_connection(
+                connection=pull_request.get("reviews"),
+                fetch_page=lambda cursor: self._fetch_pr_connection_page(
+                    connection_name="reviews", node=GRAPHQL_REVIEW_NODE, cursor=cursor
+                ),
+            )
+        )
+        issues: list[dict] = list(
+            self._iter_graphql_connection(
+                connection=pull_request.get("closingIssuesReferences"),
+                fetch_page=lambda cursor: self._fetch_pr_connection_page(
+                    connection_name="closingIssuesReferences", node=GRAPHQL_ISSUE_NODE, cursor=cursor
+                ),
+            )
+        )
+        issue_comments_by_issue: list[list[dict]] = []
+        if with_issue_comments:
+            for issue in issues:
+                issue_number: int = issue["number"]
+                issue_comments_by_issue.append(
+                    list(
+                        self._iter_graphql_connection(
+                            connection=issue.get("comments"),
+                            fetch_page=lambda cursor, issue_number=issue_number: self._fetch_issue_comments_page(
+                                issue_number=issue_number, cursor=cursor
+                            ),
                         )
-                        contribution_manager.add_contribution(contribution, contributor)
-
-                # add coauthors
-                for line in c.get("commit", {}).get("message", "").splitlines():
-                    match = coauthor_regex.match(line.strip())
-                    if match:
-                        name = match.group("name")
-                        email = match.group("email")
-                        if name not in bot_blacklist:
-                            contributor = GitCommitContributor(
-                                git_name=name.strip(), git_email=email.strip(), orcid_manager=self.orcid_manager
-                            )
-                            contribution = GitHubPullRequestCommitContribution(
-                                sha=sha, created_at=commit_date
-                            )
-                            contribution_manager.add_contribution(
-                                contribution, contributor
-                            )
+                    )
+                )
+        comments: list[dict] = list(
+            self._iter_graphql_connection(
+                connection=pull_request.get("comments"),
+                fetch_page=lambda cursor: self._fetch_pr_connection_page(
+                    connection_name="comments", node=GRAPHQL_COMMENT_NODE, cursor=cursor
+                ),
+            )
+        )
+
+        # resolve the profiles of all participants in as few queries as possible
+        github_usernames: list[str | None] = [
+            (((commit_node.get("commit") or {}).get("author") or {}).get("user") or {}).get("login")
+            for commit_node in commits
+        ]
+        for node in [*reviews, *(issues if with_issues else []), *comments]:
+            github_usernames.append(self._get_graphql_node_github_username(node))
+        for issue_comments in issue_comments_by_issue:
+            github_usernames.extend(
+                self._get_graphql_node_github_username(node) for node in issue_comments
+            )
+        self.prefetch_github_user_profiles(github_usernames=github_usernames)
+
+        commit_contribution_manager = git_commit_contribution_manager or ContributionManager()
+        for commit_node in commits:
+            commit: dict = commit_node.get("commit") or {}
+            commit_author_data: dict = commit.get("author") or {}
+            self._add_commit_contributions(
+                contribution_manager=commit_contribution_manager,
+                sha=commit["oid"],
+                commit_date=parse_github_datetime(commit_author_data.get("date")),
+                github_username=(commit_author_data.get("user") or {}).get("login"),
+                git_name=commit_author_data.get("name"),
+                git_email=commit_author_data.get("email"),
+                message=commit.get("message") or "",
+            )
+
+        review_contribution_manager = ContributionManager()
+        for review in reviews:
+            self._add_graphql_node_contribution(
+                contribution_manager=review_contribution_manager,
+                node=review,
+                contribution_class=GitHubPullRequestReviewContribution,
+                created_at_field="submittedAt",
+            )
+
+        issue_contribution_manager = ContributionManager()
+        issue_comment_contribution_manager = ContributionManager()
+        if with_issues:
+            for issue in issues:
+                self._add_graphql_node_contribution(
+                    contribution_manager=issue_contribution_manager,
+                    node=issue,
+                    contribution_class=GitHubPullRequestIssueContribution,
+                )
+        for issue_comments in issue_comments_by_issue:
+            for issue_comment in issue_comments:
+                self._add_graphql_node_contribution(
+                    contribution_manager=issue_comment_contribution_manager,
+                    node=issue_comment,
+                    contribution_class=GitHubPullRequestIssueCommentContribution,
+                )
+
+        comment_contribution_manager = ContributionManager()
+        for comment in comments:
+            self._add_graphql_node_contribution(
+                contribution_manager=comment_contribution_manager,
+                node=comment,
+                contribution_class=GitHubPullRequestCommentContribution,
+            )
 
+        contribution_manager = ContributionManager()
+        for category_contribution_manager in (
+            commit_contribution_manager,
+            review_contribution_manager,
+            issue_contribution_manager,
+            issue_comment_contribution_manager,
+            comment_contribution_manager,
+        ):
+            contribution_manager.merge(category_contribution_manager)
         return contribution_manager
 
     def scan_pr_comments_for_skip_commands(self) -> dict[str, set[str]]:
@@ -420,17 +954,11 @@ class GitHubPullRequestManager(GitHubManager):
             "github-username": set(),
         }
         """
-        token = self.github_token
         repo = self.repo
         pr_number = self.pr_number
 
-        session: requests.Session = self.get_github_session(token=token)
-
         comments_url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
-        response = session.get(comments_url)
-        response.raise_for_status()
-
-        comments = response.json()
+        comments = self.get_github_paginated(url=comments_url)
 
         # Initialize state tracking — value → skip=True/False
         skip_state = {
@@ -537,22 +1065,71 @@ class GitHubPullRequestManager(GitHubManager):
         return False
 
 
+    def is_own_pull_request_comment(self, comment: dict) -> bool:
+        """
+        Return whether a PR comment was posted by this action: it has the marker and
+        its author is the account of this action. Anyone can quote the marker, so
+        comments of other users are never trusted or edited.
+        """
+        author_login: str = (comment.get("user") or {}).get("login") or ""
+        return (
+            PR_COMMENT_MARKER in (comment.get("body") or "")
+            and author_login.casefold() == self.pr_comment_author.casefold()
+        )
+
+    def find_previous_pull_request_comment(self) -> dict | None:
+        """
+        Find the most recent PR comment that this action posted.
+        """
+        for comment in reversed(self.get_github_paginated(url=self._get_pr_comments_url())):
+            if self.is_own_pull_request_comment(comment=comment):
+                return comment
+        return None
+
+    @staticmethod
+    def get_pull_request_comment_content_hash(comment_body: str) -> str:
+        """
+        Hash the content of a PR comment, ignoring its timestamp footer and the time at which
+        its incremental state was collected. The rest of the state is part of the content, so
+        a comment with stale state is always updated.
+        """
+        content: str = normalize_incremental_state(
+            comment_body=PR_COMMENT_FOOTER_REGEX.sub("", comment_body)
+        ).strip()
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     def post_pull_request_comment(self, comment_body: str):
+        """
+        Post the review as a PR comment. The previous comment of this action is edited in place
+        instead, and left untouched if its content has not changed.
+        """
         if Flags.has("post_pr_comment"):
-            token = self.github_token
             repo = self.repo
             pr_number = self.pr_number
 
-            headers = {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github+json",
-            }
             comments_url = (
                 f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
             )
 
             payload = {"body": comment_body}
-            resp: requests.Response = requests.post(
-                comments_url, headers=headers, json=payload
-            )
+            previous_comment: dict | None = self.find_previous_pull_request_comment()
+            if previous_comment is None:
+                resp: requests.Response = self.github_request(
+                    "POST", comments_url, json=payload
+                )
+            elif self.get_pull_request_comment_content_hash(
+                previous_comment.get("body") or ""
+            ) == self.get_pull_request_comment_content_hash(comment_body):
+                logger.debug(
+                    f"The PR comment {previous_comment.get('html_url')} is unchanged. Skipping the update."
+                )
+                return
+            else:
+                resp = self.github_request(
+                    "PATCH",
+                    f"https://api.github.com/repos/{repo}/issues/comments/{previous_comment['id']}",
+                    json=payload,
+                )
             resp.raise_for_status()
+            # the comment thread changed, so memoized results are stale
+            self.request_memo.clear()
@@ -6,8 +6,13 @@ import regex
 import requests
 from bs4 import BeautifulSoup, Tag
 
+from cff_author_updater.http_client import HttpClient
+
 logger = logging.getLogger(__name__)
 
+# the GitHub profile page is streamed in chunks of this size until the vcard section is complete
+SCRAPE_CHUNK_SIZE = 16 * 1024
+
 
 class OrcidManager:
 
@@ -25,12 +30,14 @@ class OrcidManager:
 
 
     SCRAPE_ORCID_BADGE_PATTERN = regex.compile(r"vcard-details", flags=regex.UNICODE)
+    SCRAPE_ORCID_BADGE_MARKER = b"vcard-details"
 
     ORCID_ID_FOR_VALIDATE_PATTERN = regex.compile(r"^(?P<orcid_id>\d{4}-\d{4}-\d{4}-\d{3}[\dX])$", flags=regex.UNICODE)
 
 
-    def __init__(self):
+    def __init__(self, http_client: HttpClient | None = None):
         self.user_agent = "cff-author-updater"
+        self.http_client: HttpClient = http_client or HttpClient(user_agent=self.user_agent)
 
     @staticmethod
     def extract_orcid(text: str, find_url: bool = True, return_url: bool = True):
@@ -55,18 +62,69 @@ class OrcidManager:
         return orcid_id
 
 
+    @staticmethod
+    def get_orcid_from_social_accounts(social_accounts: list[str]) -> str | None:
+        """Return the ORCID linked as a social account on a GitHub profile, i.e. its ORCID badge."""
+        for social_account in social_accounts:
+            match = OrcidManager.ORCID_URL_PATTERN.match(social_account.strip())
+            if match:
+                return f"https://orcid.org/{match.group('orcid_id')}"
+        return None
+
+    def _stream_github_profile_vcard_details(self, response: requests.Response) -> str | None:
+        """
+        Read the profile page only until the `vcard-details` list is complete and return that list.
+        Returns None if the page has no `vcard-details` list.
+        """
+        buffer = bytearray()
+        search_start = 0
+        section_start: int | None = None
+
+        for chunk in response.iter_content(chunk_size=SCRAPE_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if section_start is None:
+                marker = buffer.find(OrcidManager.SCRAPE_ORCID_BADGE_MARKER, search_start)
+                if marker == -1:
+                    # keep a little overlap in case the marker spans two chunks
+                    search_start = max(len(buffer) - len(OrcidManager.SCRAPE_ORCID_BADGE_MARKER), 0)
+                    continue
+                section_start = buffer.rfind(b"<ul", 0, marker)
+                if section_start == -1:
+                    section_start = marker
+                search_start = marker
+
+            section_end = buffer.find(b"</ul>", search_start)
+            if section_end != -1:
+                section: bytes = bytes(buffer[section_start : section_end + len(b"</ul>")])
+                return section.decode(response.encoding or "utf-8", errors="replace")
+            search_start = max(len(buffer) - len(b"</ul>"), section_start)
+
+        if section_start is not None:
+            # the page ended inside the section; parse what we have
+            return bytes(buffer[section_start:]).decode(response.encoding or "utf-8", errors="replace")
+        return None
+
     @lru_cache(maxsize=None, typed=True)
     def scrape_orcid_from_github_profile(self, github_username: str) -> str | None:
-        """Scrape linked ORCID badge from GitHub profile using BeautifulSoup."""
+        """
+        Scrape linked ORCID badge from GitHub profile using BeautifulSoup.
+
+        The page is streamed and only the `vcard-details` list is parsed, so the rest of the
+        page is neither downloaded nor parsed once the list has been seen.
+        """
         url = f"https://github.com/{github_username}"
         headers = {
             "User-Agent": self.user_agent
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            html = response.text
+            with self.http_client.get(url, headers=headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                html = self._stream_github_profile_vcard_details(response=response)
+
+            if html is None:
+                logger.info(f"No vcard-details section found for @{github_username}")
+                return None
 
             soup = BeautifulSoup(html, "html.parser")
 
@@ -120,7 +178,7 @@ class OrcidManager:
         headers = {"Accept": "application/json"}
 
         try:
-            resp = requests.get(url, headers=headers, timeout=5)
+            resp = self.http_client.get(url, headers=headers, timeout=5)
             return resp.status_code == 200
         except Exception:
             return False
@@ -164,7 +222,7 @@ class OrcidManager:
         orcids: list[str] = []
 
         try:
-            resp: requests.Response = requests.get(url, headers=headers, timeout=10)
+            resp: requests.Response = self.http_client.get(url, headers=headers, timeout=10)
             resp.raise_for_status()
             results = resp.json()
             if "result" in results and results["result"]:
@@ -216,7 +274,7 @@ class OrcidManager:
         headers: dict = {"Accept": "application/vnd.orcid+json"}
         url = f"https://pub.orcid.org/v3.0/{orcid_id}/personal-details"
         try:
-            resp: requests.Response = requests.get(url, headers=headers, timeout=10)
+            resp: requests.Response = self.http_client.get(url, headers=headers, timeout=10)
             resp.raise_for_status()
             details = resp.json()
             names: list[str] = []
@@ -2,8 +2,20 @@ from collections import OrderedDict
 
 import yaml
 
+# use the C-accelerated libyaml parser and emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper  # type: ignore
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore
 
-class OrderedYamlLoader(yaml.SafeLoader):
+
+class OrderedYamlLoader(YamlSafeLoader):
+    pass
+
+
+class OrderedYamlDumper(YamlSafeDumper):
     pass
 
 
@@ -16,3 +28,10 @@ OrderedYamlLoader.add_constructor(
     yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
     _construct_mapping,
 )
+
+
+def dump_yaml(data) -> str:
+    """
+    Serialize the data to YAML, keeping the key order.
+    """
+    return yaml.dump(data, Dumper=OrderedYamlDumper, sort_keys=False)
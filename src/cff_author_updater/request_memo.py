@@ -0,0 +1,46 @@
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestMemo:
+    """
+    A run-scoped memo of API results, keyed by request identity.
+
+    Concurrent callers asking for the same key share a single fetch: the first caller
+    fetches while the others wait for its result. A failed fetch is not memoized.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: dict[Hashable, object] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]  # type: ignore
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._results:
+                    # another caller fetched it while we were waiting
+                    self.hits += 1
+                    return self._results[key]  # type: ignore
+                self.misses += 1
+
+            result = fetch()
+
+            with self._lock:
+                self._results[key] = result
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._key_locks.clear()
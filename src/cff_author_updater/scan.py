@@ -0,0 +1,265 @@
+import json
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from cff_author_updater.backfill import (
+    DEFAULT_BACKFILL_MAX_WORKERS,
+    append_missing_cff_authors,
+    collect_pull_request_contributions,
+    create_cff_authors,
+    create_pull_request_managers,
+    list_merged_pull_requests,
+)
+from cff_author_updater.cff_file import CffFile, CffFileValidationError
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.managers.cff_manager import CffManager
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.managers.github_manager import GitHubManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    GitHubPullRequestManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def list_organization_repos(github_manager: GitHubManager, org: str) -> list[str]:
+    """
+    List the full names of the repositories of an organization that are not archived.
+    """
+    return [
+        repo["full_name"]
+        for repo in github_manager.iter_github_paginated(
+            url=f"https://api.github.com/orgs/{org}/repos", params={"type": "all"}
+        )
+        if not repo.get("archived") and not repo.get("disabled")
+    ]
+
+
+def list_open_pull_requests(github_manager: GitHubManager, repo: str) -> list[dict]:
+    return list(
+        github_manager.iter_github_paginated(
+            url=f"https://api.github.com/repos/{repo}/pulls",
+            params={"state": "open", "sort": "created", "direction": "asc"},
+        )
+    )
+
+
+def get_repository_file(github_manager: GitHubManager, repo: str, path: str) -> bytes | None:
+    """
+    Return the content of a file on the default branch of a repository, or None if
+    the repository has no such file.
+    """
+    response = github_manager.github_request(
+        "GET",
+        f"https://api.github.com/repos/{repo}/contents/{path}",
+        headers={"Accept": "application/vnd.github.raw+json"},
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.content
+
+
+def create_identity_table(
+    contribution_managers: dict[str, ColumnarContributionManager],
+) -> list[dict]:
+    """
+    List each distinct contributor of the scan once, with the repositories that they
+    contributed to, in the order in which they were first seen.
+    """
+    repos_by_contributor: dict[Contributor, list[str]] = {}
+    for repo, contribution_manager in contribution_managers.items():
+        for contributor in contribution_manager.contributors_sorted_by_first_contribution:
+            repos_by_contributor.setdefault(contributor, []).append(repo)
+    return [
+        {"contributor": contributor.to_dict(), "repos": repos}
+        for contributor, repos in repos_by_contributor.items()
+    ]
+
+
+def process_repository_cff(
+    report: dict,
+    cff_content: bytes | None,
+    cff_file_name: str,
+    cff_authors_data: list[dict],
+    repo_output_dir: Path,
+) -> dict:
+    """
+    Append the missing authors to the CFF file of a repository, and write the suggested
+    CFF file and the report of the repository.
+
+    It runs in a worker process, so it only takes and returns plain data. Returns a
+    summary of the repository.
+    """
+    repo_output_dir.mkdir(parents=True, exist_ok=True)
+    new_cff_authors: list[CffAuthorContributor] = []
+    cff_validation_errors: list[str] = []
+    if cff_content is not None:
+        cff_path = repo_output_dir / cff_file_name
+        cff_path.write_bytes(cff_content)
+        cff_file = CffFile(cff_path=cff_path, validate=False)
+        new_cff_authors = append_missing_cff_authors(
+            cff_file=cff_file,
+            cff_authors=[
+                CffAuthorContributor(cff_author_data=cff_author_data)
+                for cff_author_data in cff_authors_data
+            ],
+        )
+        try:
+            cff_file.save()
+        except CffFileValidationError as e:
+            cff_validation_errors = e.cffconvert_validation_errors
+
+    report = {
+        **report,
+        "has_cff": cff_content is not None,
+        "cff_validation_errors": cff_validation_errors,
+        "new_authors": [new_cff_author.cff_author_data for new_cff_author in new_cff_authors],
+    }
+    with open(repo_output_dir / "report.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    return {
+        "repo": report["repo"],
+        "has_cff": cff_content is not None,
+        "is_valid_cff": len(cff_validation_errors) == 0,
+        "new_author_count": len(new_cff_authors),
+    }
+
+
+def run_scan(
+    repos: list[str],
+    cff_path: str,
+    output_dir: Path,
+    org: str | None = None,
+    since: date | None = None,
+    until: date | None = None,
+    from_number: int | None = None,
+    to_number: int | None = None,
+    max_workers: int = DEFAULT_BACKFILL_MAX_WORKERS,
+    max_processes: int | None = None,
+) -> bool:
+    """
+    Scan the open pull requests of many repositories, or their merged pull requests
+    within the ranges, and write a report and a suggested CFF file per repository and
+    a global identity table.
+
+    The pull requests of all repositories are collected in one thread pool, and their
+    managers share one contributor registry and one set of enrichment caches, so each
+    distinct person is looked up once for the whole scan. The CFF files are then
+    processed in a process pool. Returns whether every suggested CFF file is valid.
+    """
+    # the scan spans many repositories, and each pull request manager is given its own
+    github_manager = GitHubManager(event={}, repo="")
+    repos = list(repos)
+    if org:
+        repos += [
+            repo
+            for repo in list_organization_repos(github_manager=github_manager, org=org)
+            if repo not in repos
+        ]
+    is_history_scan: bool = any(
+        value is not None for value in (since, until, from_number, to_number)
+    )
+
+    shared_github_manager: GitHubManager = github_manager
+    github_pull_request_managers: list[GitHubPullRequestManager] = []
+    first_github_pull_request_managers: dict[str, GitHubPullRequestManager] = {}
+    for repo in repos:
+        if is_history_scan:
+            pull_requests: list[dict] = list_merged_pull_requests(
+                github_manager=github_manager,
+                repo=repo,
+                since=since,
+                until=until,
+                from_number=from_number,
+                to_number=to_number,
+            )
+        else:
+            pull_requests = list_open_pull_requests(github_manager=github_manager, repo=repo)
+        repo_github_pull_request_managers = create_pull_request_managers(
+            github_manager=shared_github_manager,
+            repo=repo,
+            pull_requests=pull_requests,
+        )
+        if repo_github_pull_request_managers:
+            first_github_pull_request_managers[repo] = repo_github_pull_request_managers[0]
+            if not isinstance(shared_github_manager, GitHubPullRequestManager):
+                shared_github_manager = repo_github_pull_request_managers[0]
+        github_pull_request_managers += repo_github_pull_request_managers
+    logger.info(
+        f"Scanning {len(github_pull_request_managers)} {'merged' if is_history_scan else 'open'} pull request(s) of {len(repos)} repositories."
+    )
+
+    contribution_managers = collect_pull_request_contributions(
+        github_pull_request_managers=github_pull_request_managers,
+        cff_path=Path(cff_path),
+        max_workers=max_workers,
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / "identities.json", "w", encoding="utf-8") as f:
+        json.dump(create_identity_table(contribution_managers=contribution_managers), f, indent=2)
+
+    is_valid_cff: bool = True
+    with ProcessPoolExecutor(max_workers=max_processes) as executor:
+        futures: dict[str, Future] = {}
+        for repo, contribution_manager in contribution_managers.items():
+            cff_manager = CffManager(
+                cff_path=Path(cff_path),
+                github_pull_request_manager=first_github_pull_request_managers[repo],
+            )
+            futures[repo] = executor.submit(
+                process_repository_cff,
+                report={
+                    "repo": repo,
+                    "pull_requests": [
+                        int(github_pull_request_manager.pr_number)
+                        for github_pull_request_manager in github_pull_request_managers
+                        if github_pull_request_manager.repo == repo
+                    ],
+                    "contributors": contribution_manager.to_dict(),
+                },
+                cff_content=get_repository_file(
+                    github_manager=github_manager, repo=repo, path=cff_path
+                ),
+                cff_file_name=Path(cff_path).name,
+                cff_authors_data=[
+                    cff_author.cff_author_data
+                    for cff_author in create_cff_authors(
+                        cff_manager=cff_manager, contribution_manager=contribution_manager
+                    )
+                ],
+                repo_output_dir=output_dir.joinpath("repos", *repo.split("/")),
+            )
+
+        for repo, future in futures.items():
+            try:
+                summary: dict = future.result()
+            except Exception as e:
+                is_valid_cff = False
+                logger.error(f"{repo}: Failed to process `{cff_path}`: {e}")
+                continue
+            if not summary["has_cff"]:
+                logger.warning(f"{repo}: `{cff_path}` does not exist.")
+            elif not summary["is_valid_cff"]:
+                is_valid_cff = False
+                logger.error(f"{repo}: The suggested CFF is not valid CFF.")
+            else:
+                logger.info(f"{repo}: {summary['new_author_count']} missing author(s).")
+
+    logger.info(
+        f"Wrote the reports and the identity table to `{output_dir}`. "
+        f"GitHub rate limit budget consumed by this run: {github_manager.rate_limiter.get_summary()}."
+    )
+    if isinstance(shared_github_manager, GitHubPullRequestManager):
+        contributor_registry = shared_github_manager.contributor_registry
+        logger.debug(
+            f"Contributor registry: {contributor_registry.misses} distinct contributor(s) resolved, {contributor_registry.hits} repeated lookup(s) reused."
+        )
+    return is_valid_cff
@@ -0,0 +1,91 @@
+from typing import Callable
+
+import pytest
+
+from cff_author_updater.contributors.contributor_registry import ContributorRegistry
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.github_rate_limiter import GitHubRateLimiter
+from cff_author_updater.managers.github_manager import GitHubManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    DEFAULT_GITHUB_ACTION_BOT,
+    GitHubPullRequestManager,
+)
+from cff_author_updater.request_memo import RequestMemo
+
+
+@pytest.fixture
+def create_contributor() -> Callable[..., GitCommitContributor]:
+    """
+    Create git commit contributors without looking up their ORCID. The id of a
+    contributor is its name.
+    """
+
+    def create(name: str, git_email: str | None = None, orcid: str | None = None) -> GitCommitContributor:
+        return GitCommitContributor.from_dict(
+            {"git_name": name, "git_email": git_email, "orcid": orcid, "orcid_name": None, "id": name}
+        )
+
+    return create
+
+
+def set_github_manager_attributes(github_manager: GitHubManager, attributes: dict):
+    github_manager.repo = "o/r"
+    github_manager.github_token = "token"
+    github_manager.github_action_version = "1.0.0"
+    github_manager.http_client = None  # type: ignore
+    github_manager.rate_limiter = GitHubRateLimiter(max_wait=0)
+    github_manager.github_user_profiles = {}
+    github_manager.orcid_manager = None  # type: ignore
+    github_manager.identity_cache = None
+    github_manager.cached_github_identities = {}
+    for name, value in attributes.items():
+        setattr(github_manager, name, value)
+
+
+@pytest.fixture
+def create_github_manager() -> Callable[..., GitHubManager]:
+    """
+    Create GitHub managers for the repository `o/r` without GitHub environment variables
+    or an event file. Keyword arguments override the attributes, e.g. the `http_client`.
+    """
+
+    def create(**attributes) -> GitHubManager:
+        # bypass __init__ so that no GitHub environment variables or event file are needed
+        github_manager = GitHubManager.__new__(GitHubManager)
+        set_github_manager_attributes(github_manager=github_manager, attributes=attributes)
+        return github_manager
+
+    return create
+
+
+@pytest.fixture
+def create_github_pull_request_manager() -> Callable[..., GitHubPullRequestManager]:
+    """
+    Create GitHub pull request managers for the pull request `o/r#1` without GitHub
+    environment variables or an event file. Keyword arguments override the attributes,
+    e.g. the `http_client` or a stubbed method.
+    """
+
+    def create(**attributes) -> GitHubPullRequestManager:
+        # bypass __init__ so that no GitHub environment variables or event file are needed
+        github_pull_request_manager = GitHubPullRequestManager.__new__(GitHubPullRequestManager)
+        github_pull_request_manager.pr_number = "1"
+        github_pull_request_manager.repo_for_compare = "o/r"
+        github_pull_request_manager.head_sha = None
+        github_pull_request_manager.base_sha = None
+        github_pull_request_manager.bot_blacklist = {DEFAULT_GITHUB_ACTION_BOT}
+        github_pull_request_manager.pr_comment_author = DEFAULT_GITHUB_ACTION_BOT
+        github_pull_request_manager.collection_backend = "rest"
+        github_pull_request_manager.commit_source = "api"
+        github_pull_request_manager.git_workspace = None
+        github_pull_request_manager.request_memo = RequestMemo()
+        github_pull_request_manager.contributor_registry = ContributorRegistry(
+            github_manager=github_pull_request_manager
+        )
+        github_pull_request_manager.collected_at = "2024-02-01T00:00:00Z"
+        github_pull_request_manager.incremental_state = None
+        github_pull_request_manager.known_contribution_ids = set()
+        set_github_manager_attributes(github_manager=github_pull_request_manager, attributes=attributes)
+        return github_pull_request_manager
+
+    return create
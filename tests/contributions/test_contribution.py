@@ -0,0 +1,30 @@
+import pickle
+from datetime import datetime
+
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributions.github_pull_request_review_contribution import (
+    GitHubPullRequestReviewContribution,
+)
+
+
+def test_contributions_are_equal_by_type_and_id():
+    c1 = GitHubPullRequestCommitContribution(sha="abc", created_at=datetime(2024, 1, 1))
+    c2 = GitHubPullRequestCommitContribution(sha="abc", created_at=datetime(2024, 1, 2))
+    review = GitHubPullRequestReviewContribution(id="abc", created_at=datetime(2024, 1, 1))
+
+    assert c1 == c2
+    assert c1 != review
+    assert len({c1, c2, review}) == 2
+
+
+def test_contribution_survives_pickling():
+    contribution = GitHubPullRequestCommitContribution(sha="abc", created_at=datetime(2024, 1, 1))
+
+    restored = pickle.loads(pickle.dumps(contribution))
+
+    assert restored == contribution
+    assert restored.sha == "abc"
+    assert hash(restored) == hash(contribution)
+    assert not hasattr(contribution, "__dict__")
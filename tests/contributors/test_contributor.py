@@ -1,4 +1,7 @@
+import pickle
+
 from cff_author_updater.contributors.contributor import Contributor
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
 
 
 def test_to_dict():
@@ -20,3 +23,13 @@ def test_contributor_set_membership():
 def test_hash():
     c1: Contributor = Contributor()
     assert c1.__hash__() == hash("{}")
+
+
+def test_contributors_are_equal_by_identity_key():
+    c1 = GitCommitContributor.from_dict({"git_name": "Jane Doe", "git_email": "jane@example.com", "orcid": None, "orcid_name": None, "id": "Jane Doe <jane@example.com>"})
+    c2 = GitCommitContributor.from_dict({"git_name": "Jane Doe", "git_email": "jane@example.com", "orcid": "https://orcid.org/0000-0002-1825-0097", "orcid_name": "Jane Doe", "id": "Jane Doe <jane@example.com>"})
+
+    assert c1 == c2
+    assert len({c1, c2}) == 1
+    assert not hasattr(c1, "__dict__")
+    assert pickle.loads(pickle.dumps(c2)) == c1
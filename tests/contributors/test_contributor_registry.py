@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from cff_author_updater.contributors.contributor_registry import ContributorRegistry
+
+
+class FakeOrcidManager:
+    def __init__(self):
+        self.search_count = 0
+
+    def search_orcid(self, name, email=None, return_url=True) -> list[str]:
+        self.search_count += 1
+        return []
+
+    def get_orcid_from_social_accounts(self, social_accounts) -> str | None:
+        return None
+
+    def scrape_orcid_from_github_profile(self, github_username: str) -> str | None:
+        return None
+
+
+class FakeGitHubManager:
+    def __init__(self):
+        self.orcid_manager = FakeOrcidManager()
+        self.identity_cache = None
+        self.profile_count = 0
+
+    def get_github_user_profile(self, github_username: str) -> dict:
+        self.profile_count += 1
+        return {"name": "Jane Doe", "type": "User", "social_accounts": []}
+
+
+def test_contributor_registry_creates_each_github_contributor_once():
+    github_manager = FakeGitHubManager()
+    contributor_registry = ContributorRegistry(github_manager=github_manager)  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        contributors = list(
+            executor.map(
+                lambda _: contributor_registry.get_github_contributor(github_username="janedoe"),
+                range(40),
+            )
+        )
+
+    assert github_manager.profile_count == 1
+    assert all(contributor is contributors[0] for contributor in contributors)
+    assert (contributor_registry.hits, contributor_registry.misses) == (39, 1)
+
+
+def test_contributor_registry_creates_each_git_commit_contributor_once():
+    github_manager = FakeGitHubManager()
+    contributor_registry = ContributorRegistry(github_manager=github_manager)  # type: ignore
+
+    first = contributor_registry.get_git_commit_contributor(git_name="Jane Doe", git_email="jane@example.com")
+    second = contributor_registry.get_git_commit_contributor(git_name=" Jane Doe ", git_email="jane@example.com ")
+    other = contributor_registry.get_git_commit_contributor(git_name="Jane Doe", git_email="jane@example.org")
+
+    assert second is first
+    assert other is not first
+    assert github_manager.orcid_manager.search_count == 2
@@ -0,0 +1,56 @@
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.identity_cache import IdentityCache
+
+
+class FakeOrcidManager:
+    def __init__(self, orcids: list[str]):
+        self.orcids = orcids
+        self.search_count = 0
+
+    def search_orcid(self, name, email=None, return_url=True) -> list[str]:
+        self.search_count += 1
+        return self.orcids
+
+    def validate_orcid(self, orcid, is_url=True) -> bool:
+        return True
+
+    def get_names_from_orcid(self, orcid, is_url=True):
+        return ["Josiah Carberry"], "Josiah Carberry", "", []
+
+
+def test_git_commit_contributor_reads_identity_cache_before_searching_orcid(tmp_path):
+    identity_cache = IdentityCache(cache_dir=tmp_path)
+    orcid_manager = FakeOrcidManager(orcids=["https://orcid.org/0000-0002-1825-0097"])
+
+    first = GitCommitContributor(
+        git_name="Josiah Carberry",
+        git_email="josiah@example.org",
+        orcid_manager=orcid_manager,  # type: ignore
+        identity_cache=identity_cache,
+    )
+    second = GitCommitContributor(
+        git_name="Josiah Carberry",
+        git_email="josiah@example.org",
+        orcid_manager=orcid_manager,  # type: ignore
+        identity_cache=identity_cache,
+    )
+
+    assert orcid_manager.search_count == 1
+    assert second == first
+    assert second.orcid == "https://orcid.org/0000-0002-1825-0097"
+
+
+def test_git_commit_contributor_caches_no_orcid_found(tmp_path):
+    identity_cache = IdentityCache(cache_dir=tmp_path)
+    orcid_manager = FakeOrcidManager(orcids=[])
+
+    for _ in range(2):
+        contributor = GitCommitContributor(
+            git_name="Anonymous",
+            git_email="anonymous@example.org",
+            orcid_manager=orcid_manager,  # type: ignore
+            identity_cache=identity_cache,
+        )
+
+    assert orcid_manager.search_count == 1
+    assert contributor.orcid is None
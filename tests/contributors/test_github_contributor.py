@@ -0,0 +1,60 @@
+from cff_author_updater.contributors.github_contributor import GitHubContributor
+from cff_author_updater.managers.orcid_manager import OrcidManager
+
+VCARD_ORCID = "https://orcid.org/0000-0002-1825-0097"
+
+
+class FakeOrcidManager:
+    get_orcid_from_social_accounts = staticmethod(OrcidManager.get_orcid_from_social_accounts)
+    extract_orcid = staticmethod(OrcidManager.extract_orcid)
+
+    def __init__(self):
+        self.scraped_github_usernames: list[str] = []
+
+    def scrape_orcid_from_github_profile(self, github_username: str) -> str | None:
+        # the ORCID iD linked through GitHub's ORCID integration is only shown in the vcard
+        self.scraped_github_usernames.append(github_username)
+        return VCARD_ORCID
+
+    def validate_orcid(self, orcid, is_url=True) -> bool:
+        return True
+
+    def get_names_from_orcid(self, orcid, is_url=True):
+        return ["Josiah Carberry"], "Josiah Carberry", "", []
+
+
+class FakeGitHubManager:
+    def __init__(self, user_profile: dict):
+        self.user_profile = user_profile
+        self.orcid_manager = FakeOrcidManager()
+        self.identity_cache = None
+
+    def get_github_user_profile(self, github_username: str) -> dict:
+        return self.user_profile
+
+
+def test_github_contributor_scrapes_vcard_if_prefetched_profile_links_no_orcid():
+    github_manager = FakeGitHubManager(
+        user_profile={"name": "Josiah Carberry", "type": "User", "social_accounts": ["https://example.org"]}
+    )
+
+    contributor = GitHubContributor(github_username="jcarberry", github_manager=github_manager)  # type: ignore
+
+    assert contributor.orcid == VCARD_ORCID
+    assert github_manager.orcid_manager.scraped_github_usernames == ["jcarberry"]
+
+
+def test_github_contributor_reads_orcid_website_of_prefetched_profile_without_scraping():
+    github_manager = FakeGitHubManager(
+        user_profile={
+            "name": "Josiah Carberry",
+            "type": "User",
+            "blog": "https://orcid.org/0000-0001-5109-3700",
+            "social_accounts": [],
+        }
+    )
+
+    contributor = GitHubContributor(github_username="jcarberry", github_manager=github_manager)  # type: ignore
+
+    assert contributor.orcid == "https://orcid.org/0000-0001-5109-3700"
+    assert github_manager.orcid_manager.scraped_github_usernames == []
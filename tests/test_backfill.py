@@ -0,0 +1,211 @@
+from datetime import date, datetime
+
+from cff_author_updater import backfill
+from cff_author_updater.backfill import (
+    append_missing_cff_authors,
+    collect_pull_request_contributions,
+    create_cff_authors,
+    create_pull_request_event,
+    create_pull_request_managers,
+    list_merged_pull_requests,
+)
+from cff_author_updater.cff_file import CffFile
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.flags import Flags
+from cff_author_updater.managers.cff_manager import CffManager
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_manager import GitHubManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    GitHubPullRequestManager,
+)
+
+CFF = """cff-version: 1.2.0
+title: Example
+message: Please cite this software.
+# the maintainers
+authors:
+  - given-names: Jane
+    family-names: Doe
+"""
+
+
+class FakeGitHubManager:
+    def __init__(self, pull_requests: list[dict]):
+        self.pull_requests = pull_requests
+        self.listed_count = 0
+
+    def iter_github_paginated(self, url: str, params: dict | None = None):
+        for pull_request in self.pull_requests:
+            self.listed_count += 1
+            yield pull_request
+
+
+class FakeGitHubPullRequestManager:
+    repo_for_compare = "o/r"
+
+
+def create_pull_request(number: int, created_at: str, merged_at: str | None) -> dict:
+    return {"number": number, "created_at": created_at, "merged_at": merged_at}
+
+
+def test_list_merged_pull_requests_filters_ranges_and_stops_early():
+    github_manager = FakeGitHubManager(
+        pull_requests=[
+            create_pull_request(1, "2023-12-30T00:00:00Z", "2023-12-31T00:00:00Z"),
+            create_pull_request(2, "2024-01-01T00:00:00Z", None),
+            create_pull_request(3, "2024-01-02T00:00:00Z", "2024-01-03T10:00:00Z"),
+            create_pull_request(4, "2024-01-04T00:00:00Z", "2024-02-01T00:00:00Z"),
+            create_pull_request(5, "2024-01-20T00:00:00Z", "2024-01-21T00:00:00Z"),
+            create_pull_request(6, "2024-02-02T00:00:00Z", "2024-02-03T00:00:00Z"),
+            create_pull_request(7, "2024-02-04T00:00:00Z", "2024-02-05T00:00:00Z"),
+        ]
+    )
+
+    pull_requests = list_merged_pull_requests(
+        github_manager=github_manager,  # type: ignore
+        repo="o/r",
+        since=date(2024, 1, 1),
+        until=date(2024, 1, 31),
+    )
+
+    assert [pull_request["number"] for pull_request in pull_requests] == [3, 5]
+    # the pull request created after the date range ends the listing
+    assert github_manager.listed_count == 6
+
+    pull_requests = list_merged_pull_requests(
+        github_manager=github_manager,  # type: ignore
+        repo="o/r",
+        from_number=2,
+        to_number=4,
+    )
+
+    assert [pull_request["number"] for pull_request in pull_requests] == [3, 4]
+
+
+def test_create_pull_request_event_uses_base_repository_for_deleted_fork(create_github_pull_request_manager):
+    pull_request = {
+        "number": 12,
+        "head": {"sha": "h" * 40, "ref": "feature", "repo": None},
+        "base": {"sha": "b" * 40, "ref": "main", "repo": {"full_name": "o/r"}},
+    }
+    github_pull_request_manager = create_github_pull_request_manager()
+
+    github_pull_request_manager._load_github_event(
+        event=create_pull_request_event(pull_request=pull_request)
+    )
+
+    assert github_pull_request_manager.pr_number == "12"
+    assert github_pull_request_manager.head_sha == "h" * 40
+    assert github_pull_request_manager.repo_for_compare == "o/r"
+
+
+def test_create_pull_request_managers_reads_action_version_once(create_github_manager, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    read_count = 0
+
+    def get_github_action_version(self) -> str:
+        nonlocal read_count
+        read_count += 1
+        return "1.0.0"
+
+    monkeypatch.setattr(GitHubManager, "get_github_action_version", get_github_action_version)
+    pull_requests: list[dict] = [
+        {
+            "number": number,
+            "head": {"sha": "h" * 40, "ref": "feature", "repo": {"full_name": "o/r"}},
+            "base": {"sha": "b" * 40, "ref": "main", "repo": {"full_name": "o/r"}},
+        }
+        for number in (1, 2, 3)
+    ]
+
+    github_pull_request_managers = create_pull_request_managers(
+        github_manager=create_github_manager(), repo="o/r", pull_requests=pull_requests
+    )
+
+    assert [github_pull_request_manager.pr_number for github_pull_request_manager in github_pull_request_managers] == ["1", "2", "3"]
+    assert all(github_pull_request_manager.github_action_version == "1.0.0" for github_pull_request_manager in github_pull_request_managers)
+    assert read_count == 0
+
+
+def test_append_missing_cff_authors_appends_missing_authors_in_order_of_first_contribution(create_contributor, tmp_path):
+    cff_path = tmp_path / "CITATION.cff"
+    cff_path.write_text(CFF)
+    cff_file = CffFile(cff_path=cff_path, validate=False)
+    cff_manager = CffManager.__new__(CffManager)
+    cff_manager.github_pull_request_manager = FakeGitHubPullRequestManager()  # type: ignore
+    contribution_manager = ColumnarContributionManager()
+    for i, name in enumerate(["Max Mustermann", "Jane Doe", "Erika Mustermann"]):
+        contribution_manager.add_contribution(
+            GitHubPullRequestCommitContribution(sha=f"{i:040x}", created_at=datetime(2024, 1, 3 - i)),
+            create_contributor(name=name),
+        )
+
+    new_cff_authors = append_missing_cff_authors(
+        cff_file=cff_file,
+        cff_authors=create_cff_authors(
+            cff_manager=cff_manager, contribution_manager=contribution_manager
+        ),
+    )
+    cff_file.save()
+
+    assert [new_cff_author.cff_author_data for new_cff_author in new_cff_authors] == [
+        {"given-names": "Erika", "family-names": "Mustermann"},
+        {"given-names": "Max", "family-names": "Mustermann"},
+    ]
+    assert cff_path.read_text() == CFF + (
+        "  - given-names: Erika\n"
+        "    family-names: Mustermann\n"
+        "  - given-names: Max\n"
+        "    family-names: Mustermann\n"
+    )
+
+
+def test_collect_pull_request_contributions_leaves_out_contributors_skipped_by_each_pull_request(create_contributor, create_github_pull_request_manager, monkeypatch, tmp_path):
+    monkeypatch.setitem(Flags.flags, "can_skip_authorship", True)
+    orcid = "https://orcid.org/0000-0002-1825-0097"
+    jane, max_, erika = create_contributor("Jane Doe"), create_contributor("Max Mustermann", orcid=orcid), create_contributor("Erika Mustermann")
+    contributors_by_pr_number: dict[str, list] = {"1": [jane, max_], "2": [jane, erika]}
+    skip_commands_by_pr_number: dict[str, dict[str, set[str]]] = {
+        # Max is only skipped by the ORCID of his enriched author
+        "1": {"orcid": {orcid}, "name": {"Jane Doe"}, "email": set(), "github-username": set()},
+        "2": {"orcid": set(), "name": set(), "email": set(), "github-username": set()},
+    }
+
+    def collect_contributions(github_pull_request_manager) -> ContributionManager:
+        contribution_manager = ContributionManager()
+        for i, contributor in enumerate(contributors_by_pr_number[github_pull_request_manager.pr_number]):
+            contribution_manager.add_contribution(
+                GitHubPullRequestCommitContribution(
+                    sha=f"{github_pull_request_manager.pr_number}{i:039x}",
+                    created_at=datetime(2024, 1, int(github_pull_request_manager.pr_number), i),
+                ),
+                contributor,
+            )
+        return contribution_manager
+
+    monkeypatch.setattr(backfill, "collect_contributions", collect_contributions)
+    github_pull_request_managers: list[GitHubPullRequestManager] = [
+        create_github_pull_request_manager(
+            pr_number=pr_number,
+            scan_pr_comments_for_skip_commands=lambda pr_number=pr_number: skip_commands_by_pr_number[pr_number],
+        )
+        for pr_number in ("1", "2")
+    ]
+
+    contribution_managers = collect_pull_request_contributions(
+        github_pull_request_managers=github_pull_request_managers,
+        cff_path=tmp_path / "CITATION.cff",
+        max_workers=2,
+    )
+
+    # Jane is only skipped for the first pull request
+    assert [contributor.id for contributor in contribution_managers["o/r"].contributors_sorted_by_first_contribution] == [
+        "Jane Doe",
+        "Erika Mustermann",
+    ]
+    assert [contribution.sha[0] for contribution in contribution_managers["o/r"].get_contributions_for(jane)] == ["2"]
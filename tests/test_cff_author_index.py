@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from cff_author_updater.cff_author_index import CffAuthorIndex
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+
+
+def create_random_cff_author_data(rng: random.Random) -> dict:
+    data: dict = {}
+    if rng.random() < 0.5:
+        data["given-names"] = rng.choice(["Jane", "JANE ", "John"])
+        data["family-names"] = rng.choice(["Doe", "Smith"])
+    else:
+        data["name"] = rng.choice(["Jane Doe", "jane doe", "ACME Lab"])
+    if rng.random() < 0.3:
+        data["orcid"] = rng.choice(["https://orcid.org/0000-0002-1825-0097", "https://orcid.org/0000-0001-5109-3700"])
+    if rng.random() < 0.3:
+        data["alias"] = rng.choice(["https://github.com/janedoe", "https://github.com/JaneDoe", "jdoe"])
+    if rng.random() < 0.3:
+        data["email"] = rng.choice(["jane@example.com", " Jane@Example.com", "john@example.com"])
+    return data
+
+
+def test_cff_author_index_matches_is_same_author():
+    rng = random.Random(0)
+    cff_authors = [
+        CffAuthorContributor(cff_author_data=create_random_cff_author_data(rng))
+        for _ in range(200)
+    ]
+    cff_author_index = CffAuthorIndex()
+
+    for cff_author in cff_authors:
+        expected = [
+            position
+            for position, indexed_cff_author in enumerate(cff_author_index.cff_authors)
+            if cff_author.is_same_author(cff_author=indexed_cff_author)
+        ]
+        assert cff_author_index.find_same_authors(cff_author=cff_author) == expected
+        assert cff_author_index.has_same_author(cff_author=cff_author) == bool(expected)
+        cff_author_index.add(cff_author)
+
+
+def test_cff_author_index_raises_like_is_same_author_for_author_without_name():
+    cff_author_index = CffAuthorIndex.from_cff_authors_data(
+        cff_authors_data=[{"name": "Jane Doe", "email": "jane@example.com"}, {"name": " "}]
+    )
+
+    assert cff_author_index.has_same_author(
+        cff_author=CffAuthorContributor(cff_author_data={"name": "Someone", "email": "jane@example.com"})
+    )
+    with pytest.raises(ValueError):
+        cff_author_index.has_same_author(
+            cff_author=CffAuthorContributor(cff_author_data={"name": "Someone Else"})
+        )
@@ -0,0 +1,51 @@
+import yaml
+
+from cff_author_updater.cff_authors_splicer import splice_cff_authors
+
+NEW_AUTHORS = [{"given-names": "Zoë", "family-names": "Smith", "orcid": "https://orcid.org/0000-0002-1825-0097"}]
+
+
+def test_splice_cff_authors_keeps_the_rest_of_the_text():
+    cff_text = """# comment
+cff-version: 1.2.0
+title: &title "Example" # keep
+authors:
+    -   given-names: Jane # note
+        family-names: Doe
+        affiliation: [a,
+          b]
+    -   name: ACME
+
+references:
+  - type: book
+    title: *title
+"""
+    spliced_cff_text = splice_cff_authors(cff_text=cff_text, new_authors=NEW_AUTHORS)
+
+    assert spliced_cff_text is not None
+    assert spliced_cff_text.startswith(cff_text[: cff_text.index("\nreferences")])
+    assert spliced_cff_text.endswith("\nreferences:\n  - type: book\n    title: *title\n")
+    expected_cff = yaml.safe_load(cff_text)
+    expected_cff["authors"] += NEW_AUTHORS
+    assert yaml.safe_load(spliced_cff_text) == expected_cff
+
+
+def test_splice_cff_authors_at_end_of_text_without_newline():
+    cff_text = "cff-version: 1.2.0\nauthors:\n- name: ACME"
+
+    spliced_cff_text = splice_cff_authors(cff_text=cff_text, new_authors=NEW_AUTHORS)
+
+    assert spliced_cff_text is not None
+    assert yaml.safe_load(spliced_cff_text)["authors"] == [{"name": "ACME"}, *NEW_AUTHORS]
+
+
+def test_splice_cff_authors_falls_back_for_unsupported_authors():
+    for cff_text in [
+        "cff-version: 1.2.0\n",
+        "cff-version: 1.2.0\nauthors: []\n",
+        "cff-version: 1.2.0\nauthors: [{name: ACME}]\n",
+        "cff-version: 1.2.0\nauthors:\n  - {name: ACME}\n",
+        "cff-version: 1.2.0\nauthors:\n  -\n    name: ACME\n",
+        "title: [unclosed\n",
+    ]:
+        assert splice_cff_authors(cff_text=cff_text, new_authors=NEW_AUTHORS) is None
@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import pytest
+
+from cff_author_updater import cff_file as cff_file_module
+from cff_author_updater.cff_file import CffFile, CffFileValidationError
+
+VALID_CFF = """cff-version: 1.2.0
+title: Example
+message: Please cite this software.
+type: software
+date-released: 2024-01-02
+authors:
+  - given-names: Jane
+    family-names: Doe
+"""
+
+
+def write_cff(tmp_path: Path, content: str) -> Path:
+    cff_path = tmp_path / "CITATION.cff"
+    cff_path.write_text(content)
+    return cff_path
+
+
+def test_cff_file_validates_in_process(tmp_path):
+    cff_file = CffFile(cff_path=write_cff(tmp_path, VALID_CFF))
+
+    assert cff_file.validate() == (True, [])
+
+
+def test_cff_file_reports_duplicate_authors_separately(tmp_path):
+    cff_path = write_cff(
+        tmp_path,
+        VALID_CFF + "  - given-names: Jane\n    family-names: Doe\n" + "unknown-key: value\n",
+    )
+
+    with pytest.raises(CffFileValidationError) as e:
+        CffFile(cff_path=cff_path)
+
+    assert len(e.value.cffconvert_validation_duplicate_errors) == 1
+    assert len(e.value.cffconvert_validation_other_errors) == 1
+    assert "unknown-key" in e.value.cffconvert_validation_other_errors[0]
+
+
+def test_cff_file_validates_older_cff_version_quietly(tmp_path, capsys, caplog):
+    cff_path = write_cff(
+        tmp_path,
+        VALID_CFF.replace("cff-version: 1.2.0", "cff-version: 1.1.0").replace("type: software\n", "")
+        + "version: 1.0.0\nunknown-key: value\nother-key: value\n",
+    )
+    cff_file = CffFile(cff_path=cff_path, validate=False)
+
+    assert cff_file.validate() == (
+        False,
+        ["Key 'unknown-key' was not defined. Path: ''", "Key 'other-key' was not defined. Path: ''"],
+    )
+    assert capsys.readouterr().out == ""
+    assert caplog.records == []
+
+
+def test_cff_file_does_not_save_invalid_cff(tmp_path):
+    cff_path = write_cff(tmp_path, VALID_CFF)
+    cff_file = CffFile(cff_path=cff_path)
+    cff_file.cff["authors"].append({"given-names": "Jane", "family-names": "Doe"})
+
+    with pytest.raises(CffFileValidationError):
+        cff_file.save()
+
+    assert cff_path.read_text() == VALID_CFF
+
+
+def test_cff_file_save_skips_unchanged_cff(tmp_path):
+    cff_path = write_cff(tmp_path, VALID_CFF)
+    cff_path.chmod(0o644)
+    cff_file = CffFile(cff_path=cff_path)
+
+    assert cff_file.save() is False
+    assert cff_path.read_text() == VALID_CFF
+
+    cff_file.cff["authors"].append({"given-names": "John", "family-names": "Smith"})
+
+    assert cff_file.save() is True
+    assert "Smith" in cff_path.read_text()
+    assert cff_path.stat().st_mode & 0o777 == 0o644
+    assert list(tmp_path.iterdir()) == [cff_path]
+    assert cff_file.save() is False
+
+
+def test_cff_file_reuses_yaml_text(tmp_path, monkeypatch):
+    dump_count = 0
+    dump_yaml = cff_file_module.dump_yaml
+
+    def counting_dump_yaml(data) -> str:
+        nonlocal dump_count
+        dump_count += 1
+        return dump_yaml(data)
+
+    monkeypatch.setattr(cff_file_module, "dump_yaml", counting_dump_yaml)
+    cff_file = CffFile(cff_path=write_cff(tmp_path, VALID_CFF))
+
+    assert cff_file.get_cff_yaml() == cff_file.get_original_cff_yaml()
+    assert dump_count == 1
+
+    cff_file.cff["authors"].append({"given-names": "John", "family-names": "Smith"})
+    cff_file.save()
+
+    assert cff_file.get_cff_yaml() == (tmp_path / "CITATION.cff").read_text()
+    assert "Smith" not in cff_file.get_original_cff_yaml()
+    # the new author was spliced into the text of the file
+    assert dump_count == 1
+
+
+def test_cff_file_save_keeps_comments_when_appending_authors(tmp_path):
+    cff_path = write_cff(tmp_path, "# keep this comment\n" + VALID_CFF + "references:\n  - type: book\n    title: Book\n    authors:\n      - name: ACME\n")
+    cff_file = CffFile(cff_path=cff_path)
+    cff_file.cff["authors"].append({"given-names": "John", "family-names": "Smith"})
+
+    assert cff_file.save() is True
+
+    cff_text = cff_path.read_text()
+    assert cff_text.startswith("# keep this comment\n")
+    assert CffFile(cff_path=cff_path).cff == cff_file.cff
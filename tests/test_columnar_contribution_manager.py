@@ -0,0 +1,70 @@
+import random
+from datetime import datetime, timedelta
+
+from cff_author_updater.contributions.github_pull_request_comment_contribution import (
+    GitHubPullRequestCommentContribution,
+)
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+
+
+def test_columnar_contribution_manager_matches_contribution_manager(create_contributor):
+    rng = random.Random(0)
+    contributors = [create_contributor(f"user{i}") for i in range(20)]
+    rows = []
+    for i in range(500):
+        created_at = datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(100))
+        if i % 3:
+            contribution = GitHubPullRequestCommitContribution(sha=f"{i:040x}", created_at=created_at)
+        else:
+            contribution = GitHubPullRequestCommentContribution(
+                id=f"https://github.com/o/r/pull/1#issuecomment-{i}", created_at=created_at
+            )
+        rows.append((contribution, rng.choice(contributors)))
+    # duplicates are ignored
+    rows.extend(rows[:50])
+
+    contribution_manager = ContributionManager()
+    columnar_contribution_manager = ColumnarContributionManager()
+    for contribution, contributor in rows:
+        contribution_manager.add_contribution(contribution, contributor)
+        columnar_contribution_manager.add_contribution(contribution, contributor)
+
+    assert columnar_contribution_manager.to_dict() == contribution_manager.to_dict()
+    assert len(columnar_contribution_manager) == len(contribution_manager)
+    assert (
+        columnar_contribution_manager.contributors_sorted_by_first_contribution
+        == contribution_manager.contributors_sorted_by_first_contribution
+    )
+    for contributor in contributors:
+        columnar_contributions = columnar_contribution_manager.get_contributions_for(contributor)
+        contributions = contribution_manager.get_contributions_for(contributor)
+        assert columnar_contributions == contributions
+        assert [c.created_at for c in columnar_contributions] == [c.created_at for c in contributions]
+
+
+def test_columnar_contribution_manager_reindexes_after_write(create_contributor):
+    jane = create_contributor("jane")
+    john = create_contributor("john")
+    columnar_contribution_manager = ColumnarContributionManager()
+    columnar_contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="b", created_at=datetime(2024, 1, 2)), jane
+    )
+    columnar_contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="c", created_at=datetime(2024, 1, 3)), john
+    )
+    assert columnar_contribution_manager.contributors_sorted_by_first_contribution == [jane, john]
+
+    merged = ContributionManager()
+    merged.add_contribution(
+        GitHubPullRequestCommitContribution(sha="a", created_at=datetime.min), john
+    )
+    columnar_contribution_manager.merge(merged)
+
+    assert columnar_contribution_manager.contributors_sorted_by_first_contribution == [john, jane]
+    assert columnar_contribution_manager.get_contributions_for(john)[0].created_at == datetime.min
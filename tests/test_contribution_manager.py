@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributions.github_pull_request_review_contribution import (
+    GitHubPullRequestReviewContribution,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+
+
+def test_add_contribution_keeps_contributions_sorted_and_unique(create_contributor):
+    contribution_manager = ContributionManager()
+    jane = create_contributor("jane")
+    late = GitHubPullRequestCommitContribution(sha="c", created_at=datetime(2024, 1, 3))
+    early = GitHubPullRequestCommitContribution(sha="a", created_at=datetime(2024, 1, 1))
+    same_time = GitHubPullRequestReviewContribution(id="r", created_at=datetime(2024, 1, 3))
+
+    for contribution in [late, early, same_time, late]:
+        contribution_manager.add_contribution(contribution, jane)
+
+    assert contribution_manager.get_contributions_for(jane) == [early, late, same_time]
+
+
+def test_contributors_sorted_by_first_contribution_is_updated_after_writes(create_contributor):
+    contribution_manager = ContributionManager()
+    jane = create_contributor("jane")
+    john = create_contributor("john")
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="b", created_at=datetime(2024, 1, 2)), jane
+    )
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="c", created_at=datetime(2024, 1, 3)), john
+    )
+    assert contribution_manager.contributors_sorted_by_first_contribution == [jane, john]
+
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="a", created_at=datetime(2024, 1, 1)), john
+    )
+
+    assert contribution_manager.contributors_sorted_by_first_contribution == [john, jane]
+
+
+def test_merge_shares_co_authored_commits(create_contributor):
+    jane = create_contributor("jane")
+    john = create_contributor("john")
+    commit = GitHubPullRequestCommitContribution(sha="a", created_at=datetime(2024, 1, 1))
+    contribution_manager = ContributionManager()
+    contribution_manager.add_contribution(commit, jane)
+    other = ContributionManager()
+    other.add_contribution(
+        GitHubPullRequestCommitContribution(sha="a", created_at=datetime(2024, 1, 1)), john
+    )
+
+    contribution_manager.merge(other)
+
+    assert len(contribution_manager) == 2
+    assert contribution_manager._contributors_by_contribution[commit] == [jane, john]
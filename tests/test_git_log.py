@@ -0,0 +1,82 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from cff_author_updater.contributors.github_contributor import (
+    parse_github_username_from_github_noreply_email,
+)
+from cff_author_updater.git_log import GitLogError, iter_git_log_commits
+
+
+def git(cwd, *args, env=None):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True, env=env
+    ).stdout.strip()
+
+
+def commit(cwd, monkeypatch, name, email, message):
+    monkeypatch.setenv("GIT_AUTHOR_NAME", name)
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", email)
+    monkeypatch.setenv("GIT_COMMITTER_NAME", name)
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", email)
+    git(cwd, "commit", "--allow-empty", "-q", "-m", message)
+    return git(cwd, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    return tmp_path
+
+
+def test_iter_git_log_commits(repo, monkeypatch):
+    base_sha = commit(repo, monkeypatch, "Base", "base@example.com", "Initial commit")
+    first_sha = commit(
+        repo,
+        monkeypatch,
+        "Jane Doe",
+        "12345+janedoe@users.noreply.github.com",
+        "Add feature\n\nCo-authored-by: John Smith <john@example.com>",
+    )
+    head_sha = commit(repo, monkeypatch, "Émile Zola", "emile@example.com", "Fix bug")
+
+    commits = list(iter_git_log_commits(base_sha=base_sha, head_sha=head_sha, cwd=repo))
+
+    assert [c["sha"] for c in commits] == [first_sha, head_sha]
+    assert commits[0]["name"] == "Jane Doe"
+    assert commits[0]["email"] == "12345+janedoe@users.noreply.github.com"
+    assert "Co-authored-by: John Smith <john@example.com>" in commits[0]["message"]
+    assert commits[1]["name"] == "Émile Zola"
+    assert commits[1]["date"]
+
+
+def test_iter_git_log_commits_raises_for_unknown_commit(repo, monkeypatch):
+    head_sha = commit(repo, monkeypatch, "Base", "base@example.com", "Initial commit")
+
+    with pytest.raises(GitLogError):
+        list(iter_git_log_commits(base_sha="0" * 40, head_sha=head_sha, cwd=repo))
+
+
+def test_iter_git_log_commits_does_not_block_on_noisy_stderr(repo, monkeypatch, tmp_path_factory):
+    base_sha = commit(repo, monkeypatch, "Base", "base@example.com", "Initial commit")
+    head_sha = commit(repo, monkeypatch, "Jane Doe", "jane@example.com", "Add feature")
+    # a git that writes more to stderr than a pipe buffer holds before its log
+    bin_dir = tmp_path_factory.mktemp("bin")
+    noisy_git = bin_dir / "git"
+    noisy_git.write_text(
+        f'#!/bin/sh\nif [ "$1" = log ]; then head -c 1000000 /dev/zero | tr "\\0" x >&2; fi\nexec {shutil.which("git")} "$@"\n'
+    )
+    noisy_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    commits = list(iter_git_log_commits(base_sha=base_sha, head_sha=head_sha, cwd=repo))
+
+    assert [c["sha"] for c in commits] == [head_sha]
+
+
+def test_parse_github_username_from_github_noreply_email():
+    assert parse_github_username_from_github_noreply_email("12345+janedoe@users.noreply.github.com") == "janedoe"
+    assert parse_github_username_from_github_noreply_email("janedoe@users.noreply.github.com") == "janedoe"
+    assert parse_github_username_from_github_noreply_email("jane@example.com") is None
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+from cff_author_updater.contributors.github_contributor import GitHubContributor
+from cff_author_updater.identity_cache import IdentityCache
+from cff_author_updater.managers.github_manager import (
+    GITHUB_GRAPHQL_URL,
+    parse_github_datetime,
+)
+
+
+class FakeResponse:
+    def __init__(self, items: list | dict, next_url: str | None = None):
+        self._items = items
+        self.status_code = 200
+        self.headers: dict = {}
+        self.links = {"next": {"url": next_url}} if next_url else {}
+
+    def json(self):
+        return self._items
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeHttpClient:
+    def __init__(self, pages: dict[str, FakeResponse]):
+        self.pages = pages
+        self.calls: list[tuple[str, dict | None]] = []
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        self.calls.append((url, params))
+        return self.pages[url]
+
+
+def test_iter_github_paginated_follows_next_links(create_github_manager):
+    first_url = "https://api.github.com/repos/o/r/issues/1/comments"
+    second_url = first_url + "?per_page=100&page=2"
+    http_client = FakeHttpClient(
+        pages={
+            first_url: FakeResponse(items=[{"id": 1}, {"id": 2}], next_url=second_url),
+            second_url: FakeResponse(items=[{"id": 3}]),
+        }
+    )
+    github_manager = create_github_manager(http_client=http_client)
+
+    items = list(github_manager.iter_github_paginated(url=first_url))
+
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert http_client.calls == [(first_url, {"per_page": 100}), (second_url, None)]
+
+
+def test_iter_github_paginated_is_lazy(create_github_manager):
+    url = "https://api.github.com/repos/o/r/pulls/1/reviews"
+    http_client = FakeHttpClient(pages={url: FakeResponse(items=[{"id": 1}])})
+    github_manager = create_github_manager(http_client=http_client)
+
+    items = github_manager.iter_github_paginated(url=url)
+    assert http_client.calls == []
+
+    assert next(items) == {"id": 1}
+    assert len(http_client.calls) == 1
+
+
+def test_parse_github_datetime_normalizes_rest_and_graphql_timestamps():
+    rest_timestamp = parse_github_datetime("2024-01-02T03:04:05Z")
+    graphql_timestamp = parse_github_datetime("2024-01-02T05:04:05+02:00")
+
+    assert rest_timestamp == datetime(2024, 1, 2, 3, 4, 5)
+    assert graphql_timestamp == rest_timestamp
+    assert parse_github_datetime(None) == datetime.min
+
+
+def test_prefetch_github_user_profiles_batches_users_and_organizations(create_github_manager):
+    http_client = FakeHttpClient(
+        pages={
+            GITHUB_GRAPHQL_URL: FakeResponse(
+                items={
+                    "data": {
+                        "rateLimit": {"cost": 1},
+                        "user0": {
+                            "__typename": "User",
+                            "login": "octocat",
+                            "name": "The Octocat",
+                            "email": "",
+                            "bio": "https://orcid.org/0000-0002-1825-0097",
+                            "websiteUrl": None,
+                            "socialAccounts": {
+                                "nodes": [{"provider": "GENERIC", "url": "https://example.org"}]
+                            },
+                        },
+                        "user1": {
+                            "__typename": "Organization",
+                            "login": "github",
+                            "name": "GitHub",
+                            "organizationEmail": "support@github.com",
+                            "description": "How people build software.",
+                            "websiteUrl": "https://github.com/about",
+                        },
+                        "user2": None,
+                    }
+                }
+            )
+        }
+    )
+    github_manager = create_github_manager(http_client=http_client)
+
+    github_manager.prefetch_github_user_profiles(
+        github_usernames=["octocat", "github", "ghost-user", "octocat", "dependabot[bot]", None]
+    )
+
+    assert len(http_client.calls) == 1
+    assert github_manager.get_github_user_profile("OctoCat") == {
+        "login": "octocat",
+        "name": "The Octocat",
+        "bio": "https://orcid.org/0000-0002-1825-0097",
+        "blog": "",
+        "email": None,
+        "type": "User",
+        "social_accounts": ["https://example.org"],
+    }
+    organization_profile = github_manager.get_github_user_profile("github")
+    assert organization_profile is not None
+    assert organization_profile["type"] == "Organization"
+    assert organization_profile["email"] == "support@github.com"
+    assert github_manager.get_github_user_profile("ghost-user") is None
+    # bots are not resolvable through GraphQL and are left to the REST fallback
+    assert "dependabot[bot]" not in github_manager.github_user_profiles
+    assert len(http_client.calls) == 1
+
+
+def test_prefetch_github_user_profiles_skips_users_in_identity_cache(create_github_manager, tmp_path):
+    http_client = FakeHttpClient(
+        pages={
+            GITHUB_GRAPHQL_URL: FakeResponse(
+                items={"data": {"user0": {"__typename": "User", "login": "monalisa", "name": "Mona Lisa"}}}
+            )
+        }
+    )
+    github_manager = create_github_manager(http_client=http_client)
+    github_manager.identity_cache = IdentityCache(cache_dir=tmp_path)
+    github_manager.identity_cache.set(kind="github", key="octocat", value={"github_name": "The Octocat"})
+
+    github_manager.prefetch_github_user_profiles(github_usernames=["OctoCat"])
+    assert http_client.calls == []
+
+    github_manager.prefetch_github_user_profiles(github_usernames=["octocat", "monalisa"])
+    assert len(http_client.calls) == 1
+    assert "octocat" not in github_manager.github_user_profiles
+    assert github_manager.github_user_profiles["monalisa"]["name"] == "Mona Lisa"
+
+    # the contributor reuses the lookup of the prefetch
+    contributor = GitHubContributor(github_username="octocat", github_manager=github_manager)
+    assert contributor.github_name == "The Octocat"
+    assert (github_manager.identity_cache.hits, github_manager.identity_cache.misses) == (1, 1)
@@ -0,0 +1,404 @@
+from datetime import datetime
+
+import pytest
+
+from cff_author_updater.collection import collect_contributions
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributors.contributor_registry import ContributorRegistry
+from cff_author_updater.flags import Flags
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    PR_COMMENT_MARKER,
+    GitHubPullRequestManager,
+)
+
+COMMENTS_URL = "https://api.github.com/repos/o/r/issues/1/comments"
+ACTION_BOT = {"login": "github-actions[bot]"}
+
+
+class FakeResponse:
+    def __init__(self, items: list | dict | None = None):
+        self._items = items
+        self.status_code = 200
+        self.headers: dict = {}
+        self.links: dict = {}
+
+    def json(self):
+        return self._items
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeHttpClient:
+    def __init__(self, comments: list[dict]):
+        self.comments = comments
+        self.reads: list[str] = []
+        self.writes: list[tuple[str, str, dict]] = []
+
+    def request(self, method, url, params=None, headers=None, json=None, **kwargs):
+        if method == "GET":
+            self.reads.append(url)
+            return FakeResponse(items=self.comments if url == COMMENTS_URL else [])
+        self.writes.append((method, url, json))
+        return FakeResponse(items={})
+
+
+
+def create_review(status: str, timestamp: str) -> str:
+    return f"\n{PR_COMMENT_MARKER}\n### CFF Author Updater ###\n\n**Pull Request Status: {status}**\n\n_Last updated: {timestamp} UTC · Commit [`abc1234`](https://github.com/o/r/commit/abc1234)_\n"
+
+
+def test_post_pull_request_comment_posts_first_review(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    http_client = FakeHttpClient(comments=[{"id": 1, "body": "Looks good"}])
+    github_pull_request_manager = create_github_pull_request_manager(http_client=http_client)
+
+    github_pull_request_manager.post_pull_request_comment(
+        comment_body=create_review(status="Valid", timestamp="2024-01-01 00:00")
+    )
+
+    assert [(method, url) for method, url, _ in http_client.writes] == [("POST", COMMENTS_URL)]
+
+
+def test_post_pull_request_comment_edits_previous_review(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    http_client = FakeHttpClient(
+        comments=[
+            {"id": 7, "user": ACTION_BOT, "body": create_review(status="Valid", timestamp="2024-01-01 00:00")},
+            {"id": 8, "body": "skip-authorship-by-name Jane Doe"},
+        ]
+    )
+    github_pull_request_manager = create_github_pull_request_manager(http_client=http_client)
+    new_review = create_review(status="Invalid (with Errors)", timestamp="2024-01-02 00:00")
+
+    github_pull_request_manager.post_pull_request_comment(comment_body=new_review)
+
+    assert http_client.writes == [
+        ("PATCH", "https://api.github.com/repos/o/r/issues/comments/7", {"body": new_review})
+    ]
+
+
+def test_post_pull_request_comment_skips_unchanged_review(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    http_client = FakeHttpClient(
+        comments=[{"id": 7, "user": ACTION_BOT, "body": create_review(status="Valid", timestamp="2024-01-01 00:00")}]
+    )
+    github_pull_request_manager = create_github_pull_request_manager(http_client=http_client)
+
+    # only the timestamp footer differs
+    github_pull_request_manager.post_pull_request_comment(
+        comment_body=create_review(status="Valid", timestamp="2024-01-02 00:00")
+    )
+
+    assert http_client.writes == []
+
+
+def test_post_pull_request_comment_does_not_edit_quoted_review_of_another_user(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    http_client = FakeHttpClient(
+        comments=[
+            {"id": 7, "user": {"login": "octocat"}, "body": "> " + create_review(status="Valid", timestamp="2024-01-01 00:00")},
+        ]
+    )
+    github_pull_request_manager = create_github_pull_request_manager(http_client=http_client)
+
+    github_pull_request_manager.post_pull_request_comment(
+        comment_body=create_review(status="Valid", timestamp="2024-01-02 00:00")
+    )
+
+    assert [(method, url) for method, url, _ in http_client.writes] == [("POST", COMMENTS_URL)]
+
+
+def test_post_pull_request_comment_edits_review_with_stale_incremental_state(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    previous_review = create_review(status="Valid", timestamp="2024-01-01 00:00").replace(
+        PR_COMMENT_MARKER, PR_COMMENT_MARKER + "\n<!-- cff-author-updater-state:b2xk -->"
+    )
+    http_client = FakeHttpClient(comments=[{"id": 7, "user": ACTION_BOT, "body": previous_review}])
+    github_pull_request_manager = create_github_pull_request_manager(http_client=http_client)
+    # the visible review is the same, but the state was collected at a newer head commit
+    new_review = create_review(status="Valid", timestamp="2024-01-02 00:00").replace(
+        PR_COMMENT_MARKER, PR_COMMENT_MARKER + "\n<!-- cff-author-updater-state:bmV3 -->"
+    )
+
+    github_pull_request_manager.post_pull_request_comment(comment_body=new_review)
+
+    assert http_client.writes == [
+        ("PATCH", "https://api.github.com/repos/o/r/issues/comments/7", {"body": new_review})
+    ]
+
+
+def test_post_pull_request_comment_skips_unchanged_review_of_incremental_run(create_contributor, create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "post_pr_comment", True)
+    monkeypatch.setitem(Flags.flags, "incremental_collection", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_issue_comments", False)
+    contribution_manager = ContributionManager()
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="a" * 40, created_at=datetime(2024, 1, 1)),
+        create_contributor(name="Jane Doe"),
+    )
+    http_client = FakeHttpClient(comments=[])
+
+    for run, collected_at in enumerate(["2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z"]):
+        github_pull_request_manager = create_github_pull_request_manager(
+            http_client=http_client, head_sha="c" * 40, collected_at=collected_at
+        )
+        review = create_review(status="Valid", timestamp=collected_at).replace(
+            PR_COMMENT_MARKER,
+            PR_COMMENT_MARKER
+            + "\n"
+            + github_pull_request_manager.create_incremental_state(contribution_manager=contribution_manager),
+        )
+        github_pull_request_manager.post_pull_request_comment(comment_body=review)
+        if run == 0:
+            http_client.comments.append({"id": 7, "user": ACTION_BOT, "body": review})
+
+    # the second run only differs in its time
+    assert [(method, url) for method, url, _ in http_client.writes] == [("POST", COMMENTS_URL)]
+
+
+def test_pr_comments_and_commits_are_fetched_once_but_other_resources_are_streamed(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_commits", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_reviews", True)
+    http_client = FakeHttpClient(
+        comments=[{"id": 1, "user": ACTION_BOT, "created_at": "2024-01-01T00:00:00Z", "body": "skip-authorship-by-name Jane Doe"}]
+    )
+    github_pull_request_manager = create_github_pull_request_manager(
+        http_client=http_client, prefetch_github_user_profiles=lambda github_usernames: None
+    )
+
+    assert github_pull_request_manager.scan_pr_comments_for_skip_commands()["name"] == {"Jane Doe"}
+    assert github_pull_request_manager.find_previous_pull_request_comment() is None
+    for _ in range(2):
+        github_pull_request_manager.collect_contributors_for_pr_commits()
+        github_pull_request_manager.collect_contributors_for_pr_reviews()
+
+    assert http_client.reads == [
+        COMMENTS_URL,
+        "https://api.github.com/repos/o/r/pulls/1/commits",
+        "https://api.github.com/repos/o/r/pulls/1/reviews",
+        "https://api.github.com/repos/o/r/pulls/1/reviews",
+    ]
+
+
+class FakeOrcidManager:
+    def search_orcid(self, name, email=None, return_url=True) -> list[str]:
+        return []
+
+    def get_orcid_from_social_accounts(self, social_accounts) -> str | None:
+        return None
+
+    def scrape_orcid_from_github_profile(self, github_username: str) -> str | None:
+        return None
+
+
+class FakeGitHubManager:
+    def __init__(self):
+        self.orcid_manager = FakeOrcidManager()
+        self.identity_cache = None
+
+    def get_github_user_profile(self, github_username: str) -> dict:
+        return {"name": github_username.title(), "type": "User", "social_accounts": []}
+
+
+@pytest.fixture
+def create_collecting_github_pull_request_manager(create_github_pull_request_manager):
+    """
+    Create pull request managers whose contributors are created without any lookups.
+    """
+
+    def create(**attributes) -> GitHubPullRequestManager:
+        return create_github_pull_request_manager(
+            contributor_registry=ContributorRegistry(github_manager=FakeGitHubManager()),  # type: ignore
+            prefetch_github_user_profiles=lambda github_usernames: None,
+            **attributes,
+        )
+
+    return create
+
+
+def create_page(nodes: list[dict], end_cursor: str | None = None) -> dict:
+    return {
+        "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+        "nodes": nodes,
+    }
+
+
+def create_author(login: str, typename: str = "User") -> dict:
+    return {"__typename": typename, "login": login}
+
+
+GRAPHQL_COMMITS = [
+    {
+        "commit": {
+            "oid": "a" * 40,
+            "message": "Add feature\n\nCo-authored-by: Jane Doe <jane@example.org>",
+            "author": {"name": "The Octocat", "email": "octocat@example.org", "date": "2024-01-01T00:00:00Z", "user": {"login": "octocat"}},
+        }
+    },
+    {
+        "commit": {
+            "oid": "b" * 40,
+            "message": "Fix typo",
+            "author": {"name": "Max Mustermann", "email": "max@example.org", "date": "2024-01-02T00:00:00Z", "user": None},
+        }
+    },
+]
+GRAPHQL_REVIEWS = [
+    {"url": "https://github.com/o/r/pull/1#pullrequestreview-1", "submittedAt": "2024-01-03T00:00:00Z", "author": create_author("monalisa")},
+    # GraphQL reports bots without the `[bot]` suffix
+    {"url": "https://github.com/o/r/pull/1#pullrequestreview-2", "submittedAt": "2024-01-04T00:00:00Z", "author": create_author("github-actions", typename="Bot")},
+]
+GRAPHQL_ISSUE_COMMENTS = [
+    {"url": "https://github.com/o/r/issues/5#issuecomment-1", "createdAt": "2024-01-05T00:00:00Z", "author": create_author("hubot")},
+    {"url": "https://github.com/o/r/issues/5#issuecomment-2", "createdAt": "2024-01-06T00:00:00Z", "author": create_author("octocat")},
+]
+GRAPHQL_ISSUE = {"number": 5, "url": "https://github.com/o/r/issues/5", "createdAt": "2023-12-31T00:00:00Z", "author": create_author("hubot")}
+GRAPHQL_COMMENTS = [
+    {"url": "https://github.com/o/r/pull/1#issuecomment-3", "createdAt": "2024-01-07T00:00:00Z", "author": create_author("mona")},
+]
+
+
+class FakeGraphQL:
+    """Answers the contribution query with the first page of each connection, and the follow-up page queries with the rest."""
+
+    def __init__(self):
+        self.queries: list[tuple[str, dict]] = []
+
+    def __call__(self, query: str, variables: dict) -> dict:
+        self.queries.append((query, variables))
+        if "issueNumber" in variables:
+            return {"repository": {"issue": {"comments": create_page(GRAPHQL_ISSUE_COMMENTS[1:])}}}
+        if "cursor" in variables:
+            assert variables["cursor"] == "cursor-1"
+            return {"repository": {"pullRequest": {"commits": create_page(GRAPHQL_COMMITS[1:])}}}
+        pull_request: dict = {}
+        if variables["withCommits"]:
+            pull_request["commits"] = create_page(GRAPHQL_COMMITS[:1], end_cursor="cursor-1")
+        if variables["withReviews"]:
+            pull_request["reviews"] = create_page(GRAPHQL_REVIEWS)
+        if variables["withComments"]:
+            pull_request["comments"] = create_page(GRAPHQL_COMMENTS)
+        if variables["withIssues"]:
+            issue: dict = dict(GRAPHQL_ISSUE)
+            if variables["withIssueComments"]:
+                issue["comments"] = create_page(GRAPHQL_ISSUE_COMMENTS[:1], end_cursor="cursor-1")
+            pull_request["closingIssuesReferences"] = create_page([issue])
+        return {"repository": {"pullRequest": pull_request}}
+
+
+def create_rest_pages() -> dict[str, list[dict]]:
+    """The REST responses for the same pull request as the GraphQL fixtures."""
+
+    def to_rest_item(node: dict, created_at_field: str = "createdAt") -> dict:
+        github_username = node["author"]["login"] + ("[bot]" if node["author"]["__typename"] == "Bot" else "")
+        return {"html_url": node["url"], created_at_field.replace("At", "_at").lower(): node[created_at_field], "user": {"login": github_username}}
+
+    return {
+        "https://api.github.com/repos/o/r/pulls/1/commits": [
+            {
+                "sha": commit_node["commit"]["oid"],
+                "commit": {"message": commit_node["commit"]["message"], "author": commit_node["commit"]["author"]},
+                "author": commit_node["commit"]["author"]["user"],
+            }
+            for commit_node in GRAPHQL_COMMITS
+        ],
+        "https://api.github.com/repos/o/r/pulls/1/reviews": [
+            to_rest_item(review, created_at_field="submittedAt") for review in GRAPHQL_REVIEWS
+        ],
+        "https://api.github.com/repos/o/r/issues/5/comments": [to_rest_item(comment) for comment in GRAPHQL_ISSUE_COMMENTS],
+        "https://api.github.com/repos/o/r/issues/1/comments": [to_rest_item(comment) for comment in GRAPHQL_COMMENTS],
+    }
+
+
+def set_authorship_flags(monkeypatch, **flags: bool):
+    monkeypatch.setitem(Flags.flags, "incremental_collection", False)
+    monkeypatch.setitem(Flags.flags, "concurrent_collection", False)
+    for flag in ("commits", "reviews", "issues", "issue_comments", "comments"):
+        monkeypatch.setitem(Flags.flags, f"authorship_for_pr_{flag}", flags.get(flag, True))
+
+
+def test_collect_contributors_for_pr_graphql_matches_rest_collection(create_collecting_github_pull_request_manager, monkeypatch):
+    set_authorship_flags(monkeypatch)
+    graphql_manager = create_collecting_github_pull_request_manager(collection_backend="graphql")
+    fake_graphql = FakeGraphQL()
+    graphql_manager.post_github_graphql = fake_graphql  # type: ignore
+    rest_pages = create_rest_pages()
+    rest_manager = create_collecting_github_pull_request_manager(collection_backend="rest")
+    rest_manager.iter_github_paginated_pages = lambda url, params=None: iter([rest_pages[url]])  # type: ignore
+    rest_manager.get_linked_issues_graphql = lambda: [GRAPHQL_ISSUE]  # type: ignore
+
+    graphql_contribution_manager = collect_contributions(github_pull_request_manager=graphql_manager)
+    rest_contribution_manager = collect_contributions(github_pull_request_manager=rest_manager)
+
+    assert graphql_contribution_manager.to_dict() == rest_contribution_manager.to_dict()
+    assert [contributor.id for contributor in graphql_contribution_manager.contributors] == [
+        "https://github.com/octocat",
+        "Jane Doe <jane@example.org>",
+        "Max Mustermann <max@example.org>",
+        "https://github.com/monalisa",
+        "https://github.com/hubot",
+        "https://github.com/mona",
+    ]
+    # the contribution query, then one follow-up page of commits and one of issue comments
+    assert len(fake_graphql.queries) == 3
+    commits_page_query, commits_page_variables = fake_graphql.queries[1]
+    assert "commits(first: 100, after: $cursor)" in commits_page_query
+    assert "$withIssueComments" not in commits_page_query
+    assert commits_page_variables == {"owner": "o", "name": "r", "prNumber": 1, "cursor": "cursor-1"}
+    assert fake_graphql.queries[2][1] == {"owner": "o", "name": "r", "issueNumber": 5, "cursor": "cursor-1"}
+
+
+def test_collect_contributors_for_pr_graphql_includes_only_enabled_connections(create_collecting_github_pull_request_manager, monkeypatch):
+    set_authorship_flags(monkeypatch, reviews=False, issues=False, issue_comments=False)
+    github_pull_request_manager = create_collecting_github_pull_request_manager(collection_backend="graphql")
+    fake_graphql = FakeGraphQL()
+    github_pull_request_manager.post_github_graphql = fake_graphql  # type: ignore
+
+    contribution_manager = github_pull_request_manager.collect_contributors_for_pr_graphql()
+
+    query, variables = fake_graphql.queries[0]
+    assert "reviews(first: 100) @include(if: $withReviews)" in query
+    assert "comments(first: 100) @include(if: $withIssueComments)" in query
+    assert {name: value for name, value in variables.items() if name.startswith("with")} == {
+        "withCommits": True,
+        "withReviews": False,
+        "withComments": True,
+        "withIssues": False,
+        "withIssueComments": False,
+    }
+    assert [contributor.id for contributor in contribution_manager.contributors] == [
+        "https://github.com/octocat",
+        "Jane Doe <jane@example.org>",
+        "Max Mustermann <max@example.org>",
+        "https://github.com/mona",
+    ]
+
+
+def test_get_graphql_node_github_username_restores_bot_suffix(create_collecting_github_pull_request_manager):
+    github_pull_request_manager = create_collecting_github_pull_request_manager(collection_backend="graphql")
+
+    assert github_pull_request_manager._get_graphql_node_github_username(GRAPHQL_REVIEWS[0]) == "monalisa"
+    assert github_pull_request_manager._get_graphql_node_github_username(GRAPHQL_REVIEWS[1]) == "github-actions[bot]"
+    assert github_pull_request_manager._get_graphql_node_github_username({"author": None}) is None
+
+
+def test_get_linked_issues_graphql_fetches_every_page(create_github_pull_request_manager):
+    github_pull_request_manager = create_github_pull_request_manager()
+    pages: dict[str | None, dict] = {
+        None: create_page([{"number": 5}], end_cursor="cursor-1"),
+        "cursor-1": create_page([{"number": 6}]),
+    }
+    variables_of_queries: list[dict] = []
+
+    def post_github_graphql(query: str, variables: dict) -> dict:
+        variables_of_queries.append(variables)
+        return {"repository": {"pullRequest": {"closingIssuesReferences": pages[variables["cursor"]]}}}
+
+    github_pull_request_manager.post_github_graphql = post_github_graphql  # type: ignore
+
+    assert [issue["number"] for issue in github_pull_request_manager.get_linked_issues_graphql()] == [5, 6]
+    assert [variables["cursor"] for variables in variables_of_queries] == [None, "cursor-1"]
@@ -0,0 +1,148 @@
+import pytest
+import requests
+
+from cff_author_updater.github_rate_limiter import (
+    GitHubRateLimiter,
+    GitHubRateLimitError,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def create_response(status_code: int = 200, headers: dict | None = None, text: str = "") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = text.encode("utf-8")
+    return response
+
+
+def create_rate_limit_headers(limit: int, remaining: int, reset: float) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+    }
+
+
+def create_rate_limiter(clock: FakeClock, max_wait: float = 900) -> GitHubRateLimiter:
+    return GitHubRateLimiter(max_wait=max_wait, sleep=clock.sleep, clock=clock.time)
+
+
+def test_requests_are_not_delayed_while_budget_is_plentiful():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+
+    for remaining in (4999, 4998, 4997):
+        rate_limiter.before_request("core")
+        rate_limiter.after_response(
+            "core",
+            create_response(headers=create_rate_limit_headers(5000, remaining, clock.now + 3600)),
+        )
+
+    assert clock.sleeps == []
+    assert rate_limiter.budgets["core"].used == 3
+
+
+def test_requests_are_paced_when_budget_runs_low():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+    rate_limiter.before_request("core")
+    rate_limiter.after_response(
+        "core", create_response(headers=create_rate_limit_headers(5000, 100, clock.now + 1000))
+    )
+
+    rate_limiter.before_request("core")
+
+    # the remaining 100 requests are spread over the 1000 seconds until the reset
+    assert clock.sleeps == [pytest.approx(10.0)]
+
+
+def test_exhausted_budget_waits_for_reset():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+    rate_limiter.after_response(
+        "core", create_response(headers=create_rate_limit_headers(5000, 0, clock.now + 120))
+    )
+
+    rate_limiter.before_request("core")
+
+    assert clock.sleeps == [pytest.approx(120.0)]
+
+
+def test_exhausted_budget_beyond_max_wait_raises():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock, max_wait=60)
+    rate_limiter.after_response(
+        "core", create_response(headers=create_rate_limit_headers(5000, 0, clock.now + 3600))
+    )
+
+    with pytest.raises(GitHubRateLimitError):
+        rate_limiter.before_request("core")
+
+
+def test_secondary_rate_limit_honours_retry_after():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+
+    wait = rate_limiter.after_response(
+        "core", create_response(status_code=403, headers={"Retry-After": "30"})
+    )
+    rate_limiter.before_request("core")
+
+    assert wait == 30
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+def test_secondary_rate_limit_without_retry_after_backs_off_exponentially():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+    response = create_response(
+        status_code=403, text='{"message": "You have exceeded a secondary rate limit."}'
+    )
+
+    first_wait = rate_limiter.after_response("core", response)
+    second_wait = rate_limiter.after_response("core", response)
+
+    assert first_wait == 60
+    assert second_wait == 120
+
+
+def test_forbidden_response_unrelated_to_rate_limits_is_not_retried():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+
+    wait = rate_limiter.after_response(
+        "core", create_response(status_code=403, text='{"message": "Resource not accessible by integration"}')
+    )
+
+    assert wait is None
+
+
+def test_graphql_cost_is_reported_in_summary():
+    clock = FakeClock()
+    rate_limiter = create_rate_limiter(clock)
+    rate_limiter.before_request("graphql")
+    rate_limiter.after_response(
+        "graphql",
+        create_response(
+            headers={
+                **create_rate_limit_headers(5000, 4999, clock.now + 3600),
+                "X-RateLimit-Resource": "graphql",
+            }
+        ),
+    )
+    rate_limiter.record_graphql_rate_limit({"cost": 1})
+
+    assert rate_limiter.get_summary() == "`graphql`: 1 request(s), 1 point(s) used (query cost 1), 4999 remaining"
@@ -0,0 +1,129 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from cff_author_updater.http_cache import HttpCache
+from cff_author_updater.http_client import HttpClient
+
+
+class FakeConditionalSession:
+    """Serves one JSON body with an ETag and answers matching conditional requests with 304."""
+
+    def __init__(self, body: bytes, etag: str, link: str):
+        self.body = body
+        self.etag = etag
+        self.link = link
+        self.requests: list[tuple[str, dict]] = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append((url, headers))
+
+        response = requests.Response()
+        response.url = url
+        if headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+            response.encoding = "utf-8"
+            response.headers = CaseInsensitiveDict(
+                {"ETag": self.etag, "Link": self.link, "Content-Type": "application/json"}
+            )
+        return response
+
+
+def test_not_modified_response_is_served_from_disk(tmp_path):
+    next_url = "https://api.github.com/repos/o/r/issues/1/comments?page=2"
+    session = FakeConditionalSession(
+        body=b'[{"id": 1}]', etag='"abc"', link=f'<{next_url}>; rel="next"'
+    )
+    http_client = HttpClient(cache=HttpCache(cache_dir=tmp_path))
+    http_client.session = session  # type: ignore
+
+    url = "https://api.github.com/repos/o/r/issues/1/comments"
+    first = http_client.get(url, params={"per_page": 100}, headers={"Accept": "application/json"})
+    second = http_client.get(url, params={"per_page": 100}, headers={"Accept": "application/json"})
+
+    assert first.json() == second.json() == [{"id": 1}]
+    assert second.status_code == 200
+    assert second.links["next"]["url"] == next_url
+    assert "If-None-Match" not in session.requests[0][1]
+    assert session.requests[1][1]["If-None-Match"] == '"abc"'
+    assert session.requests[1][0] == url + "?per_page=100"
+    assert http_client.cache is not None and http_client.cache.hits == 1
+
+
+def test_cache_is_shared_between_clients_using_the_same_directory(tmp_path):
+    url = "https://api.github.com/users/someone"
+    session = FakeConditionalSession(body=b'{"login": "someone"}', etag='"v1"', link="")
+
+    first_run = HttpClient(cache=HttpCache(cache_dir=tmp_path))
+    first_run.session = session  # type: ignore
+    first_run.get(url)
+
+    second_run = HttpClient(cache=HttpCache(cache_dir=tmp_path))
+    second_run.session = session  # type: ignore
+    response = second_run.get(url)
+
+    assert response.json() == {"login": "someone"}
+    assert second_run.cache is not None and second_run.cache.hits == 1
+
+
+def test_cache_counters_are_safe_to_update_concurrently(tmp_path):
+    cache = HttpCache(cache_dir=tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for i in range(4000):
+            executor.submit(cache.record_hit if i % 2 else cache.record_miss)
+
+    assert (cache.hits, cache.misses) == (2000, 2000)
+
+
+def test_not_modified_response_carries_fresh_headers_and_validators(tmp_path):
+    url = "https://api.github.com/users/someone"
+    session = FakeConditionalSession(body=b'{"login": "someone"}', etag='"v1"', link="")
+    http_client = HttpClient(cache=HttpCache(cache_dir=tmp_path))
+    http_client.session = session  # type: ignore
+    http_client.get(url)
+
+    def request(method, url, headers=None, **kwargs):
+        session.requests.append((url, headers))
+        response = requests.Response()
+        response.url = url
+        response.status_code = 304
+        response._content = b""
+        response.headers = CaseInsensitiveDict(
+            {"ETag": '"v2"', "X-RateLimit-Remaining": "4999", "Content-Length": "0"}
+        )
+        return response
+
+    session.request = request  # type: ignore
+    first = http_client.get(url)
+    second = http_client.get(url)
+
+    assert first.json() == {"login": "someone"}
+    assert first.headers["X-RateLimit-Remaining"] == "4999"
+    assert first.headers["ETag"] == '"v2"'
+    assert "Content-Length" not in first.headers
+    # the next request revalidates with the refreshed ETag
+    assert session.requests[2][1]["If-None-Match"] == '"v2"'
+    assert second.json() == {"login": "someone"}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    session = FakeConditionalSession(body=b"{}", etag='"v1"', link="")
+    http_client = HttpClient(cache=HttpCache(cache_dir=tmp_path))
+    http_client.session = session  # type: ignore
+    for login in ["a", "b", "c"]:
+        http_client.get(f"https://api.github.com/users/{login}")
+    entry_paths = sorted(tmp_path.glob("*.json"), key=lambda entry_path: entry_path.stat().st_mtime)
+    for i, entry_path in enumerate(entry_paths):
+        os.utime(entry_path, (i, i))
+
+    HttpCache(cache_dir=tmp_path, max_entries=2)
+
+    assert sorted(tmp_path.glob("*.json")) == sorted(entry_paths[1:])
@@ -0,0 +1,23 @@
+from cff_author_updater.http_client import HttpClient
+
+
+def test_retries_are_limited_to_idempotent_methods():
+    http_client = HttpClient(max_retries=2, backoff_factor=0.1)
+    retry = http_client.session.get_adapter("https://api.github.com").max_retries
+
+    assert retry.total == 2
+    assert retry.backoff_factor == 0.1
+    assert "GET" in retry.allowed_methods
+    assert "POST" not in retry.allowed_methods
+    # rate limit rejections are waited out by the GitHub rate limiter instead
+    assert 429 not in retry.status_forcelist
+    assert 503 in retry.status_forcelist
+
+
+def test_one_adapter_is_shared_by_all_hosts():
+    http_client = HttpClient()
+
+    github_adapter = http_client.session.get_adapter("https://api.github.com/users/x")
+    orcid_adapter = http_client.session.get_adapter("https://pub.orcid.org/v3.0/x")
+
+    assert github_adapter is orcid_adapter
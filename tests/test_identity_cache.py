@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cff_author_updater.identity_cache import IdentityCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def create_identity_cache(tmp_path: Path, clock: FakeClock, **kwargs) -> IdentityCache:
+    return IdentityCache(cache_dir=tmp_path, ttl=100, negative_ttl=10, clock=clock.time, **kwargs)
+
+
+def test_get_returns_stored_identity_case_insensitively(tmp_path):
+    identity_cache = create_identity_cache(tmp_path, FakeClock())
+    identity = {"orcid": "https://orcid.org/0000-0002-1825-0097", "orcid_name": "Josiah Carberry"}
+
+    identity_cache.set(kind="github", key="OctoCat", value=identity)
+
+    assert identity_cache.get(kind="github", key="octocat") == identity
+    assert identity_cache.get(kind="email", key="octocat") is None
+    assert (identity_cache.hits, identity_cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_their_ttl(tmp_path):
+    clock = FakeClock()
+    identity_cache = create_identity_cache(tmp_path, clock)
+    identity_cache.set(kind="email", key="a@example.org", value={"orcid": "x"})
+    identity_cache.set(kind="email", key="b@example.org", value={"orcid": None}, is_negative=True)
+
+    clock.now += 50
+
+    assert identity_cache.get(kind="email", key="a@example.org") == {"orcid": "x"}
+    # the negative entry uses the shorter negative TTL
+    assert identity_cache.get(kind="email", key="b@example.org") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    clock = FakeClock()
+    identity_cache = create_identity_cache(tmp_path, clock, max_entries=2)
+    identity_cache.set(kind="github", key="a", value={})
+    clock.now += 1
+    identity_cache.set(kind="github", key="b", value={})
+    clock.now += 1
+    identity_cache.get(kind="github", key="a")
+    clock.now += 1
+
+    identity_cache.set(kind="github", key="c", value={})
+
+    assert len(identity_cache) == 2
+    assert identity_cache.get(kind="github", key="a") == {}
+    assert identity_cache.get(kind="github", key="b") is None
+
+
+def test_identities_persist_across_instances(tmp_path):
+    clock = FakeClock()
+    first_cache = create_identity_cache(tmp_path, clock)
+    first_cache.set(kind="github", key="octocat", value={"orcid": None}, is_negative=True)
+    first_cache.close()
+
+    second_cache = create_identity_cache(tmp_path, clock)
+
+    assert second_cache.get(kind="github", key="octocat") == {"orcid": None}
+
+
+def test_from_environment_is_disabled_without_directory(monkeypatch):
+    monkeypatch.delenv("IDENTITY_CACHE_DIR", raising=False)
+
+    assert IdentityCache.from_environment() is None
+
+
+def test_counters_are_safe_to_update_concurrently(tmp_path):
+    identity_cache = create_identity_cache(tmp_path, FakeClock())
+    identity_cache.set(kind="github", key="octocat", value={})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for i in range(2000):
+            executor.submit(identity_cache.get, kind="github", key="octocat" if i % 2 else "monalisa")
+
+    assert (identity_cache.hits, identity_cache.misses) == (1000, 1000)
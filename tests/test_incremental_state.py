@@ -0,0 +1,179 @@
+from datetime import datetime
+from typing import Callable, Iterator
+
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.contributions.github_pull_request_review_contribution import (
+    GitHubPullRequestReviewContribution,
+)
+from cff_author_updater.contributors.git_commit_contributor import GitCommitContributor
+from cff_author_updater.contributors.github_contributor import GitHubContributor
+from cff_author_updater.flags import Flags
+from cff_author_updater.incremental_state import (
+    INCREMENTAL_STATE_VERSION,
+    decode_incremental_state,
+    deserialize_contribution_manager,
+    encode_incremental_state,
+    serialize_contribution_manager,
+)
+from cff_author_updater.managers.contribution_manager import ContributionManager
+from cff_author_updater.managers.github_pull_request_manager import (
+    PR_COMMENT_MARKER,
+)
+
+ACTION_BOT = {"login": "github-actions[bot]"}
+
+
+def create_contribution_manager() -> ContributionManager:
+    github_contributor = GitHubContributor.from_dict(
+        {
+            "id": "https://github.com/octocat",
+            "github_username": "octocat",
+            "github_user_profile_url": "https://github.com/octocat",
+            "github_name": "The Octocat",
+            "github_bio": None,
+            "github_blog": "",
+            "github_email": None,
+            "github_is_organization": False,
+            "orcid": "https://orcid.org/0000-0002-1825-0097",
+            "orcid_name": "Josiah Carberry",
+            "is_valid_github_user": True,
+        }
+    )
+    git_commit_contributor = GitCommitContributor.from_dict(
+        {
+            "git_name": "Jane Doe",
+            "git_email": "jane@example.org",
+            "orcid": None,
+            "orcid_name": None,
+            "id": "Jane Doe <jane@example.org>",
+        }
+    )
+    contribution_manager = ContributionManager()
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="a" * 40, created_at=datetime(2024, 1, 1)),
+        github_contributor,
+    )
+    contribution_manager.add_contribution(
+        GitHubPullRequestCommitContribution(sha="b" * 40, created_at=datetime(2024, 1, 2)),
+        git_commit_contributor,
+    )
+    contribution_manager.add_contribution(
+        GitHubPullRequestReviewContribution(
+            id="https://github.com/o/r/pull/1#pullrequestreview-1",
+            created_at=datetime(2024, 1, 3),
+        ),
+        github_contributor,
+    )
+    return contribution_manager
+
+
+def test_contribution_manager_survives_a_round_trip_through_the_state():
+    contribution_manager = create_contribution_manager()
+    state = {
+        "version": INCREMENTAL_STATE_VERSION,
+        **serialize_contribution_manager(contribution_manager=contribution_manager),
+    }
+
+    encoded_state = encode_incremental_state(state=state)
+    assert encoded_state is not None
+    decoded_state = decode_incremental_state(comment_body=f"{PR_COMMENT_MARKER}{encoded_state}\n### Review")
+
+    assert decoded_state == state
+    restored = deserialize_contribution_manager(data=decoded_state)
+    assert restored.to_dict() == contribution_manager.to_dict()
+
+
+def test_decode_incremental_state_without_state():
+    assert decode_incremental_state(comment_body=PR_COMMENT_MARKER) is None
+    assert decode_incremental_state(comment_body="<!-- cff-author-updater-state:bm90IHpsaWI= -->") is None
+
+
+def serve_pages(pages: dict[str, list[dict]]) -> Callable[..., Iterator[list[dict]]]:
+    """
+    Serve each paginated resource as a single page.
+    """
+    return lambda url, params=None: iter([pages[url]])
+
+
+def test_load_incremental_state_drops_commits_that_left_the_pull_request(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "incremental_collection", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_commits", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_issue_comments", False)
+    previous_run = create_github_pull_request_manager(head_sha="c" * 40)
+    previous_state = previous_run.create_incremental_state(
+        contribution_manager=create_contribution_manager()
+    )
+    comments_url = "https://api.github.com/repos/o/r/issues/1/comments"
+    commits_url = "https://api.github.com/repos/o/r/pulls/1/commits"
+    github_pull_request_manager = create_github_pull_request_manager(
+        head_sha="d" * 40,
+        iter_github_paginated_pages=serve_pages(
+            pages={
+                comments_url: [
+                    {"user": ACTION_BOT, "body": f"{PR_COMMENT_MARKER}{previous_state}\n### CFF Author Updater ###"},
+                    {"body": "skip-authorship-by-name Jane Doe"},
+                ],
+                # the commit `bbbb...` was force-pushed away
+                commits_url: [{"sha": "a" * 40}, {"sha": "d" * 40}],
+            }
+        ),
+    )
+
+    contribution_manager = github_pull_request_manager.load_incremental_state()
+
+    assert contribution_manager is not None
+    assert [contributor.id for contributor in contribution_manager.contributors] == [
+        "https://github.com/octocat"
+    ]
+    assert github_pull_request_manager.known_contribution_ids == {
+        "a" * 40,
+        "https://github.com/o/r/pull/1#pullrequestreview-1",
+    }
+
+
+def test_load_incremental_state_ignores_state_collected_with_other_settings(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "incremental_collection", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_issue_comments", False)
+    previous_run = create_github_pull_request_manager(head_sha="c" * 40)
+    previous_state = previous_run.create_incremental_state(
+        contribution_manager=create_contribution_manager()
+    )
+    github_pull_request_manager = create_github_pull_request_manager(
+        head_sha="c" * 40,
+        iter_github_paginated_pages=serve_pages(
+            pages={
+                "https://api.github.com/repos/o/r/issues/1/comments": [
+                    {"user": ACTION_BOT, "body": f"{PR_COMMENT_MARKER}{previous_state}"}
+                ],
+            }
+        ),
+    )
+    github_pull_request_manager.bot_blacklist = {"github-actions[bot]", "dependabot[bot]"}
+
+    assert github_pull_request_manager.load_incremental_state() is None
+    assert github_pull_request_manager.known_contribution_ids == set()
+
+
+def test_load_incremental_state_ignores_state_forged_by_another_user(create_github_pull_request_manager, monkeypatch):
+    monkeypatch.setitem(Flags.flags, "incremental_collection", True)
+    monkeypatch.setitem(Flags.flags, "authorship_for_pr_issue_comments", False)
+    previous_run = create_github_pull_request_manager(head_sha="c" * 40)
+    forged_state = previous_run.create_incremental_state(
+        contribution_manager=create_contribution_manager()
+    )
+    github_pull_request_manager = create_github_pull_request_manager(
+        head_sha="c" * 40,
+        iter_github_paginated_pages=serve_pages(
+            pages={
+                "https://api.github.com/repos/o/r/issues/1/comments": [
+                    {"user": {"login": "mallory"}, "body": f"{PR_COMMENT_MARKER}{forged_state}"}
+                ],
+            }
+        ),
+    )
+
+    assert github_pull_request_manager.find_previous_pull_request_comment() is None
+    assert github_pull_request_manager.load_incremental_state() is None
+    assert github_pull_request_manager.known_contribution_ids == set()
@@ -0,0 +1,68 @@
+import time
+from datetime import datetime
+
+from cff_author_updater.contributions.github_pull_request_comment_contribution import (
+    GitHubPullRequestCommentContribution,
+)
+from cff_author_updater.contributors.cff_author_contributor import CffAuthorContributor
+from cff_author_updater.flags import Flags
+from cff_author_updater.main import collect_contributions
+from cff_author_updater.managers.contribution_manager import ContributionManager
+
+
+class FakeGitHubPullRequestManager:
+    """Stands in for GitHubPullRequestManager; each collector sleeps to simulate latency."""
+
+    def __init__(self):
+        self.collection_backend = "rest"
+        self.contributors = [
+            CffAuthorContributor(cff_author_data={"name": f"Author {i}"})
+            for i in range(3)
+        ]
+        self.contributions = [
+            GitHubPullRequestCommentContribution(
+                id=f"https://github.com/o/r/pull/1#c{i}",
+                created_at=datetime(2024, 1, 10 - i),
+            )
+            for i in range(10)
+        ]
+
+    def _collect(self, offset: int, delay: float) -> ContributionManager:
+        time.sleep(delay)
+        contribution_manager = ContributionManager()
+        for i in range(offset, offset + 4):
+            contribution_manager.add_contribution(
+                self.contributions[i % len(self.contributions)],
+                self.contributors[i % len(self.contributors)],
+            )
+        return contribution_manager
+
+    def collect_contributors_for_pr_commits(self):
+        return self._collect(offset=0, delay=0.05)
+
+    def collect_contributors_for_pr_reviews(self):
+        return self._collect(offset=2, delay=0.04)
+
+    def collect_contributors_for_pr_issues(self):
+        return self._collect(offset=4, delay=0.03)
+
+    def collect_contributors_for_pr_issue_comments(self):
+        return self._collect(offset=6, delay=0.02)
+
+    def collect_contributors_for_pr_comments(self):
+        return self._collect(offset=8, delay=0.01)
+
+
+def _collect_with_concurrency(is_concurrent: bool, monkeypatch) -> ContributionManager:
+    monkeypatch.setitem(Flags.flags, "concurrent_collection", is_concurrent)
+    return collect_contributions(
+        github_pull_request_manager=FakeGitHubPullRequestManager()  # type: ignore
+    )
+
+
+def test_concurrent_collection_matches_sequential_collection(monkeypatch):
+    sequential = _collect_with_concurrency(is_concurrent=False, monkeypatch=monkeypatch)
+    concurrent = _collect_with_concurrency(is_concurrent=True, monkeypatch=monkeypatch)
+
+    assert concurrent.to_dict() == sequential.to_dict()
+    assert concurrent.contributors == sequential.contributors
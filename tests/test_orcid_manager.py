@@ -1,4 +1,38 @@
-from cff_author_updater.managers.orcid_manager import OrcidManager
+import io
+
+import requests
+
+from cff_author_updater.managers.orcid_manager import SCRAPE_CHUNK_SIZE, OrcidManager
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class FakeStreamingHttpClient:
+    def __init__(self, page: bytes):
+        self.raw = CountingBytesIO(page)
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.raw = self.raw
+        return response
+
+
+def create_github_profile_page(vcard_details: str, padding_size: int) -> bytes:
+    padding = "<div>" + "x" * padding_size + "</div>"
+    return (
+        f"<html><body>{padding}<ul class=\"vcard-details\">{vcard_details}</ul>{padding * 20}</body></html>"
+    ).encode("utf-8")
 
 
 def test_search_orcid_with_valid_name_and_email_for_public_name_and_private_email():
@@ -164,3 +198,31 @@ def test_extract_orcid_from_text_with_invalid_orcid_id():
 
     expected_orcid = None
     assert orcid == expected_orcid, f"Expected {expected_orcid} but got {orcid}"
+
+
+def test_scrape_orcid_from_github_profile_stops_reading_after_vcard_details():
+    page = create_github_profile_page(
+        vcard_details='<li><a href="https://orcid.org/0000-0002-1825-0097">ORCID</a></li>',
+        padding_size=SCRAPE_CHUNK_SIZE,
+    )
+    http_client = FakeStreamingHttpClient(page=page)
+    orcid_manager = OrcidManager(http_client=http_client)  # type: ignore
+
+    orcid = orcid_manager.scrape_orcid_from_github_profile(github_username="octocat")
+
+    assert orcid == "https://orcid.org/0000-0002-1825-0097"
+    assert http_client.raw.bytes_read < len(page)
+
+
+def test_scrape_orcid_from_github_profile_without_vcard_details():
+    http_client = FakeStreamingHttpClient(page=b"<html><body><ul class='other'></ul></body></html>")
+    orcid_manager = OrcidManager(http_client=http_client)  # type: ignore
+
+    assert orcid_manager.scrape_orcid_from_github_profile(github_username="octocat") is None
+
+
+def test_get_orcid_from_social_accounts():
+    social_accounts = ["https://example.org", "https://orcid.org/0000-0002-1825-009X"]
+
+    assert OrcidManager.get_orcid_from_social_accounts(social_accounts) == "https://orcid.org/0000-0002-1825-009X"
+    assert OrcidManager.get_orcid_from_social_accounts(["https://example.org"]) is None
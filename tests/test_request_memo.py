@@ -0,0 +1,64 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cff_author_updater.request_memo import RequestMemo
+
+
+def test_get_fetches_each_key_once():
+    request_memo = RequestMemo()
+    calls: list[str] = []
+
+    def fetch():
+        calls.append("fetch")
+        return [1, 2, 3]
+
+    assert request_memo.get(key=("GET", "a"), fetch=fetch) == [1, 2, 3]
+    assert request_memo.get(key=("GET", "a"), fetch=fetch) == [1, 2, 3]
+
+    assert calls == ["fetch"]
+    assert (request_memo.hits, request_memo.misses) == (1, 1)
+
+
+def test_concurrent_callers_share_one_fetch():
+    request_memo = RequestMemo()
+    calls: list[str] = []
+    calls_lock = threading.Lock()
+
+    def fetch():
+        with calls_lock:
+            calls.append("fetch")
+        time.sleep(0.05)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: request_memo.get(key="k", fetch=fetch), range(4))
+        )
+
+    assert results == ["result"] * 4
+    assert calls == ["fetch"]
+    assert (request_memo.hits, request_memo.misses) == (3, 1)
+
+
+def test_failed_fetch_is_not_memoized():
+    request_memo = RequestMemo()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        request_memo.get(key="k", fetch=fail)
+
+    assert request_memo.get(key="k", fetch=lambda: "ok") == "ok"
+
+
+def test_clear_invalidates_memoized_results():
+    request_memo = RequestMemo()
+    request_memo.get(key="k", fetch=lambda: "old")
+
+    request_memo.clear()
+
+    assert request_memo.get(key="k", fetch=lambda: "new") == "new"
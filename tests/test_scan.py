@@ -0,0 +1,89 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from cff_author_updater.contributions.github_pull_request_commit_contribution import (
+    GitHubPullRequestCommitContribution,
+)
+from cff_author_updater.managers.columnar_contribution_manager import (
+    ColumnarContributionManager,
+)
+from cff_author_updater.scan import (
+    create_identity_table,
+    list_organization_repos,
+    process_repository_cff,
+)
+
+CFF = b"""cff-version: 1.2.0
+title: Example
+message: Please cite this software.
+authors:
+  - given-names: Jane
+    family-names: Doe
+"""
+
+
+class FakeGitHubManager:
+    def __init__(self, repos: list[dict]):
+        self.repos = repos
+
+    def iter_github_paginated(self, url: str, params: dict | None = None):
+        yield from self.repos
+
+
+def test_list_organization_repos_skips_archived_repos():
+    github_manager = FakeGitHubManager(
+        repos=[
+            {"full_name": "o/a", "archived": False},
+            {"full_name": "o/b", "archived": True},
+            {"full_name": "o/c"},
+        ]
+    )
+
+    assert list_organization_repos(github_manager=github_manager, org="o") == ["o/a", "o/c"]  # type: ignore
+
+
+def test_create_identity_table_lists_each_contributor_once(create_contributor):
+    jane, max_ = create_contributor("Jane Doe"), create_contributor("Max Mustermann")
+    contribution_managers: dict[str, ColumnarContributionManager] = {}
+    for repo, contributors in [("o/a", [jane]), ("o/b", [max_, jane])]:
+        contribution_manager = ColumnarContributionManager()
+        for i, contributor in enumerate(contributors):
+            contribution_manager.add_contribution(
+                GitHubPullRequestCommitContribution(sha=f"{repo}{i}", created_at=datetime(2024, 1, 1 + i)),
+                contributor,
+            )
+        contribution_managers[repo] = contribution_manager
+
+    identity_table = create_identity_table(contribution_managers=contribution_managers)
+
+    assert [(identity["contributor"]["git_name"], identity["repos"]) for identity in identity_table] == [
+        ("Jane Doe", ["o/a", "o/b"]),
+        ("Max Mustermann", ["o/b"]),
+    ]
+
+
+def test_process_repository_cff_in_worker_process_writes_cff_and_report(tmp_path):
+    repo_output_dir = tmp_path / "repos" / "o" / "a"
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        summary = executor.submit(
+            process_repository_cff,
+            report={"repo": "o/a", "pull_requests": [1], "contributors": []},
+            cff_content=CFF,
+            cff_file_name="CITATION.cff",
+            cff_authors_data=[
+                {"given-names": "Jane", "family-names": "Doe"},
+                {"given-names": "Max", "family-names": "Mustermann"},
+            ],
+            repo_output_dir=repo_output_dir,
+        ).result()
+
+    assert summary == {"repo": "o/a", "has_cff": True, "is_valid_cff": True, "new_author_count": 1}
+    assert (repo_output_dir / "CITATION.cff").read_bytes() == CFF + (
+        b"  - given-names: Max\n"
+        b"    family-names: Mustermann\n"
+    )
+    report = json.loads((repo_output_dir / "report.json").read_text())
+    assert report["new_authors"] == [{"given-names": "Max", "family-names": "Mustermann"}]
+    assert report["cff_validation_errors"] == []